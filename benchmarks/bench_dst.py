@@ -0,0 +1,73 @@
+"""Benchmark for the DST transition lookups.
+
+Run with `uv run python benchmarks/bench_dst.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from time_helper import next_dst_transition, previous_dst_transition
+from time_helper.dst import _year_transitions
+
+ZONES = [
+    "Europe/Berlin",
+    "Europe/London",
+    "Europe/Paris",
+    "Europe/Helsinki",
+    "America/New_York",
+    "America/Chicago",
+    "America/Denver",
+    "America/Los_Angeles",
+    "America/Sao_Paulo",
+    "America/Santiago",
+    "Australia/Sydney",
+    "Australia/Adelaide",
+    "Pacific/Auckland",
+    "Asia/Tokyo",
+    "Asia/Kolkata",
+    "Africa/Cairo",
+]
+
+
+def _sample(n: int, seed: int = 42) -> list[datetime]:
+    """Generates random aware datetimes across zones and the years 2020-2030."""
+    rng = random.Random(seed)
+    base = datetime(2020, 1, 1)
+    return [
+        (base + timedelta(seconds=rng.randrange(11 * 365 * 86400))).replace(tzinfo=ZoneInfo(rng.choice(ZONES)))
+        for _ in range(n)
+    ]
+
+
+def main(n: int = 10_000) -> None:
+    """Times `n` calls of the next/previous transition lookups (cold and warm cache)."""
+    values = _sample(n)
+
+    _year_transitions.cache_clear()
+    start = time.perf_counter()
+    for dt in values:
+        next_dst_transition(dt)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for dt in values:
+        next_dst_transition(dt)
+    warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for dt in values:
+        previous_dst_transition(dt)
+    prev = time.perf_counter() - start
+
+    print(f"next_dst_transition     x{n} (cold cache): {cold:.3f}s")
+    print(f"next_dst_transition     x{n} (warm cache): {warm:.3f}s")
+    print(f"previous_dst_transition x{n}:              {prev:.3f}s")
+    print(f"cache: {_year_transitions.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
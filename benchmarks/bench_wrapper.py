@@ -0,0 +1,72 @@
+"""Benchmark for the memory footprint of DateTimeWrapper instances.
+
+Run with `uv run python benchmarks/bench_wrapper.py`.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from time_helper import DateTimeWrapper
+
+
+class _DictWrapper:
+    """Wrapper with an instance dict (the layout before the slotted DateTimeWrapper)."""
+
+    def __init__(self, dt: datetime) -> None:
+        self.dt = dt
+
+
+def _measure(name: str, factory: Callable[[int], Any], n: int) -> None:
+    """Creates `n` instances and prints the per instance size, the traced memory and the time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    instances = [factory(i) for i in range(n)]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sample = instances[0]
+    size = sys.getsizeof(sample) + (sys.getsizeof(sample.__dict__) if hasattr(sample, "__dict__") else 0)
+    print(f"{name:<28} getsizeof: {size:>4} B  traced: {current / n:>6.1f} B/instance  {elapsed:.3f}s")
+
+
+def main(n: int = 1_000_000) -> None:
+    """Compares the memory of `n` wrapped values (including the wrapped datetime or epoch)."""
+    tz = ZoneInfo("Europe/Berlin")
+    base = datetime(2024, 1, 1, tzinfo=tz)
+    epoch = int(base.timestamp())
+
+    _measure("dict wrapper", lambda i: _DictWrapper(base + timedelta(seconds=i)), n)
+    _measure("DateTimeWrapper", lambda i: DateTimeWrapper(base + timedelta(seconds=i)), n)
+    _measure("DateTimeWrapper.from_epoch", lambda i: DateTimeWrapper.from_epoch(epoch + i, tz), n)
+    _sort(n // 5)
+
+
+def _sort(n: int, seed: int = 42) -> None:
+    """Times sorting `n` shuffled datetimes against wrappers (by comparison and by sort key)."""
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1, tzinfo=ZoneInfo("Europe/Berlin"))
+    values = [base + timedelta(seconds=rng.randrange(365 * 86400)) for _ in range(n)]
+    wrappers = [DateTimeWrapper(value) for value in values]
+
+    for name, items, key in (
+        ("datetime", values, None),
+        ("DateTimeWrapper", wrappers, None),
+        ("DateTimeWrapper (sort_key)", wrappers, attrgetter("sort_key")),
+    ):
+        start = time.perf_counter()
+        sorted(items, key=key)
+        print(f"sort {name:<28} x{n}: {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
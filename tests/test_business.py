@@ -0,0 +1,105 @@
+"""Tests for the business day calendar."""
+
+from datetime import date, datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from time_helper import (
+    BusinessCalendar,
+    add_business_days,
+    business_days_between,
+    parse_natural,
+    roll_backward,
+    roll_forward,
+)
+
+HOLIDAYS = ["2024-12-25", "2024-12-26", "2025-01-01"]
+
+
+def test_scalar_offsets() -> None:
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+
+    assert calendar.add_business_days(date(2024, 12, 24), 1) == date(2024, 12, 27)
+    assert calendar.add_business_days(date(2024, 12, 27), -1) == date(2024, 12, 24)
+    assert calendar.add_business_days(date(2024, 12, 28), 0) == date(2024, 12, 30)
+    assert calendar.roll_forward(date(2024, 12, 25)) == date(2024, 12, 27)
+    assert calendar.roll_backward(date(2024, 12, 29)) == date(2024, 12, 27)
+    assert calendar.is_business_day("2024-12-27")
+    assert not calendar.is_business_day(date(2025, 1, 1))
+
+    # the time and timezone of datetimes are kept
+    dt = datetime(2024, 12, 28, 10, 30, tzinfo=ZoneInfo("Europe/Berlin"))
+    assert calendar.add_business_days(dt, 2) == datetime(2024, 12, 31, 10, 30, tzinfo=ZoneInfo("Europe/Berlin"))
+
+    # counts in [start, end)
+    assert calendar.business_days_between(date(2024, 12, 23), date(2025, 1, 6)) == 7
+    assert calendar.business_days_between(date(2025, 1, 6), date(2024, 12, 23)) == -7
+
+    # module functions default to monday to friday
+    assert add_business_days(date(2024, 12, 24), 1) == date(2024, 12, 25)
+    assert business_days_between(date(2024, 12, 23), date(2024, 12, 30)) == 5
+    assert roll_forward(date(2024, 12, 28)) == date(2024, 12, 30)
+    assert roll_backward(date(2024, 12, 28)) == date(2024, 12, 27)
+
+    # dates outside of the tables walk the days (with the weekmask and holidays)
+    calendar = BusinessCalendar(holidays=["1850-01-02", "2300-01-02"])
+    assert calendar.add_business_days(date(1850, 1, 1), 1) == date(1850, 1, 3)
+    assert calendar.add_business_days(date(1850, 1, 3), -1) == date(1850, 1, 1)
+    assert not calendar.is_business_day(date(1850, 1, 2))
+    assert calendar.is_business_day("2300-01-03")
+    assert calendar.roll_forward(date(2300, 1, 1)) == date(2300, 1, 1)
+    assert calendar.roll_backward(date(2299, 12, 31)) == date(2299, 12, 29)
+    assert calendar.add_business_days(date(2199, 12, 30), 5) == date(2200, 1, 6)
+    assert calendar.add_business_days(date(1900, 1, 2), -3) == date(1899, 12, 28)
+    assert calendar.business_days_between(date(1849, 12, 1), date(1850, 3, 1)) == 63
+    assert calendar.business_days_between(date(2300, 1, 1), date(2300, 1, 9)) == 5
+    assert calendar.business_days_between(date(1950, 6, 3), date(1850, 1, 1)) == -26198
+
+
+def test_vectorized_offsets() -> None:
+    calendar = BusinessCalendar("Sun Mon Tue Wed Thu", HOLIDAYS)
+    days = np.arange("2020-01-01", "2026-01-01", dtype="datetime64[D]")
+
+    # matches numpy (n > 0 counts from the date, n <= 0 rolls first)
+    for n in [-3, -1, 0, 1, 5]:
+        roll = "backward" if n > 0 else "forward"
+        expected = np.busday_offset(days, n, roll=roll, weekmask="1111001", holidays=HOLIDAYS)
+        assert (calendar.add_business_days(days, n) == expected).all()
+    expected = np.busday_offset(days, 0, roll="backward", weekmask="1111001", holidays=HOLIDAYS)
+    assert (calendar.roll_backward(days) == expected).all()
+    counts = calendar.business_days_between(days[:-30], days[30:])
+    assert (counts == np.busday_count(days[:-30], days[30:], weekmask="1111001", holidays=HOLIDAYS)).all()
+    assert calendar.is_business_day(days).sum() == np.is_busday(days, weekmask="1111001", holidays=HOLIDAYS).sum()
+
+    # times of day and missing values are kept
+    values = np.array(["2024-12-25T10:00", "NaT"], dtype="datetime64[m]")
+    result = calendar.roll_backward(values)
+    assert str(result[0]) == "2024-12-24T10:00"
+    assert np.isnat(result[1])
+    assert calendar.add_business_days([date(2024, 12, 24)], np.array([2])).tolist() == [date(2024, 12, 30)]
+
+
+def test_from_file(tmp_path: Path) -> None:
+    path = tmp_path / "holidays.csv"
+    path.write_text("# public holidays\n2024-12-25,Christmas Day\n\n2024-12-26, Boxing Day  # second day\n")
+    calendar = BusinessCalendar.from_file(path, weekmask="1111100")
+    assert calendar.holidays == {date(2024, 12, 25), date(2024, 12, 26)}
+    assert repr(calendar) == "BusinessCalendar(weekmask='1111100', holidays=2)"
+
+    with pytest.raises(ValueError, match="Invalid weekmask"):
+        BusinessCalendar("Mon Funday")
+    with pytest.raises(ValueError, match="at least one business day"):
+        BusinessCalendar("0000000")
+
+
+def test_parse_natural_business_days() -> None:
+    reference = datetime(2024, 12, 24, 9, 0)
+    calendar = BusinessCalendar(holidays=HOLIDAYS)
+    assert parse_natural("next business day", reference) == datetime(2024, 12, 25, 9, 0)
+    assert parse_natural("next business day", reference, calendar) == datetime(2024, 12, 27, 9, 0)
+    assert parse_natural("last business day", datetime(2024, 12, 27), calendar) == datetime(2024, 12, 24)
+    assert parse_natural("next business day", datetime(1850, 1, 1)) == datetime(1850, 1, 2)
+    assert parse_natural("last business day", datetime(2300, 1, 1)) == datetime(2299, 12, 29)
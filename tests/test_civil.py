@@ -0,0 +1,101 @@
+"""Tests for the calendar lookup tables and civil date arithmetic."""
+
+import calendar
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_helper import civil_fields, compose_epochs
+from time_helper.civil import (
+    FIRST_YEAR,
+    LAST_YEAR,
+    calendar_arrays,
+    civil_from_days,
+    day_of_year,
+    days_from_civil,
+    days_in_month,
+    iso_week_start,
+    month_start,
+    year_start,
+)
+
+EPOCH = date(1970, 1, 1).toordinal()
+
+
+@pytest.mark.parametrize("year", [FIRST_YEAR - 1, FIRST_YEAR, 1970, 2000, 2024, 2100, LAST_YEAR, LAST_YEAR + 1, 9999])
+def test_tables_match_calendar(year: int) -> None:
+    assert year_start(year) == date(year, 1, 1).toordinal() - EPOCH
+    assert iso_week_start(year) == date.fromisocalendar(year, 1, 1).toordinal() - EPOCH
+    for month in range(1, 13):
+        assert days_in_month(year, month) == calendar.monthrange(year, month)[1]
+        assert month_start(year, month) == date(year, month, 1).toordinal() - EPOCH
+    assert day_of_year(year, 12, 31) == (366 if calendar.isleap(year) else 365)
+    assert day_of_year(year, 3, 1) == date(year, 3, 1).timetuple().tm_yday
+
+
+def test_calendar_arrays() -> None:
+    month_days, month_starts, year_starts, iso_week_starts = calendar_arrays()
+    years = LAST_YEAR - FIRST_YEAR + 1
+
+    assert len(month_days) == years * 12
+    assert len(month_starts) == years * 12 + 1
+    assert len(year_starts) == len(iso_week_starts) == years + 1
+    assert (month_starts[1:] - month_starts[:-1] == month_days).all()
+    assert year_starts[70] == 0
+    assert not month_starts.flags.writeable
+
+
+def test_invalid_month() -> None:
+    with pytest.raises(ValueError, match="Invalid month"):
+        days_in_month(2024, 13)
+    with pytest.raises(ValueError, match="Invalid month"):
+        month_start(2024, 0)
+
+
+def test_civil_from_days() -> None:
+    days = np.arange(-800_000, 3_000_000, 7, dtype=np.int64)
+    year, month, day = civil_from_days(days)
+    assert (days_from_civil(year, month, day) == days).all()
+
+    # scalars and the boundaries of the supported date range
+    for value in [date(1, 1, 1), date(1969, 12, 31), date(2000, 2, 29), date(2100, 3, 1), date(9999, 12, 31)]:
+        days_since_epoch = value.toordinal() - EPOCH
+        assert civil_from_days(days_since_epoch) == (value.year, value.month, value.day)
+        assert days_from_civil(value.year, value.month, value.day) == days_since_epoch
+
+
+def test_civil_fields() -> None:
+    tz = ZoneInfo("Europe/Berlin")
+    epochs = np.arange(-100_000_000, 2_000_000_000, 7_654_321, dtype=np.int64)
+    fields = civil_fields(epochs, "Europe/Berlin")
+    for i, ts in enumerate(epochs.tolist()):
+        dt = datetime.fromtimestamp(ts, tz)
+        assert (fields.year[i], fields.month[i], fields.day[i]) == (dt.year, dt.month, dt.day)
+        assert (fields.hour[i], fields.minute[i], fields.second[i]) == (dt.hour, dt.minute, dt.second)
+        assert fields.weekday[i] == dt.weekday()
+        assert fields.day_of_year[i] == dt.timetuple().tm_yday
+
+    # UTC by default, timezone of aware series and missing values
+    values = np.array(["2024-03-15T23:30:00.5", "NaT"], dtype="datetime64[ms]")
+    assert civil_fields(values).day.tolist() == [15, -1]
+    series = pd.Series(pd.to_datetime(["2024-03-15 23:30"]).tz_localize("UTC").tz_convert("Asia/Tokyo"))
+    assert civil_fields(series).day.tolist() == [16]
+
+
+def test_compose_epochs() -> None:
+    epochs = np.arange(0, 2_000_000_000, 9_876_543, dtype=np.int64)
+    fields = civil_fields(epochs, "America/New_York")
+    composed = compose_epochs(*fields[:6], timezone="America/New_York", ambiguous="earliest")
+    mismatch = composed != epochs
+    # only the repeated hour of a fall back can map to the other instant
+    assert ((epochs[mismatch] - composed[mismatch]) == 3600).all()
+
+    assert compose_epochs(2024, 2, 29, 12).tolist() == [1709208000]
+    # 02:30 does not exist on the day of the spring forward in Berlin (03:00 CEST is 01:00 UTC)
+    shifted = compose_epochs([2024], [3], [31], [2], [30], 0, "Europe/Berlin", "ms", nonexistent="shift_forward")
+    assert shifted.tolist() == [1711846800000]
+    with pytest.raises(ValueError, match="Invalid epoch unit"):
+        compose_epochs(2024, unit="days")
@@ -3,6 +3,7 @@
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,6 +14,7 @@ from time_helper import (
     make_aware,
     make_unaware,
     parse_time,
+    to_epoch_array,
     unix_to_datetime,
 )
 
@@ -222,3 +224,52 @@ def test_unaware() -> None:
 
     dt = make_unaware("")
     assert dt is None
+
+
+def test_to_epoch_array() -> None:
+    # integer epochs are kept as they are
+    epochs = to_epoch_array([0, 86400])
+    assert epochs.dtype == np.int64
+    assert epochs.tolist() == [0, 86400]
+
+    # datetime64 values are rescaled to the requested unit (flooring)
+    values = np.array(["1970-01-02T00:00:00.5", "1969-12-31T23:59:59.5", "NaT"], dtype="datetime64[ms]")
+    assert to_epoch_array(values).tolist() == [86400, -1, -(2**63)]
+    assert to_epoch_array(values, unit="us").tolist() == [86400_500_000, -500_000, -(2**63)]
+    assert to_epoch_array(np.array(["2024-01-01"], dtype="datetime64[D]"), unit="ms").tolist() == [1704067200000]
+
+    # aware series are converted to UTC
+    series = pd.Series(pd.to_datetime(["2024-01-01 01:00"]).tz_localize("Europe/Berlin"))
+    assert to_epoch_array(series).tolist() == [1704067200]
+
+    # floats are floored and NaN is missing
+    assert to_epoch_array(np.array([1.5, np.nan])).tolist() == [1, -(2**63)]
+
+    with pytest.raises(ValueError, match="Invalid epoch unit"):
+        to_epoch_array([0], unit="days")
+    with pytest.raises(ValueError, match="Unable to convert values"):
+        to_epoch_array(["abc"])
+
+
+def test_make_aware_pandas_policies() -> None:
+    from unittest.mock import patch
+
+    from pytz import NonExistentTimeError
+
+    from time_helper.convert import make_aware_pandas
+
+    df = pd.DataFrame({"time": pd.to_datetime(["2024-10-27 02:30", "2024-03-31 02:30", "2024-06-01 12:00"])})
+    with patch("time_helper.convert.current_timezone", return_value=ZoneInfo("Europe/Berlin")):
+        result = make_aware_pandas(df.copy(), "time", ambiguous="latest", nonexistent="shift_forward")
+        assert result["time"].tolist() == [
+            pd.Timestamp("2024-10-27 02:30:00+0100", tz="Europe/Berlin"),
+            pd.Timestamp("2024-03-31 03:00:00+0200", tz="Europe/Berlin"),
+            pd.Timestamp("2024-06-01 12:00:00+0200", tz="Europe/Berlin"),
+        ]
+
+        result = make_aware_pandas(df.copy(), "time", tz="UTC", ambiguous="earliest", nonexistent="NaT")
+        assert result["time"].iloc[0] == pd.Timestamp("2024-10-27 00:30:00", tz="UTC")
+        assert pd.isna(result["time"].iloc[1])
+
+        with pytest.raises(NonExistentTimeError):
+            make_aware_pandas(df.copy(), "time", ambiguous="earliest")
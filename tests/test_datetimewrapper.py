@@ -53,6 +53,30 @@ class TestDateTimeWrapperCreation:
         dtw2 = DateTimeWrapper(dtw1)
         assert dtw2.dt == dtw1.dt
 
+    def test_slotted_layout(self) -> None:
+        """Test that wrappers carry no instance dict and keep the dt attribute."""
+        dtw = DateTimeWrapper("2024-03-15 10:30:00")
+        assert not hasattr(dtw, "__dict__")
+        with pytest.raises(AttributeError):
+            dtw.other = 1  # type: ignore[attr-defined]
+
+        dtw.dt = datetime(2024, 1, 1)
+        assert dtw.year == 2024
+        assert dtw.month == 1
+
+    def test_create_from_epoch(self) -> None:
+        """Test lazy wrappers created from epochs."""
+        dtw = DateTimeWrapper.from_epoch(1711846800, "Europe/Berlin")
+        assert dtw.dt == make_aware("2024-03-31 03:00:00", "Europe/Berlin")
+        assert dtw.hour == 3
+        assert str(dtw.timezone) == "Europe/Berlin"
+
+        # naive UTC without timezone, other units
+        assert DateTimeWrapper.from_epoch(1711846800123, unit="ms").dt == datetime(2024, 3, 31, 1, 0, 0, 123000)
+        assert DateTimeWrapper.from_epoch(0) + timedelta(days=1) == datetime(1970, 1, 2)
+        with pytest.raises(ValueError, match="Invalid epoch unit"):
+            DateTimeWrapper.from_epoch(0, unit="m")
+
 
 class TestDateTimeWrapperCall:
     """Test DateTimeWrapper callable interface."""
@@ -150,6 +174,31 @@ class TestDateTimeWrapperOperators:
         assert dtw1 == dtw3
         assert dtw1 != dtw2
 
+    def test_hash_and_sort(self) -> None:
+        """Test that wrappers are hashable, sortable and compare as instants."""
+        berlin = make_aware("2024-03-15 10:30:00", "Europe/Berlin")
+        utc = make_aware("2024-03-15 09:30:00", "UTC")
+        dtw1, dtw2 = DateTimeWrapper(berlin), DateTimeWrapper(utc)
+        assert dtw1 == dtw2
+        assert hash(dtw1) == hash(dtw2) == hash(berlin)
+        assert len({dtw1, dtw2, DateTimeWrapper.from_epoch(int(utc.timestamp()), "UTC")}) == 1
+        assert {dtw1: "value"}[dtw2] == "value"
+        assert dtw1.sort_key == int(utc.timestamp()) * 1_000_000
+
+        # sorting and heaps of wrappers, fast comparisons with datetimes
+        wrappers = [DateTimeWrapper(f"2024-03-{day:02d}") for day in (15, 3, 9)]
+        assert [dtw.day for dtw in sorted(wrappers)] == [3, 9, 15]
+        assert min(wrappers).day == 3
+        assert wrappers[1] <= datetime(2024, 3, 3)
+        assert wrappers[1] >= datetime(2024, 3, 3)
+        assert wrappers[0] > datetime(2024, 3, 3)
+
+        # naive and aware values are never equal and cannot be ordered
+        assert DateTimeWrapper("2024-03-15 09:30:00") != dtw2
+        with pytest.raises(TypeError):
+            _ = DateTimeWrapper("2024-03-15 09:30:00") < dtw2
+        assert hash(DateTimeWrapper(None)) == hash(DateTimeWrapper(None))
+
 
 class TestDateTimeWrapperMethods:
     """Test DateTimeWrapper methods for datetime operations."""
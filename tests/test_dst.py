@@ -1,20 +1,29 @@
 """Additional tests for DST module to improve coverage."""
 
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from time_helper import (
     DateTimeWrapper,
+    classify_local_times,
+    dst_calendar,
     get_dst_transitions,
     is_dst_active,
+    is_dst_active_many,
+    iter_dst_transitions,
     localize_datetime,
+    localize_many,
     make_aware,
     next_dst_transition,
     parse_time,
+    previous_dst_transition,
     round_time,
     time_diff,
+    utcoffset_many,
 )
 
 
@@ -480,3 +489,364 @@ class TestDSTCoverage:
         # Transitions should be same type
         assert transitions_leap[0]["type"] == transitions_normal[0]["type"]
         assert transitions_leap[1]["type"] == transitions_normal[1]["type"]
+
+
+class TestDSTTransitionCache:
+    """Test the memoized transition lookups."""
+
+    def test_get_dst_transitions_is_cached(self) -> None:
+        """Test that repeated lookups are served from the cache."""
+        from time_helper.dst import _year_transitions
+
+        _year_transitions.cache_clear()
+        first = get_dst_transitions("Europe/Berlin", 2024)
+        second = get_dst_transitions("Europe/Berlin", 2024)
+
+        assert first == second
+        assert _year_transitions.cache_info().hits == 1
+
+    def test_cached_transitions_are_copies(self) -> None:
+        """Test that modifying the result does not alter the cache."""
+        transitions = get_dst_transitions("Europe/Berlin", 2024)
+        transitions[0]["type"] = "modified"
+        transitions.clear()
+
+        fresh = get_dst_transitions("Europe/Berlin", 2024)
+        assert len(fresh) == 2
+        assert fresh[0]["type"] == "spring_forward"
+
+    def test_next_dst_transition_matches_transitions(self) -> None:
+        """Test that the binary search returns the transitions of the year."""
+        tz = ZoneInfo("America/New_York")
+        spring, fall = get_dst_transitions(tz, 2024)
+
+        assert next_dst_transition(datetime(2024, 1, 1, tzinfo=tz)) == spring
+        assert next_dst_transition(spring["date"]) == fall
+        assert next_dst_transition(fall["date"]) == get_dst_transitions(tz, 2025)[0]
+
+    def test_previous_dst_transition(self) -> None:
+        """Test finding the previous DST transition."""
+        summer = make_aware("2024-07-15 12:00:00", "Europe/Berlin")
+        prev_trans = previous_dst_transition(summer)
+        assert prev_trans is not None
+        assert prev_trans["type"] == "spring_forward"
+        assert prev_trans["date"].month == 3
+
+        # before the first transition of the year, look into the previous year
+        winter = make_aware("2024-02-15 12:00:00", "Europe/Berlin")
+        prev_trans = previous_dst_transition(winter)
+        assert prev_trans is not None
+        assert prev_trans["type"] == "fall_back"
+        assert prev_trans["date"].year == 2023
+
+        # transition instant itself counts as previous
+        spring = get_dst_transitions("Europe/Berlin", 2024)[0]
+        assert previous_dst_transition(spring["date"]) == spring
+
+    def test_previous_dst_transition_error_cases(self) -> None:
+        """Test error conditions for previous_dst_transition."""
+        with pytest.raises(ValueError, match="Cannot find DST transition for None datetime"):
+            previous_dst_transition(None)  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError, match="Cannot find DST transition for timezone-unaware datetime"):
+            previous_dst_transition(datetime(2024, 7, 15, 12, 0, 0))
+
+        with pytest.raises(ValueError, match="DST transitions only supported for ZoneInfo timezones"):
+            previous_dst_transition(datetime(2024, 7, 15, 12, 0, 0, tzinfo=timezone.utc))
+
+        tokyo_dt = make_aware("2024-07-15 12:00:00", "Asia/Tokyo")
+        assert previous_dst_transition(tokyo_dt) is None
+
+
+class TestIterDSTTransitions:
+    """Test the streaming multi-year transition API."""
+
+    def test_matches_yearly_transitions(self) -> None:
+        """Test that streaming yields the same transitions as the yearly lookup."""
+        tz = ZoneInfo("America/New_York")
+        streamed = list(iter_dst_transitions(tz, datetime(2000, 1, 1, tzinfo=tz), datetime(2031, 1, 1, tzinfo=tz)))
+        yearly = [trans for year in range(2000, 2031) for trans in get_dst_transitions(tz, year)]
+
+        assert len(streamed) == 62
+        assert streamed == yearly
+        assert [trans["date"].timestamp() for trans in streamed] == sorted(
+            trans["date"].timestamp() for trans in streamed
+        )
+
+    def test_is_lazy(self) -> None:
+        """Test that transitions are produced on demand."""
+        from collections.abc import Iterator
+
+        transitions = iter_dst_transitions("Europe/Berlin", datetime(2024, 1, 1), datetime(9000, 1, 1))
+        assert isinstance(transitions, Iterator)
+        first = next(transitions)
+        assert first["type"] == "spring_forward"
+        assert first["date"] == datetime(2024, 3, 31, 3, 0, tzinfo=ZoneInfo("Europe/Berlin"))
+
+    def test_transition_instants_are_exact(self) -> None:
+        """Test that the reported dates are the exact instants of the change."""
+        utc = ZoneInfo("UTC")
+        for trans in iter_dst_transitions("Europe/Berlin", datetime(2024, 1, 1), datetime(2025, 1, 1)):
+            instant = trans["date"].astimezone(utc)
+            before = (instant - timedelta(seconds=1)).astimezone(trans["date"].tzinfo)
+            after = instant.astimezone(trans["date"].tzinfo)
+            assert before.dst() != after.dst()
+
+    def test_years_after_the_table(self) -> None:
+        """Test that the POSIX rule is used for years past the tz database table."""
+        transitions = list(iter_dst_transitions("Australia/Sydney", datetime(2100, 1, 1), datetime(2101, 1, 1)))
+
+        assert [trans["type"] for trans in transitions] == ["fall_back", "spring_forward"]
+        assert transitions[0]["date"].month == 4
+        assert transitions[1]["date"].month == 10
+
+    def test_bounds(self) -> None:
+        """Test that start is inclusive and end is exclusive."""
+        spring, fall = get_dst_transitions("Europe/Berlin", 2024)
+
+        transitions = list(iter_dst_transitions("Europe/Berlin", spring["date"], fall["date"]))
+        assert transitions == [spring]
+
+    def test_zones_without_transitions(self) -> None:
+        """Test zones without DST and non zone file timezones."""
+        assert list(iter_dst_transitions("Asia/Tokyo", datetime(2000, 1, 1), datetime(2030, 1, 1))) == []
+        assert list(iter_dst_transitions(timezone.utc, datetime(2000, 1, 1), datetime(2030, 1, 1))) == []
+
+        with pytest.raises(ValueError, match="Invalid timezone: Invalid/Timezone"):
+            list(iter_dst_transitions("Invalid/Timezone", datetime(2000, 1, 1), datetime(2030, 1, 1)))
+
+
+class TestVectorizedDST:
+    """Test the array versions of the DST checks."""
+
+    def test_matches_scalar_checks(self) -> None:
+        """Test that the array lookups match the per-datetime results."""
+        import numpy as np
+
+        epochs = np.arange(1_600_000_000, 1_800_000_000, 3_599_999, dtype=np.int64)
+        for tz_name in ["Europe/Berlin", "America/New_York", "Australia/Lord_Howe", "Asia/Tokyo"]:
+            tz = ZoneInfo(tz_name)
+            expected = [datetime.fromtimestamp(int(ts), tz) for ts in epochs]
+
+            dst = is_dst_active_many(epochs, tz_name)
+            offsets = utcoffset_many(epochs, tz)
+
+            assert dst.dtype == bool
+            assert dst.tolist() == [is_dst_active(dt) for dt in expected]
+            assert offsets.tolist() == [dt.utcoffset() for dt in expected]
+
+    def test_units_and_datetime64(self) -> None:
+        """Test epoch units and datetime64 input."""
+        import numpy as np
+
+        summer = datetime(2024, 7, 1, tzinfo=timezone.utc).timestamp()
+        winter = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+        epochs_ms = np.array([summer * 1000, winter * 1000], dtype=np.int64)
+        assert is_dst_active_many(epochs_ms, "Europe/Berlin", unit="ms").tolist() == [True, False]
+
+        values = np.array(["2024-07-01T00:00", "2024-01-01T00:00", "NaT"], dtype="datetime64[ns]")
+        assert is_dst_active_many(values, "Europe/Berlin").tolist() == [True, False, False]
+        offsets = utcoffset_many(values, "Europe/Berlin")
+        assert offsets[:2].tolist() == [timedelta(hours=2), timedelta(hours=1)]
+        assert np.isnat(offsets[2])
+
+    def test_pandas_series(self) -> None:
+        """Test timezone-aware Series using their own timezone."""
+        import pandas as pd
+
+        series = pd.Series(pd.to_datetime(["2024-01-15 12:00", "2024-07-15 12:00"]).tz_localize("Europe/Berlin"))
+        assert is_dst_active_many(series).tolist() == [False, True]
+        assert utcoffset_many(series).tolist() == [timedelta(hours=1), timedelta(hours=2)]
+
+        # explicit timezone overrides the timezone of the series
+        assert is_dst_active_many(series, "Asia/Tokyo").tolist() == [False, False]
+
+    def test_error_cases(self) -> None:
+        """Test error conditions of the array lookups."""
+        import numpy as np
+
+        with pytest.raises(ValueError, match="A timezone is required"):
+            is_dst_active_many(np.array([0], dtype=np.int64))
+
+        with pytest.raises(ValueError, match="Invalid timezone: Invalid/Timezone"):
+            utcoffset_many(np.array([0], dtype=np.int64), "Invalid/Timezone")
+
+        with pytest.raises(ValueError, match="Invalid epoch unit"):
+            utcoffset_many(np.array([0], dtype=np.int64), "UTC", unit="h")
+
+
+class TestDSTCalendar:
+    """Test the precomputed multi-zone DST calendar."""
+
+    ZONES = ("Europe/Berlin", "America/New_York", "Australia/Sydney", "Asia/Tokyo")
+
+    def test_matches_yearly_transitions(self) -> None:
+        """Test that the calendar holds the transitions of every zone and year."""
+        calendar = dst_calendar(range(2020, 2026), self.ZONES, workers=1)
+
+        assert calendar.zones == self.ZONES
+        assert len(calendar) == 3 * 6 * 2
+        for zone in self.ZONES:
+            expected = [trans for year in range(2020, 2026) for trans in get_dst_transitions(zone, year)]
+            assert calendar.transitions(zone) == expected
+        assert calendar.transitions("Europe/London") == []
+
+    def test_columns(self) -> None:
+        """Test the columnar layout of the calendar."""
+        from time_helper.dst import TRANSITION_TYPES
+
+        calendar = dst_calendar(2024, ["Europe/Berlin"], workers=1)
+
+        assert calendar.zone_id.tolist() == [0, 0]
+        assert [TRANSITION_TYPES[code] for code in calendar.type] == ["spring_forward", "fall_back"]
+        assert calendar.instant.tolist() == [
+            int(datetime(2024, 3, 31, 1, tzinfo=timezone.utc).timestamp()),
+            int(datetime(2024, 10, 27, 1, tzinfo=timezone.utc).timestamp()),
+        ]
+        assert calendar.offset_before.tolist() == [3600, 7200]
+        assert calendar.offset_after.tolist() == [7200, 3600]
+
+    def test_parallel_matches_serial(self) -> None:
+        """Test that the process pool produces the same table."""
+        serial = dst_calendar([2020, 2021, 2030], self.ZONES, workers=1)
+        parallel = dst_calendar([2020, 2021, 2030], self.ZONES, workers=2)
+
+        assert serial.zone_id.tolist() == parallel.zone_id.tolist()
+        assert serial.instant.tolist() == parallel.instant.tolist()
+        assert serial.type.tolist() == parallel.type.tolist()
+
+    def test_save_and_load(self, tmp_path: Path) -> None:
+        """Test storing the calendar in a binary file."""
+        from time_helper.dst import DSTCalendar
+
+        calendar = dst_calendar(range(2023, 2025), self.ZONES, workers=1)
+        path = tmp_path / "calendar.npz"
+        calendar.save(path)
+        loaded = DSTCalendar.load(path)
+
+        assert loaded.zones == calendar.zones
+        for column in ["zone_id", "instant", "type", "offset_before", "offset_after"]:
+            assert getattr(loaded, column).tolist() == getattr(calendar, column).tolist()
+            assert getattr(loaded, column).dtype == getattr(calendar, column).dtype
+
+    def test_iana_abbreviation_keys(self) -> None:
+        """Test that IANA keys named like abbreviations are not remapped to other zones."""
+        calendar = dst_calendar(2024, ["EST", "CET", "EET"], workers=1)
+        instants = [
+            int(datetime(2024, 3, 31, 1, tzinfo=timezone.utc).timestamp()),
+            int(datetime(2024, 10, 27, 1, tzinfo=timezone.utc).timestamp()),
+        ]
+
+        assert calendar.transitions("EST") == []
+        for zone, standard in (("CET", 3600), ("EET", 7200)):
+            rows = calendar.zone_id == calendar.zones.index(zone)
+            assert calendar.instant[rows].tolist() == instants
+            assert calendar.offset_before[rows].tolist() == [standard, standard + 3600]
+            assert calendar.offset_after[rows].tolist() == [standard + 3600, standard]
+
+    def test_invalid_zone(self) -> None:
+        """Test that invalid zones are rejected."""
+        with pytest.raises(ValueError, match="Invalid timezone: Invalid/Timezone"):
+            dst_calendar(2024, ["Invalid/Timezone"], workers=1)
+
+
+class TestLocalTimeClassification:
+    """Test the bulk detection of nonexistent and ambiguous local times."""
+
+    VALUES = (
+        "2024-03-31T01:59:59",  # before the gap
+        "2024-03-31T02:30:00",  # in the gap
+        "2024-03-31T03:00:00",  # after the gap
+        "2024-10-27T01:59:59",  # before the fold
+        "2024-10-27T02:30:00",  # in the fold
+        "2024-10-27T03:00:00",  # after the fold
+        "NaT",
+    )
+
+    def _values(self) -> Any:
+        import numpy as np
+
+        return np.array(self.VALUES, dtype="datetime64[s]")
+
+    def test_classify_local_times(self) -> None:
+        """Test the per-row masks."""
+        nonexistent, ambiguous = classify_local_times(self._values(), "Europe/Berlin")
+
+        assert nonexistent.tolist() == [False, True, False, False, False, False, False]
+        assert ambiguous.tolist() == [False, False, False, False, True, False, False]
+
+        # zones without transitions never have special times
+        nonexistent, ambiguous = classify_local_times(self._values(), "Asia/Tokyo")
+        assert not nonexistent.any()
+        assert not ambiguous.any()
+
+    def test_classify_matches_zoneinfo(self) -> None:
+        """Test the masks against zoneinfo round trips around every transition."""
+        import numpy as np
+
+        tz = ZoneInfo("America/New_York")
+        utc = ZoneInfo("UTC")
+        wall = np.arange(
+            int(datetime(2024, 3, 10, tzinfo=utc).timestamp()), int(datetime(2024, 3, 11, tzinfo=utc).timestamp()), 900
+        )
+        wall = np.concatenate([wall, wall + int(timedelta(days=238).total_seconds())])
+        nonexistent, ambiguous = classify_local_times(wall, tz)
+
+        for value, gap, fold in zip(wall.tolist(), nonexistent, ambiguous, strict=True):
+            naive = datetime(1970, 1, 1) + timedelta(seconds=value)
+            first, second = naive.replace(tzinfo=tz), naive.replace(tzinfo=tz, fold=1)
+            exists = first.astimezone(utc).astimezone(tz).replace(tzinfo=None) == naive
+            assert gap == (not exists)
+            assert fold == (exists and first.utcoffset() != second.utcoffset())
+
+    def test_localize_many_policies(self) -> None:
+        """Test the policies for gaps and folds."""
+        nat = -(2**63)
+        expected = [
+            datetime(2024, 3, 31, 0, 59, 59, tzinfo=timezone.utc),
+            None,
+            datetime(2024, 3, 31, 1, 0, 0, tzinfo=timezone.utc),
+            datetime(2024, 10, 26, 23, 59, 59, tzinfo=timezone.utc),
+            None,
+            datetime(2024, 10, 27, 2, 0, 0, tzinfo=timezone.utc),
+        ]
+        expected_ts = [int(dt.timestamp()) if dt else None for dt in expected]
+
+        def check(result: Any, gap: int, fold: int) -> None:
+            assert result.tolist() == [*expected_ts[:1], gap, *expected_ts[2:4], fold, expected_ts[5], nat]
+
+        fold_earliest = int(datetime(2024, 10, 27, 0, 30, tzinfo=timezone.utc).timestamp())
+        fold_latest = int(datetime(2024, 10, 27, 1, 30, tzinfo=timezone.utc).timestamp())
+        gap_forward = int(datetime(2024, 3, 31, 1, 0, tzinfo=timezone.utc).timestamp())
+
+        values = self._values()
+        check(localize_many(values, "Europe/Berlin", "earliest", "shift_forward"), gap_forward, fold_earliest)
+        check(localize_many(values, "Europe/Berlin", "latest", "shift_backward"), gap_forward - 1, fold_latest)
+        check(localize_many(values, "Europe/Berlin", "NaT", "NaT"), nat, nat)
+
+        # sub-second units shift backward by a single tick
+        result = localize_many(values.astype("datetime64[ms]"), "Europe/Berlin", "NaT", "shift_backward", unit="ms")
+        assert result[1] == gap_forward * 1000 - 1
+
+    def test_localize_many_errors(self) -> None:
+        """Test raising on special times and invalid policies."""
+        from pytz import AmbiguousTimeError, NonExistentTimeError
+
+        values = self._values()
+        with pytest.raises(AmbiguousTimeError, match="1 local times are ambiguous in Europe/Berlin"):
+            localize_many(values, "Europe/Berlin", nonexistent="NaT")
+        with pytest.raises(NonExistentTimeError, match="1 local times do not exist in Europe/Berlin"):
+            localize_many(values, "Europe/Berlin", ambiguous="NaT")
+        with pytest.raises(ValueError, match="Invalid ambiguous policy: infer"):
+            localize_many(values, "Europe/Berlin", ambiguous="infer")
+        with pytest.raises(ValueError, match="Invalid nonexistent policy: shift"):
+            localize_many(values, "Europe/Berlin", nonexistent="shift")
+
+    def test_rejects_aware_series(self) -> None:
+        """Test that aware values are not taken as local times."""
+        import pandas as pd
+
+        series = pd.Series(pd.to_datetime(["2024-01-01"]).tz_localize("UTC"))
+        with pytest.raises(ValueError, match="Expected naive local times"):
+            classify_local_times(series, "Europe/Berlin")
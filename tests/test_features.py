@@ -0,0 +1,53 @@
+"""Tests for the numeric time features."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_helper import BusinessCalendar, TimeFeatures, time_features
+from time_helper.features import FEATURES
+
+VALUES = np.array(["2024-03-31T00:30", "2024-03-31T01:30", "2024-12-31T12:00", "NaT"], dtype="datetime64[s]")
+
+
+def test_time_features() -> None:
+    """Test the positions, encodings and flags of the features."""
+    result = time_features(VALUES, FEATURES, timezone="Europe/Berlin")
+    assert result.shape == (4, len(FEATURES))
+    columns = dict(zip(FEATURES, result.T, strict=True))
+
+    # wall clock of Berlin (01:30 UTC is after the switch to summer time)
+    assert np.allclose(columns["time_of_day"][:3], [1.5 / 24, 3.5 / 24, 13 / 24])
+    assert np.allclose(columns["day_of_week"][:3], [6 / 7, 6 / 7, 1 / 7])
+    assert np.allclose(columns["day_of_year"][:3], [90 / 366, 90 / 366, 365 / 366])
+    assert np.allclose(columns["month"][:3], [2 / 12, 2 / 12, 11 / 12])
+    assert np.allclose(columns["time_of_day_sin"][:3], np.sin(2 * np.pi * columns["time_of_day"][:3]))
+    assert np.allclose(columns["month_cos"][:3], np.cos(2 * np.pi * columns["month"][:3]))
+    assert columns["dst"][:3].tolist() == [0, 1, 0]
+    assert columns["business_day"][:3].tolist() == [0, 0, 1]
+    assert np.isnan(result[3]).all()
+
+    # values without timezone are taken as UTC, aware series use their own timezone
+    assert np.allclose(time_features(VALUES[:1], ["time_of_day"]), [[0.5 / 24]])
+    series = pd.Series(pd.to_datetime(VALUES[:3])).dt.tz_localize("UTC").dt.tz_convert("Europe/Berlin")
+    assert np.allclose(time_features(series, FEATURES), result[:3])
+
+
+def test_time_features_out() -> None:
+    """Test the preallocated output and custom calendars."""
+    extractor = TimeFeatures(["business_day", "day_of_week"], calendar=BusinessCalendar(holidays=["2024-12-31"]))
+    out = np.zeros((3, 2))
+    assert extractor.transform(VALUES[:3].astype(np.int64) * 1000, unit="ms", out=out) is out
+    assert out[:, 0].tolist() == [0, 0, 0]
+
+    # days outside of the calendar tables are flagged as well
+    calendar = BusinessCalendar(holidays=["1850-01-02", "2024-12-31"])
+    values = np.array(["1850-01-01", "1850-01-02", "1850-01-05", "2024-12-31", "2300-01-01"], dtype="datetime64[s]")
+    flags = time_features(values, ["business_day", "month"], calendar=calendar)
+    assert flags[:, 0].tolist() == [1, 0, 0, 0, 1]
+    assert np.allclose(flags[:, 1], [0, 0, 0, 11 / 12, 0])
+
+    with pytest.raises(ValueError, match="shape"):
+        extractor.transform(VALUES, out=out)
+    with pytest.raises(ValueError, match="Invalid features: hour"):
+        TimeFeatures(["hour"])
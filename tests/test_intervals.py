@@ -0,0 +1,147 @@
+"""Tests for the interval structures."""
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pytest
+
+from time_helper import IntervalIndex, IntervalSet, create_interval_arrays, create_intervals, iter_intervals
+from time_helper.intervals import interval_arrays, iter_overlaps, overlap_join
+
+
+def test_interval_arrays() -> None:
+    intervals = create_intervals(datetime(2024, 1, 1), datetime(2024, 1, 2), timedelta(hours=6))
+    starts, ends = interval_arrays(intervals)
+    assert starts.tolist() == [1704067200 + i * 21600 for i in range(4)]
+    assert (ends - starts).tolist() == [21600] * 4
+
+    # lazy sequences and columnar arrays give the same epochs
+    lazy = iter_intervals(datetime(2024, 1, 1), datetime(2024, 1, 2), timedelta(hours=6))
+    for other in (interval_arrays(lazy), interval_arrays(create_interval_arrays(lazy.start, lazy.end, lazy.interval))):
+        assert other[0].tolist() == starts.tolist()
+        assert other[1].tolist() == ends.tolist()
+
+    # aware datetimes are converted to UTC
+    tz = ZoneInfo("Europe/Berlin")
+    starts, _ = interval_arrays([(datetime(2024, 1, 1, 1, tzinfo=tz), datetime(2024, 1, 1, 2, tzinfo=tz))], unit="ms")
+    assert starts.tolist() == [1704067200000]
+
+
+def test_interval_index() -> None:
+    # the skip threshold drops the clipped last interval
+    intervals = create_intervals(
+        datetime(2024, 1, 1), datetime(2024, 1, 1, 1, 0, 30), timedelta(minutes=10), skip=timedelta(minutes=1)
+    )
+    index = IntervalIndex.from_intervals(intervals)
+    assert len(index) == 6
+
+    assert index.locate(datetime(2024, 1, 1, 0, 15)) == 1
+    assert index.locate(datetime(2024, 1, 1, 0, 20)) == 2
+    assert index.locate(datetime(2024, 1, 1, 1, 0, 10)) == -1
+    assert index.locate("2023-12-31") == -1
+    assert index.locate(np.datetime64("2024-01-01T00:59:59")) == 5
+
+    # vectorized lookup matches a scan over the intervals
+    epochs = np.arange(1704067200 - 100, 1704067200 + 3700, 7, dtype=np.int64)
+    epoch = datetime(1970, 1, 1)
+    expected = [
+        next((i for i, (s, e) in enumerate(intervals) if s <= epoch + timedelta(seconds=int(ts)) < e), -1)
+        for ts in epochs
+    ]
+    assert index.locate_many(epochs).tolist() == expected
+    assert index.locate_many(np.array(["2024-01-01T00:30", "NaT"], dtype="datetime64[m]")).tolist() == [3, -1]
+
+    # naive and aware datetimes can not be mixed (epochs stay allowed)
+    tz = ZoneInfo("Europe/Berlin")
+    with pytest.raises(TypeError, match="offset-naive and offset-aware"):
+        index.locate(datetime(2024, 1, 1, 0, 15, tzinfo=tz))
+    aware = IntervalIndex.from_intervals(
+        iter_intervals(datetime(2024, 1, 1, tzinfo=tz), datetime(2024, 1, 2, tzinfo=tz), timedelta(hours=1))
+    )
+    assert aware.locate(datetime(2024, 1, 1, 0, 15, tzinfo=ZoneInfo("UTC"))) == 1
+    assert aware.locate(1704067200) == 1
+    with pytest.raises(TypeError, match="offset-naive and offset-aware"):
+        aware.locate(datetime(2024, 1, 1, 0, 15))
+
+
+def test_interval_index_unsorted() -> None:
+    index = IntervalIndex(np.array([20, 0, 10]), np.array([25, 5, 15]))
+    assert index.locate_many(np.array([0, 4, 5, 12, 21, 30])).tolist() == [1, 1, -1, 2, 0, -1]
+    assert index.contains(np.array([3, 7])).tolist() == [True, False]
+    gap_starts, gap_ends = index.gaps()
+    assert gap_starts.tolist() == [5, 15]
+    assert gap_ends.tolist() == [10, 20]
+    assert IntervalIndex(np.array([], dtype=np.int64), np.array([], dtype=np.int64)).locate_many([1]).tolist() == [-1]
+
+    with pytest.raises(ValueError, match="must not overlap"):
+        IntervalIndex(np.array([0, 5]), np.array([10, 15]))
+    with pytest.raises(ValueError, match="must not end before"):
+        IntervalIndex(np.array([10]), np.array([5]))
+
+
+def test_interval_set() -> None:
+    """Test the normalization and set algebra of interval sets."""
+    # overlapping and adjacent intervals are merged, empty ones dropped
+    hours = IntervalSet([5, 0, 3, 10, 20, 20], [8, 4, 5, 12, 30, 20])
+    assert list(hours) == [(0, 8), (10, 12), (20, 30)]
+    assert hours.total_duration() == timedelta(seconds=20)
+
+    outages = IntervalSet([7, 11, 25], [10, 21, 26])
+    assert list(hours | outages) == [(0, 30)]
+    assert list(hours & outages) == [(7, 8), (11, 12), (20, 21), (25, 26)]
+    assert list(hours - outages) == [(0, 7), (10, 11), (21, 25), (26, 30)]
+    assert list(hours.complement(-5, 25)) == [(-5, 0), (8, 10), (12, 20)]
+    assert hours - hours == IntervalSet([], [])
+    assert hash(hours | hours) == hash(hours)
+    assert hours.contains(np.array([0, 8, 9, 29])).tolist() == [True, False, False, True]
+
+    # availability of create_intervals output minus maintenance windows
+    shifts = create_intervals(datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 16), interval=timedelta(hours=4))
+    maintenance = (
+        np.array(["2024-01-01T11:00", "2024-01-01T15:30"], dtype="datetime64[s]"),
+        np.array(["2024-01-01T12:30", "2024-01-01T17:00"], dtype="datetime64[s]"),
+    )
+    available = IntervalSet.from_intervals(shifts) - maintenance
+    starts, ends = available.to_arrays()
+    assert starts.tolist() == [datetime(2024, 1, 1, 8), datetime(2024, 1, 1, 12, 30)]
+    assert ends.tolist() == [datetime(2024, 1, 1, 11), datetime(2024, 1, 1, 15, 30)]
+    assert available.total_duration() == timedelta(hours=6)
+    assert available.complement("2024-01-01", "2024-01-02").total_duration() == timedelta(hours=18)
+
+    with pytest.raises(ValueError, match="different units"):
+        hours | IntervalSet([0], [1], unit="ms")
+    with pytest.raises(ValueError, match="must not end before they start"):
+        IntervalSet([2], [1])
+
+
+def test_overlap_join() -> None:
+    """Test the sort-merge overlap join."""
+    # sessions (unsorted) against shifts from create_intervals
+    shifts = create_intervals(datetime(2024, 1, 1, 6), datetime(2024, 1, 2, 6), interval=timedelta(hours=8))
+    sessions = [
+        (datetime(2024, 1, 1, 20), datetime(2024, 1, 1, 23)),
+        (datetime(2024, 1, 1, 5), datetime(2024, 1, 1, 7)),
+        (datetime(2024, 1, 1, 13), datetime(2024, 1, 1, 23)),
+        (datetime(2024, 1, 1, 14), datetime(2024, 1, 1, 14)),
+        (datetime(2024, 1, 2, 6), datetime(2024, 1, 2, 7)),
+    ]
+    pairs = sorted(iter_overlaps(sessions, shifts))
+    assert pairs == [
+        (0, 1, 2 * 3600),
+        (0, 2, 3600),
+        (1, 0, 3600),
+        (2, 0, 3600),
+        (2, 1, 8 * 3600),
+        (2, 2, 3600),
+    ]
+
+    # columnar input and array output (overlaps in ticks of the unit)
+    left = (np.array([0, 10, 20]), np.array([15, 12, 25]))
+    right = (np.array([5, 11]), np.array([11, 30]))
+    left_pos, right_pos, overlap = overlap_join(left, right, unit="ms")
+    order = np.lexsort((right_pos, left_pos))
+    assert left_pos[order].tolist() == [0, 0, 1, 1, 2]
+    assert right_pos[order].tolist() == [0, 1, 0, 1, 1]
+    assert overlap[order].tolist() == [6, 4, 1, 1, 5]
+    assert len(overlap_join(left, (np.array([100]), np.array([200])))[0]) == 0
@@ -1,9 +1,21 @@
 from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from time_helper import has_timezone, localize_datetime, make_aware, round_time, time_diff
+from time_helper import (
+    asof_match,
+    has_timezone,
+    localize_datetime,
+    make_aware,
+    round_time,
+    round_time_many,
+    scan_timezones,
+    time_diff,
+    time_diff_many,
+)
 
 
 class TestOpsCoverage:
@@ -275,3 +287,248 @@ def test_round_time() -> None:
     dt_out = round_time(dt, "Y", max_out=True)
     assert type(dt_out) == datetime
     assert dt_out.isoformat() == "2022-12-31T23:59:59.999999"
+
+
+def test_has_timezone_object_columns() -> None:
+    utc = datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC"))
+    berlin = datetime(2024, 6, 1, tzinfo=ZoneInfo("Europe/Berlin"))
+    df = pd.DataFrame({"time": pd.Series([utc, berlin, None, datetime(2024, 1, 1)], dtype=object)})
+
+    # decided from all values instead of the first one
+    assert has_timezone(df, "time") is False
+    assert has_timezone(df["time"].iloc[:3]) is True
+    with pytest.raises(ValueError, match="not a datetime object"):
+        has_timezone(pd.Series(["foo", utc], dtype=object))
+
+    scan = scan_timezones(df, "time")
+    assert scan.zones == {"UTC", "Europe/Berlin"}
+    assert scan.offsets == {timedelta(0), timedelta(hours=2)}
+    assert (scan.aware, scan.naive, scan.missing, scan.other) == (2, 1, 1, 0)
+    assert scan.mixed
+
+    # sampling of large columns
+    scan = scan_timezones(pd.Series([utc] * 10_000, dtype=object), sample=100)
+    assert (scan.scanned, scan.rows, scan.aware, scan.mixed) == (100, 10_000, 100, False)
+
+    # datetime columns are answered from the dtype
+    series = pd.Series(pd.date_range("2024-03-30", periods=3, freq="D", tz="Europe/Berlin"))
+    scan = scan_timezones(series)
+    assert scan.zones == {"Europe/Berlin"}
+    assert scan.offsets == {timedelta(hours=1), timedelta(hours=2)}
+    assert scan_timezones(series.dt.tz_localize(None)).naive == 3
+
+
+def test_time_diff_many() -> None:
+    tokyo = datetime(2024, 3, 15, 10, tzinfo=ZoneInfo("Asia/Tokyo"))
+    london = datetime(2024, 3, 15, 10, tzinfo=ZoneInfo("Europe/London"))
+    a = [tokyo, datetime(2024, 3, 15, 10), datetime(2024, 3, 15, 10), None]
+    b = [london, datetime(2024, 3, 15, 9, tzinfo=ZoneInfo("UTC")), datetime(2024, 3, 15, 8), london]
+
+    # matches the scalar difference (naive values are local time in tz, unless both are naive)
+    result = time_diff_many(a, b, tz="Europe/Berlin")
+    assert result.dtype == np.dtype("timedelta64[us]")
+    assert result[:3].tolist() == [time_diff(x, y, "Europe/Berlin") for x, y in zip(a[:3], b[:3], strict=True)]
+    assert np.isnat(result[3])
+
+    # aware series against naive datetime64 and a single value
+    series = pd.Series(pd.date_range("2024-01-01", periods=3, freq="h", tz="Asia/Tokyo"))
+    naive = np.array(["2024-01-01"], dtype="datetime64[ms]")
+    assert time_diff_many(series, naive, tz="UTC", unit="ms").astype("m8[ms]").astype(np.int64).tolist() == [
+        -32_400_000,
+        -28_800_000,
+        -25_200_000,
+    ]
+    assert time_diff_many(series, tokyo).astype("m8[s]").astype(np.int64).tolist() == [-6429600, -6426000, -6422400]
+
+    # integer epochs stay integers
+    assert time_diff_many(np.array([10, 20]), np.array([5, 5])).tolist() == [5, 15]
+
+    # naive values in a gap or fold take the offset before the DST change (as in time_diff)
+    utc = ZoneInfo("UTC")
+    local = [datetime(2024, 3, 31, 2, 30), datetime(2024, 10, 27, 2, 30), datetime(2024, 10, 27, 3, 30)]
+    other = [datetime(2024, 3, 31, tzinfo=utc), datetime(2024, 10, 27, tzinfo=utc), datetime(2024, 10, 27, tzinfo=utc)]
+    expected = [time_diff(x, y, "Europe/Berlin") for x, y in zip(local, other, strict=True)]
+    assert expected == [timedelta(hours=1, minutes=30), timedelta(minutes=30), timedelta(hours=2, minutes=30)]
+    assert time_diff_many(local, other, tz="Europe/Berlin").tolist() == expected
+    naive = np.array(local, dtype="datetime64[s]")
+    assert time_diff_many(naive, other, tz="Europe/Berlin").tolist() == expected
+
+    # sub-second values keep their resolution
+    result = time_diff_many(
+        np.array(["2024-01-01T00:00:00.900"], dtype="datetime64[ms]"),
+        np.array(["2024-01-01T00:00:01.100"], dtype="datetime64[ms]"),
+    )
+    assert result.dtype == np.dtype("timedelta64[ms]")
+    assert result.tolist() == [timedelta(milliseconds=-200)]
+    assert time_diff_many(np.array([1_500]), datetime(1970, 1, 1, tzinfo=utc), unit="ms").tolist() == [
+        timedelta(seconds=1.5)
+    ]
+
+
+def test_asof_match() -> None:
+    # trades in Tokyo time against unsorted quotes in London time
+    tokyo, london = ZoneInfo("Asia/Tokyo"), ZoneInfo("Europe/London")
+    trades = [
+        datetime(2024, 3, 15, 18, 0, 5, tzinfo=tokyo),
+        datetime(2024, 3, 15, 9, 0, 10, tzinfo=london),
+        datetime(2024, 3, 15, 8, 59, tzinfo=london),
+        None,
+    ]
+    quotes = [
+        datetime(2024, 3, 15, 9, 0, 10, tzinfo=london),
+        datetime(2024, 3, 15, 9, 0, 0, tzinfo=london),
+        datetime(2024, 3, 15, 9, 1, 0, tzinfo=london),
+    ]
+    assert asof_match(trades, quotes).tolist() == [1, 0, -1, -1]
+    assert asof_match(trades, quotes, allow_exact_matches=False).tolist() == [1, 1, -1, -1]
+    assert asof_match(trades, quotes, direction="forward").tolist() == [0, 0, 1, -1]
+    assert asof_match(trades, quotes, direction="nearest").tolist() == [1, 0, 1, -1]
+    assert asof_match(trades, quotes, direction="nearest", tolerance="30s").tolist() == [1, 0, -1, -1]
+
+    # epoch arrays (tolerance in ticks) and naive datetime64 values localized in tz against aware ones
+    assert asof_match(np.array([1, 5, 10, 15]), np.array([10, 2, 14]), tolerance=3).tolist() == [-1, 1, 0, 2]
+    assert asof_match(np.array([1, 5, 10, 15]), np.array([10, 2, 14]), tolerance=np.int64(3)).tolist() == [-1, 1, 0, 2]
+    local = np.array(["2024-03-15T10:00:30"], dtype="datetime64[s]")
+    assert asof_match(local, quotes, tz="Europe/Berlin").tolist() == [0]
+    assert asof_match(local, np.array([], dtype=np.int64)).tolist() == [-1]
+    with pytest.raises(ValueError, match="Invalid direction"):
+        asof_match(local, quotes, direction="closest")
+
+
+def test_round_time_steps() -> None:
+    dt = datetime(2022, 2, 10, 13, 37, 54)
+
+    assert round_time(dt, "15min") == datetime(2022, 2, 10, 13, 30)
+    assert round_time(dt, "15min", mode="ceil") == datetime(2022, 2, 10, 13, 45)
+    assert round_time(dt, "15min", mode="nearest") == datetime(2022, 2, 10, 13, 45)
+    assert round_time(dt, "15min", max_out=True) == datetime(2022, 2, 10, 13, 44, 59, 999999)
+    assert round_time(dt, "5s") == datetime(2022, 2, 10, 13, 37, 50)
+    assert round_time(dt, "6H") == datetime(2022, 2, 10, 12)
+    assert round_time(dt, timedelta(minutes=20)) == datetime(2022, 2, 10, 13, 20)
+    assert round_time(dt, "2W") == datetime(2022, 1, 31)
+
+    # values on a boundary stay unchanged
+    assert round_time(datetime(2022, 2, 10, 13, 30), "15min", mode="ceil") == datetime(2022, 2, 10, 13, 30)
+
+    with pytest.raises(ValueError, match="Invalid step size: 5x"):
+        round_time(dt, "5x")
+    with pytest.raises(ValueError, match="Invalid rounding mode: up"):
+        round_time(dt, "H", mode="up")
+    with pytest.raises(ValueError, match="only supported for fixed steps"):
+        round_time(dt, "m", mode="ceil")
+
+
+def test_round_time_steps_local_time() -> None:
+    # steps are aligned to the wall clock of aware datetimes
+    dt = make_aware("2024-03-31 14:37:00", "Europe/Berlin")
+    result = round_time(dt, "6H")
+    assert result is not None
+    assert result.isoformat() == "2024-03-31T12:00:00+02:00"
+
+    # the second occurrence of an ambiguous time keeps its fold
+    dt = make_aware("2024-10-27 02:40:00", "Europe/Berlin").replace(fold=1)
+    result = round_time(dt, "15min")
+    assert result is not None
+    assert result.fold == 1
+    assert result.utcoffset() == timedelta(hours=1)
+
+    # rounding into the gap of a DST change resolves to its end (as in round_time_many)
+    dt = make_aware("2024-03-31 01:30:00", "Europe/Berlin")
+    result = round_time(dt, "H", mode="ceil")
+    assert result is not None
+    assert result.isoformat() == "2024-03-31T03:00:00+02:00"
+    assert (
+        int(result.timestamp()) == round_time_many(np.array([int(dt.timestamp())]), "H", "ceil", timezone=dt.tzinfo)[0]
+    )
+
+
+def test_round_time_many() -> None:
+    epochs = np.array([0, 899, 900, 1349, 1350, -1], dtype=np.int64)
+
+    assert round_time_many(epochs, "15min").tolist() == [0, 0, 900, 900, 900, -900]
+    assert round_time_many(epochs, "15min", mode="ceil").tolist() == [0, 900, 900, 1800, 1800, 0]
+    assert round_time_many(epochs, "15min", mode="nearest").tolist() == [0, 900, 900, 900, 1800, 0]
+    assert round_time_many(epochs, "15min", max_out=True).tolist() == [899, 899, 1799, 1799, 1799, -1]
+    assert round_time_many(epochs * 1000, "500ms", unit="ms").tolist() == [0, 899000, 900000, 1349000, 1350000, -1000]
+
+    # datetime64 input returns datetime64 (with missing values)
+    values = np.array(["2022-02-10T13:37:54", "NaT"], dtype="datetime64[s]")
+    result = round_time_many(values, "W")
+    assert result.dtype == np.dtype("datetime64[s]")
+    assert str(result[0]) == "2022-02-07T00:00:00"
+    assert np.isnat(result[1])
+
+    # sub-second datetime64 values are rounded in their own resolution
+    values = np.array(["2024-01-01T10:07:30.600", "2024-01-01T10:07:30.000", "NaT"], dtype="datetime64[ms]")
+    result = round_time_many(values, "1s", mode="ceil")
+    assert result.dtype == np.dtype("datetime64[ms]")
+    assert result[:2].astype(str).tolist() == ["2024-01-01T10:07:31.000", "2024-01-01T10:07:30.000"]
+    assert str(round_time_many(values, "250ms", max_out=True)[0]) == "2024-01-01T10:07:30.749"
+    assert np.isnat(result[2])
+
+    with pytest.raises(ValueError, match="not a multiple of the unit"):
+        round_time_many(epochs, "500ms")
+    with pytest.raises(ValueError, match="Invalid rounding mode"):
+        round_time_many(epochs, "H", mode="up")
+
+
+def test_round_time_many_calendar() -> None:
+    values = np.array(["2024-02-15T12:00", "2024-02-01T00:00", "2024-12-20T00:00", "NaT"], dtype="datetime64[s]")
+
+    assert np.datetime_as_string(round_time_many(values[:3], "m"), unit="D").tolist() == [
+        "2024-02-01",
+        "2024-02-01",
+        "2024-12-01",
+    ]
+    assert np.datetime_as_string(round_time_many(values[:3], "m", mode="ceil"), unit="D").tolist() == [
+        "2024-03-01",
+        "2024-02-01",
+        "2025-01-01",
+    ]
+    assert np.datetime_as_string(round_time_many(values[:3], "Y", mode="nearest"), unit="D").tolist() == [
+        "2024-01-01",
+        "2024-01-01",
+        "2025-01-01",
+    ]
+    assert str(round_time_many(values, "m", max_out=True)[0]) == "2024-02-29T23:59:59"
+    assert str(round_time_many(values, "Y", mode="ceil", max_out=True)[0]) == "2025-12-31T23:59:59"
+    assert np.isnat(round_time_many(values, "Y")[3])
+
+    # matches the scalar rounding on the local wall clock
+    tz = "Europe/Berlin"
+    epochs = np.arange(1_700_000_000, 1_760_000_000, 86_399 * 7, dtype=np.int64)
+    for freq in ["m", "Y"]:
+        for max_out in [False, True]:
+            expected = [
+                int(round_time(datetime.fromtimestamp(int(ts), ZoneInfo(tz)), freq, max_out).timestamp())  # type: ignore[union-attr]
+                for ts in epochs
+            ]
+            assert round_time_many(epochs, freq, max_out=max_out, timezone=tz).tolist() == expected
+
+    with pytest.raises(ValueError, match="calendar range"):
+        round_time_many(np.array(["1850-01-01"], dtype="datetime64[s]"), "m")
+
+
+def test_round_time_many_local_time() -> None:
+    from zoneinfo import ZoneInfo
+
+    tz = ZoneInfo("Europe/Berlin")
+    series = pd.Series(pd.to_datetime(["2024-03-31 12:00", "2024-10-27 12:00"]).tz_localize(tz))
+
+    # local midnight on the days of the DST changes (23h and 25h days)
+    starts = round_time_many(series, "D")
+    ends = round_time_many(series, "D", max_out=True)
+    assert pd.Series(starts).dt.tz_localize("UTC").dt.tz_convert(tz).tolist() == [
+        pd.Timestamp("2024-03-31 00:00", tz=tz),
+        pd.Timestamp("2024-10-27 00:00", tz=tz),
+    ]
+    # the last tick is in the resolution of the series
+    assert (ends - starts).tolist() == [timedelta(hours=23, microseconds=-1), timedelta(hours=25, microseconds=-1)]
+
+    # matches the scalar rounding
+    epochs = np.arange(1_711_800_000, 1_711_900_000, 1_237, dtype=np.int64)
+    for freq in ["15min", "H", "D"]:
+        expected = [round_time(datetime.fromtimestamp(int(ts), tz), freq) for ts in epochs]
+        assert round_time_many(epochs, freq, timezone=tz).tolist() == [
+            int(dt.timestamp()) for dt in expected if dt is not None
+        ]
@@ -1,4 +1,6 @@
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+
+import pytest
 
 from time_helper import time_to_interval
 
@@ -71,6 +73,42 @@ def test_time_to_interval() -> None:
     assert iv == 36 / 42
 
 
+def test_interval_scaler() -> None:
+    """Test the vectorized time_to_interval."""
+    import numpy as np
+    import pandas as pd
+
+    from time_helper import IntervalScaler
+
+    values = np.array(["2020-09-23T12:00", "2020-09-24T06:00", "2020-09-22T22:00", "NaT"], dtype="datetime64[s]")
+    result = IntervalScaler(offset=12).transform(values)
+    assert np.allclose(result[:3], [0, -6 / 48, 10 / 48])
+    assert np.isnan(result[3])
+
+    # same values as the scalar version (with baseline, asymmetric offsets and epochs)
+    base = datetime(2020, 9, 23, 18)
+    for offset in (0, 12, (6, 12)):
+        for zero_center in (True, False):
+            for normalize in (True, False):
+                scaler = IntervalScaler(offset, base, zero_center, normalize)
+                expected = [
+                    time_to_interval(dt, offset, base, zero_center, normalize) for dt in values[:3].astype(object)
+                ]
+                assert np.allclose(scaler.transform(values[:3].astype(np.int64)), expected)
+                assert np.allclose(scaler.transform(list(values[:3].astype(object))), expected)
+
+                # times are placed on the day of the baseline
+                times = [time(13, 15), time(2, 30), time(23, 59, 59)]
+                expected = [time_to_interval(value, offset, base, zero_center, normalize) for value in times]
+                assert np.allclose(scaler.transform(times), expected)
+
+    # aware series use their wall clock (or the given timezone)
+    series = pd.Series(pd.to_datetime(values[:2])).dt.tz_localize("UTC").dt.tz_convert("Asia/Tokyo")
+    assert IntervalScaler(0, zero_center=False).transform(series).tolist() == [21 / 24, 15 / 24]
+    scaler = IntervalScaler(0, zero_center=False, timezone="Asia/Tokyo")
+    assert scaler.transform(values[:2]).tolist() == [21 / 24, 15 / 24]
+
+
 def test_create_interval() -> None:
     """Test create_intervals function."""
     from time_helper import create_intervals
@@ -141,3 +179,258 @@ def test_create_interval() -> None:
         raise AssertionError("Should raise ValueError for invalid interval")
     except ValueError:
         pass
+
+
+def test_iter_intervals() -> None:
+    """Test the lazy interval sequence."""
+    from time_helper import create_intervals, iter_intervals
+
+    start = datetime(2014, 1, 1)
+    end = datetime(2024, 1, 1, 0, 0, 30)
+
+    # ten years at one minute granularity without materializing the intervals
+    intervals = iter_intervals(start, end, interval=timedelta(minutes=1), skip=timedelta(seconds=30))
+    assert len(intervals) == 5_258_880
+    assert intervals[0] == (start, start + timedelta(minutes=1))
+    assert intervals[-1] == (end - timedelta(minutes=1, seconds=30), end - timedelta(seconds=30))
+    assert intervals[1_000_000] == (datetime(2015, 11, 26, 10, 40), datetime(2015, 11, 26, 10, 41))
+
+    # slices stay lazy
+    part = intervals[10:20:5]
+    assert len(part) == 2
+    assert list(part) == [intervals[10], intervals[15]]
+    assert len(intervals[::-1]) == len(intervals)
+    assert intervals[::-1][0] == intervals[-1]
+
+    # matches the list version (including the clipped last interval)
+    intervals = iter_intervals(start, datetime(2014, 1, 3, 14), interval=1, skip=timedelta(hours=1))
+    assert list(intervals) == create_intervals(start, datetime(2014, 1, 3, 14), interval=1, skip=timedelta(hours=1))
+    assert intervals[-1] == (datetime(2014, 1, 3), datetime(2014, 1, 3, 14))
+    with pytest.raises(IndexError):
+        intervals[3]
+    with pytest.raises(ValueError, match="Interval has to be positive"):
+        iter_intervals(start, end, interval=0)
+
+    # sequences have to define how an interval is computed
+    from time_helper.range import _LazyIntervals
+
+    class Incomplete(_LazyIntervals):
+        indices = range(1)
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()  # type: ignore[abstract]
+
+
+def test_create_interval_arrays() -> None:
+    """Test the columnar interval output."""
+    from zoneinfo import ZoneInfo
+
+    import numpy as np
+
+    from time_helper import create_interval_arrays, create_intervals
+
+    # same intervals as the list version (including skip and the clipped last interval)
+    start = datetime(2024, 1, 1, 10, 0)
+    end = datetime(2024, 1, 3, 14, 0)
+    starts, ends = create_interval_arrays(start, end, interval=1, skip=timedelta(hours=5))
+    expected = create_intervals(start, end, interval=1, skip=timedelta(hours=5))
+    assert starts.dtype == np.dtype("datetime64[s]")
+    assert starts.tolist() == [s for s, _ in expected]
+    assert ends.tolist() == [e for _, e in expected]
+
+    # aware intervals are returned as UTC epochs (stepping along the local wall clock)
+    tz = ZoneInfo("Europe/Berlin")
+    start = datetime(2024, 3, 31, 0, 0, tzinfo=tz)
+    end = datetime(2024, 3, 31, 4, 30, tzinfo=tz)
+    starts, ends = create_interval_arrays(start, end, interval=timedelta(hours=1), unit="ms", as_datetime64=False)
+    expected = create_intervals(start, end, interval=timedelta(hours=1))
+    assert starts.dtype == np.int64
+    assert starts.tolist() == [int(s.timestamp() * 1000) for s, _ in expected]
+    assert ends.tolist() == [int(e.timestamp() * 1000) for _, e in expected]
+
+    with pytest.raises(ValueError, match="not a multiple of the unit"):
+        create_interval_arrays(start, end, interval=timedelta(milliseconds=1500))
+
+
+def test_calendar_intervals() -> None:
+    """Test the calendar aligned intervals."""
+    from zoneinfo import ZoneInfo
+
+    import numpy as np
+
+    from time_helper import calendar_intervals
+
+    tz = ZoneInfo("Europe/Berlin")
+
+    # local days across the DST changes are 23 and 25 hours long
+    days = calendar_intervals(datetime(2024, 3, 30, 12), datetime(2024, 10, 28), "D", "Europe/Berlin")
+    assert len(days) == 212
+    assert days[0] == (datetime(2024, 3, 30, tzinfo=tz), datetime(2024, 3, 31, tzinfo=tz))
+    assert days[1][1].timestamp() - days[1][0].timestamp() == 23 * 3600
+    assert days[-1] == (datetime(2024, 10, 27, tzinfo=tz), datetime(2024, 10, 28, tzinfo=tz))
+    assert days[-1][1].timestamp() - days[-1][0].timestamp() == 25 * 3600
+
+    # columnar output matches the lazy intervals
+    starts, ends = days.to_arrays(as_datetime64=False)
+    assert starts.tolist() == [int(start.timestamp()) for start, _ in days]
+    assert ends.tolist() == [int(end.timestamp()) for _, end in days]
+
+    # ISO weeks, months, quarters and years of the wall clock (naive)
+    weeks = calendar_intervals("2024-01-03", "2024-01-16", "W")
+    assert [start for start, _ in weeks] == [datetime(2024, 1, 1), datetime(2024, 1, 8), datetime(2024, 1, 15)]
+    months = calendar_intervals("2024-01-31", "2024-03-01", "m")
+    assert list(months) == [(datetime(2024, 1, 1), datetime(2024, 2, 1)), (datetime(2024, 2, 1), datetime(2024, 3, 1))]
+    quarters = calendar_intervals("2024-02-15", "2024-12-31", "Q", clip=True)
+    assert [start for start, _ in quarters] == [
+        datetime(2024, 2, 15),
+        datetime(2024, 4, 1),
+        datetime(2024, 7, 1),
+        datetime(2024, 10, 1),
+    ]
+    assert quarters[-1][1] == datetime(2024, 12, 31)
+    assert len(calendar_intervals("2000-06-01", "2024-06-01", "Y")[::2]) == 13
+
+    # midnights that do not exist start at the end of the gap
+    santiago = ZoneInfo("America/Santiago")
+    days = calendar_intervals("2022-09-10", "2022-09-12", "D", santiago)
+    assert days[1][0] == datetime(2022, 9, 11, 1, tzinfo=santiago)
+    starts, _ = days.to_arrays(unit="ms")
+    assert starts[1] == np.datetime64("2022-09-11T04:00:00.000")
+
+    with pytest.raises(ValueError, match="Invalid calendar frequency"):
+        calendar_intervals("2024-01-01", "2024-02-01", "H")
+
+
+def test_bucket_aggregate() -> None:
+    """Test the streaming bucket aggregation."""
+    from zoneinfo import ZoneInfo
+
+    import numpy as np
+
+    from time_helper import BucketAggregator, bucket_aggregate, create_intervals
+
+    # unsorted events (generator), events outside of the intervals are dropped
+    intervals = create_intervals(datetime(2024, 1, 1), datetime(2024, 1, 4), interval=1)
+    events = [
+        (datetime(2024, 1, 2, 5), 3.0),
+        (datetime(2024, 1, 1, 1), 1.0),
+        (datetime(2024, 1, 5), 100.0),
+        (datetime(2024, 1, 2, 23), -2.0),
+        (datetime(2024, 1, 1, 12), 5.0),
+    ]
+    result = bucket_aggregate((event for event in events), intervals, chunk_size=2)
+    assert result["count"].tolist() == [2, 2, 0]
+    assert result["sum"].tolist() == [6.0, 1.0, 0.0]
+    assert result["min"][:2].tolist() == [1.0, -2.0]
+    assert result["max"][:2].tolist() == [5.0, 3.0]
+    assert result["mean"][:2].tolist() == [3.0, 0.5]
+    assert np.isnan(result["min"][2]) and np.isnan(result["mean"][2])
+    assert result["start"][0] == int(datetime(2024, 1, 1).timestamp() - datetime(1970, 1, 1).timestamp())
+
+    # fixed steps with vectorized chunks of epochs
+    agg = BucketAggregator.from_step(datetime(2024, 1, 1), datetime(2024, 1, 1, 1), "15min", unit="ms")
+    base = int(np.datetime64("2024-01-01T00:00", "ms").astype(np.int64))
+    epochs = base + np.arange(0, 3_600_000, 60_000)
+    agg.add(epochs[::-1], np.ones(len(epochs)))
+    agg.add(np.array([base - 1, base + 3_600_000]), np.array([1.0, 1.0]))
+    assert agg.count.tolist() == [15, 15, 15, 15]
+    assert agg.dropped == 2
+    assert len(agg.count) == 4
+
+    # naive events are not read as UTC for aware intervals
+    tz = ZoneInfo("Europe/Berlin")
+    agg = BucketAggregator(create_intervals(datetime(2024, 1, 1, tzinfo=tz), datetime(2024, 1, 3, tzinfo=tz), 1))
+    agg.add([datetime(2024, 1, 1, 23, 30, tzinfo=tz)])
+    assert agg.count.tolist() == [1, 0]
+    with pytest.raises(TypeError, match="offset-naive and offset-aware"):
+        agg.add([datetime(2024, 1, 1, 23, 30)])
+
+
+def test_partition_range() -> None:
+    """Test the balanced work partitioner."""
+    import numpy as np
+
+    from time_helper import partition_range
+
+    # uniform work gives equal ranges
+    parts = partition_range("2024-01-01", "2024-01-05", 4)
+    assert [start for start, _ in parts] == [datetime(2024, 1, d) for d in range(1, 5)]
+    assert parts[-1][1] == datetime(2024, 1, 5)
+
+    # a sample with most events on the first day, cut points snapped to full hours
+    sample = np.concatenate(
+        [
+            np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-01-02"), np.timedelta64(1, "m")),
+            np.arange(np.datetime64("2024-01-02"), np.datetime64("2024-01-05"), np.timedelta64(1, "h")),
+        ]
+    )
+    parts = partition_range("2024-01-01", "2024-01-05", 4, density=sample, align="H")
+    assert [end for _, end in parts] == [
+        datetime(2024, 1, 1, 6),
+        datetime(2024, 1, 1, 13),
+        datetime(2024, 1, 1, 19),
+        datetime(2024, 1, 5),
+    ]
+
+    # histogram of epochs, cut points that collapse on the alignment are merged
+    edges = np.array(["2024-01-01", "2024-01-02", "2024-01-05"], dtype="datetime64[s]").astype(np.int64)
+    hist = (edges, [6, 2])
+    parts = partition_range("2024-01-01", "2024-01-05", 2, density=hist)
+    assert parts[0][1] == datetime(2024, 1, 1, 16)
+    parts = partition_range("2024-01-01", "2024-01-05", 4, density=hist, align="D")
+    assert [end for _, end in parts] == [datetime(2024, 1, 2), datetime(2024, 1, 5)]
+
+    with pytest.raises(ValueError, match="End has to be after start"):
+        partition_range("2024-01-05", "2024-01-01", 2)
+
+
+def test_iter_windows() -> None:
+    """Test the sliding windows and their streaming aggregation."""
+    import math
+    from zoneinfo import ZoneInfo
+
+    from time_helper import create_window_arrays, iter_window_aggregates, iter_windows
+
+    # hourly windows every 15 minutes that fit into the range
+    windows = iter_windows("2024-01-01", "2024-01-01 03:00", width="1H", stride="15min")
+    assert len(windows) == 9
+    assert windows[1] == (datetime(2024, 1, 1, 0, 15), datetime(2024, 1, 1, 1, 15))
+    assert windows[-1] == (datetime(2024, 1, 1, 2), datetime(2024, 1, 1, 3))
+    partial = iter_windows("2024-01-01", "2024-01-01 03:00", width="1H", stride="15min", partial=True)
+    assert len(partial) == 12
+    assert partial[-1] == (datetime(2024, 1, 1, 2, 45), datetime(2024, 1, 1, 3))
+    assert len(iter_windows("2024-01-01", "2024-01-01 00:30", width="1H")) == 0
+
+    # columnar windows step along the wall clock of aware datetimes
+    tz = ZoneInfo("Europe/Berlin")
+    start, end = datetime(2024, 3, 31, 0, tzinfo=tz), datetime(2024, 3, 31, 5, tzinfo=tz)
+    starts, ends = create_window_arrays(start, end, width="2H", stride="1H", as_datetime64=False)
+    expected = list(iter_windows(start, end, width="2H", stride="1H"))
+    assert starts.tolist() == [int(s.timestamp()) for s, _ in expected]
+    assert ends.tolist() == [int(e.timestamp()) for _, e in expected]
+
+    # incremental aggregation with overlapping windows (events before the first window are dropped)
+    events = [(datetime(2024, 1, 1) + timedelta(minutes=10 * i), float(i)) for i in range(-1, 18)]
+    result = list(iter_window_aggregates(events, windows))
+    assert len(result) == len(windows)
+    assert result[0][2:] == (6, 15.0, 0.0, 5.0)
+    assert result[1][2:] == (6, 27.0, 2.0, 7.0)
+    assert result[-1][:2] == windows[-1]
+    assert result[-1][2:] == (6, 87.0, 12.0, 17.0)
+
+    # empty windows
+    gaps = iter_windows("2024-01-01", "2024-01-01 01:00", width="10min", stride="30min")
+    _, _, count, total, low, high = list(iter_window_aggregates(events[:2], gaps))[1]
+    assert (count, total) == (0, 0.0)
+    assert math.isnan(low) and math.isnan(high)
+
+    with pytest.raises(ValueError, match="sorted by time"):
+        list(iter_window_aggregates(events[::-1], windows))
+    with pytest.raises(TypeError, match="offset-naive and offset-aware"):
+        list(iter_window_aggregates([(datetime(2024, 1, 1, tzinfo=ZoneInfo("UTC")), 1.0)], windows))
+
+    # without numpy the conversion of the events reports the missing library
+    from unittest.mock import patch
+
+    with patch("time_helper.intervals.np", None), pytest.raises(ImportError, match="Numpy Library is not installed"):
+        list(iter_window_aggregates(events, windows))
@@ -0,0 +1,66 @@
+"""Tests for the TZif zone file reader."""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from time_helper.tzfile import PosixRule, load_tzif, parse_posix_rule, read_tzif
+
+
+def _utc(*args: int) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp())
+
+
+def test_parse_posix_rule() -> None:
+    """Test parsing of the different POSIX TZ string variants."""
+    assert parse_posix_rule("JST-9") == PosixRule(9 * 3600)
+    assert parse_posix_rule("<+0530>-5:30") == PosixRule(5 * 3600 + 1800)
+
+    rule = parse_posix_rule("CET-1CEST,M3.5.0,M10.5.0/3")
+    assert rule == PosixRule(3600, 7200, ("M", 3, 5, 0), 7200, ("M", 10, 5, 0), 3 * 3600)
+
+    # negative rule times (v3 extension)
+    rule = parse_posix_rule("<-02>2<-01>,M3.5.0/-1,M10.5.0/0")
+    assert rule is not None
+    assert rule.start_time == -3600
+    assert rule.dst_offset == -3600
+
+    assert parse_posix_rule("") is None
+    assert parse_posix_rule("not a rule") is None
+
+
+def test_posix_rule_transitions() -> None:
+    """Test the computed transition instants of a rule."""
+    rule = parse_posix_rule("CET-1CEST,M3.5.0,M10.5.0/3")
+    assert rule is not None
+    assert rule.transitions(2024) == [_utc(2024, 3, 31, 1), _utc(2024, 10, 27, 1)]
+
+    # southern hemisphere (end before start) and 24:00 rule times
+    rule = parse_posix_rule("<-04>4<-03>,M9.1.6/24,M4.1.6/24")
+    assert rule is not None
+    assert rule.transitions(2024) == [_utc(2024, 4, 7, 3), _utc(2024, 9, 8, 4)]
+
+    # julian days never count february 29th
+    rule = parse_posix_rule("XXX0YYY,J60/0,300/0")
+    assert rule is not None
+    assert rule.transitions(2024) == [_utc(2024, 3, 1), _utc(2024, 10, 26, 23)]
+
+    assert PosixRule(0).transitions(2024) == []
+
+
+def test_load_tzif() -> None:
+    """Test loading zone files for timezone objects."""
+    data = load_tzif(ZoneInfo("Europe/Berlin"))
+    assert data is not None
+    assert _utc(2024, 3, 31, 1) in data.transitions or data.rule is not None
+    assert data.rule == parse_posix_rule("CET-1CEST,M3.5.0,M10.5.0/3")
+    assert list(data.transitions) == sorted(data.transitions)
+
+    assert load_tzif(timezone.utc) is None
+
+
+def test_read_tzif_invalid() -> None:
+    """Test that invalid data is rejected."""
+    with pytest.raises(ValueError, match="Invalid TZif data"):
+        read_tzif(b"XXXX" + b"\0" * 40)
@@ -3,7 +3,9 @@
 __version__ = "0.3.1"
 
 from . import const
+from .business import BusinessCalendar, add_business_days, business_days_between, roll_backward, roll_forward
 from .natural import parse_natural
+from .civil import CivilFields, civil_fields, compose_epochs
 from .convert import (
     any_to_datetime,
     convert_to_datetime,
@@ -11,36 +13,117 @@ from .convert import (
     make_aware,
     make_unaware,
     parse_time,
+    to_epoch_array,
     unix_to_datetime,
 )
-from .dst import get_dst_transitions, is_dst_active, next_dst_transition
-from .ops import has_timezone, round_time, time_diff
-from .range import create_intervals, time_to_interval
+from .dst import (
+    DSTCalendar,
+    classify_local_times,
+    dst_calendar,
+    get_dst_transitions,
+    is_dst_active,
+    is_dst_active_many,
+    iter_dst_transitions,
+    localize_many,
+    next_dst_transition,
+    previous_dst_transition,
+    utcoffset_many,
+)
+from .ops import (
+    TimezoneScan,
+    asof_match,
+    has_timezone,
+    round_time,
+    round_time_many,
+    scan_timezones,
+    time_diff,
+    time_diff_many,
+)
+from .features import TimeFeatures, time_features
+from .intervals import IntervalIndex, IntervalSet, iter_overlaps, overlap_join
+from .range import (
+    BucketAggregator,
+    CalendarIntervals,
+    IntervalScaler,
+    IntervalSequence,
+    WindowSequence,
+    bucket_aggregate,
+    calendar_intervals,
+    create_interval_arrays,
+    create_intervals,
+    create_window_arrays,
+    iter_intervals,
+    iter_window_aggregates,
+    iter_windows,
+    partition_range,
+    time_to_interval,
+)
 from .timezone import current_timezone, find_timezone
 from .wrapper import DateTimeWrapper
 
 parse_date = any_to_datetime
 
 __all__ = [
+    "BucketAggregator",
+    "BusinessCalendar",
+    "CalendarIntervals",
+    "CivilFields",
+    "DSTCalendar",
     "DateTimeWrapper",
+    "IntervalIndex",
+    "IntervalScaler",
+    "IntervalSequence",
+    "IntervalSet",
+    "TimeFeatures",
+    "TimezoneScan",
+    "WindowSequence",
+    "add_business_days",
     "any_to_datetime",
+    "asof_match",
+    "bucket_aggregate",
+    "business_days_between",
+    "calendar_intervals",
+    "civil_fields",
+    "classify_local_times",
+    "compose_epochs",
     "const",
     "convert_to_datetime",
+    "create_interval_arrays",
     "create_intervals",
+    "create_window_arrays",
     "current_timezone",
+    "dst_calendar",
     "find_timezone",
     "get_dst_transitions",
     "has_timezone",
     "is_dst_active",
+    "is_dst_active_many",
+    "iter_dst_transitions",
+    "iter_intervals",
+    "iter_overlaps",
+    "iter_window_aggregates",
+    "iter_windows",
     "localize_datetime",
+    "localize_many",
     "make_aware",
     "make_unaware",
     "next_dst_transition",
+    "overlap_join",
     "parse_date",
     "parse_natural",
     "parse_time",
+    "partition_range",
+    "previous_dst_transition",
+    "roll_backward",
+    "roll_forward",
     "round_time",
+    "round_time_many",
+    "scan_timezones",
     "time_diff",
+    "time_diff_many",
+    "time_features",
     "time_to_interval",
+    "to_epoch_array",
     "unix_to_datetime",
+    "utcoffset_many",
 ]
@@ -0,0 +1,350 @@
+"""Business day arithmetic based on a weekmask and holiday calendars.
+
+Business days are precomputed for the range of the calendar tables (see `time_helper.civil`), so that
+offsets and counts are O(1) lookups for single dates and vectorized lookups for numpy arrays. Single dates
+outside of this range fall back to walking the days.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from datetime import date, datetime, timedelta
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from .civil import FIRST_YEAR, LAST_YEAR, YEAR_STARTS
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_FIRST_DAY = YEAR_STARTS[0]
+_LAST_DAY = YEAR_STARTS[-1]
+
+
+def _parse_weekmask(weekmask: str | Sequence[bool | int]) -> tuple[bool, ...]:
+    """Parses a weekmask ("1111100", "Mon Tue Wed Thu Fri" or a sequence of 7 flags)."""
+    if isinstance(weekmask, str):
+        text = weekmask.strip().lower()
+        if len(text) == 7 and set(text) <= {"0", "1"}:
+            mask = tuple(char == "1" for char in text)
+        else:
+            names = {name[:3] for name in text.replace(",", " ").split()}
+            if not names <= set(WEEKDAY_NAMES):
+                raise ValueError(f"Invalid weekmask: {weekmask}")
+            mask = tuple(name in names for name in WEEKDAY_NAMES)
+    else:
+        mask = tuple(bool(flag) for flag in weekmask)
+    if len(mask) != 7:
+        raise ValueError(f"Invalid weekmask: {weekmask}")
+    if not any(mask):
+        raise ValueError("The weekmask requires at least one business day")
+    return mask
+
+
+def _to_date(value: date | str) -> date:
+    """Converts a date, datetime or ISO string into a date."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+class BusinessCalendar:
+    """Business days defined by a weekmask and a set of holidays.
+
+    Offsets follow the convention of `parse_natural`: adding `n > 0` business days returns the n-th
+    business day after the date, `n < 0` the n-th business day before it and `n = 0` rolls forward.
+    """
+
+    def __init__(self, weekmask: str | Sequence[bool | int] = "1111100", holidays: Iterable[date | str] = ()) -> None:
+        """Creates the calendar.
+
+        Args:
+            weekmask: Business weekdays from monday to sunday ("1111100", "Mon Tue Wed Thu Fri" or 7 flags)
+            holidays: Dates (or ISO strings) that are no business days
+        """
+        self.weekmask = _parse_weekmask(weekmask)
+        self.holidays = frozenset(_to_date(day) for day in holidays)
+
+        # holiday bitmap and business flags of all days in the table range
+        flags = bytearray(self.weekmask[(day + 3) % 7] for day in range(_FIRST_DAY, _LAST_DAY))
+        for holiday in self.holidays:
+            day = holiday.toordinal() - _EPOCH_ORDINAL
+            if _FIRST_DAY <= day < _LAST_DAY:
+                flags[day - _FIRST_DAY] = 0
+
+        # number of business days before each day and the days of each business day rank
+        self._counts = array("i", accumulate(flags, initial=0))
+        self._days = array("i", (i + _FIRST_DAY for i, flag in enumerate(flags) if flag))
+
+    @classmethod
+    def from_file(cls, path: str | Path, weekmask: str | Sequence[bool | int] = "1111100") -> BusinessCalendar:
+        """Loads the holidays from a local file.
+
+        The file contains one ISO date (YYYY-MM-DD) per line, further comma separated columns (e.g. the name
+        of the holiday) as well as blank lines and `#` comments are ignored.
+
+        Args:
+            path: Path of the holiday file
+            weekmask: Business weekdays from monday to sunday
+
+        Returns:
+            Calendar with the holidays of the file
+        """
+        holidays = []
+        for line in Path(path).read_text().splitlines():
+            value = line.split("#", 1)[0].split(",", 1)[0].strip()
+            if value:
+                holidays.append(date.fromisoformat(value))
+        return cls(weekmask, holidays)
+
+    def __repr__(self) -> str:
+        """Return the weekmask and number of holidays."""
+        mask = "".join("1" if flag else "0" for flag in self.weekmask)
+        return f"BusinessCalendar(weekmask={mask!r}, holidays={len(self.holidays)})"
+
+    # scalar helpers (days since the unix epoch)
+    def _is_business(self, day: int) -> bool:
+        """Checks a day against the weekmask and the holidays (without the tables)."""
+        return self.weekmask[(day + 3) % 7] and date.fromordinal(day + _EPOCH_ORDINAL) not in self.holidays
+
+    def _rank(self, day: int) -> int:
+        """Returns the number of business days before the day (relative to the start of the tables)."""
+        if day < _FIRST_DAY:
+            return -self._count(day, _FIRST_DAY)
+        if day > _LAST_DAY:
+            return self._counts[-1] + self._count(_LAST_DAY, day)
+        return self._counts[day - _FIRST_DAY]
+
+    def _count(self, start: int, end: int) -> int:
+        """Counts the business days in `[start, end)` from the weekmask and the holidays."""
+        weeks, rest = divmod(end - start, 7)
+        count = weeks * sum(self.weekmask) + sum(self.weekmask[(start + i + 3) % 7] for i in range(rest))
+        for holiday in self.holidays:
+            day = holiday.toordinal() - _EPOCH_ORDINAL
+            count -= start <= day < end and self.weekmask[(day + 3) % 7]
+        return count
+
+    def _shift(self, day: int, days: int, step: int = 1) -> int:
+        """Moves a day by business days (`days = 0` rolls in the direction of `step`)."""
+        if _FIRST_DAY <= day < _LAST_DAY:
+            index = day - _FIRST_DAY
+            if days > 0 or (days == 0 and step < 0):
+                rank = self._counts[index + 1] + days - 1
+            else:
+                rank = self._counts[index] + days
+            if 0 <= rank < len(self._days):
+                return self._days[rank]
+
+        # walk the days outside of the tables
+        if days:
+            step = 1 if days > 0 else -1
+        elif self._is_business(day):
+            return day
+        remaining = max(abs(days), 1)
+        while remaining:
+            day += step
+            remaining -= self._is_business(day)
+        return day
+
+    def is_business_day(self, value: Any) -> Any:
+        """Checks if the dates are business days.
+
+        Args:
+            value: Date or datetime (or array-like of dates)
+
+        Returns:
+            bool (or boolean numpy array)
+        """
+        if isinstance(value, (date, str)):
+            day = _to_date(value).toordinal() - _EPOCH_ORDINAL
+            if _FIRST_DAY <= day < _LAST_DAY:
+                return self._counts[day - _FIRST_DAY + 1] > self._counts[day - _FIRST_DAY]
+            return self._is_business(day)
+        index, nat = self._array_index(value)
+        counts = self._np_counts
+        return (counts[index + 1] > counts[index]) & ~nat
+
+    def add_business_days(self, value: Any, days: Any) -> Any:
+        """Moves the dates by a number of business days (keeping the time of datetimes).
+
+        Args:
+            value: Date or datetime (or array-like of dates/datetime64)
+            days: Number of business days (int or array)
+
+        Returns:
+            Shifted date(s) of the same type
+        """
+        if isinstance(value, (date, str)):
+            value = _to_date(value) if isinstance(value, str) else value
+            day = _to_date(value).toordinal() - _EPOCH_ORDINAL
+            return value + timedelta(days=self._shift(day, days) - day)
+
+        index, nat = self._array_index(value)
+        days = np.asarray(days, dtype=np.int64)
+        counts = self._np_counts
+        rank = np.where(days > 0, counts[index + 1] + days - 1, counts[index] + days)
+        return self._shift_array(value, index, rank, nat)
+
+    def roll_forward(self, value: Any) -> Any:
+        """Moves dates that are no business days to the next business day.
+
+        Args:
+            value: Date or datetime (or array-like of dates/datetime64)
+
+        Returns:
+            Rolled date(s) of the same type
+        """
+        return self.add_business_days(value, 0)
+
+    def roll_backward(self, value: Any) -> Any:
+        """Moves dates that are no business days to the previous business day.
+
+        Args:
+            value: Date or datetime (or array-like of dates/datetime64)
+
+        Returns:
+            Rolled date(s) of the same type
+        """
+        if isinstance(value, (date, str)):
+            value = _to_date(value) if isinstance(value, str) else value
+            day = _to_date(value).toordinal() - _EPOCH_ORDINAL
+            return value + timedelta(days=self._shift(day, 0, -1) - day)
+
+        index, nat = self._array_index(value)
+        return self._shift_array(value, index, self._np_counts[index + 1] - 1, nat)
+
+    def business_days_between(self, start: Any, end: Any) -> Any:
+        """Counts the business days in `[start, end)` (negative if end is before start).
+
+        Args:
+            start: Date or datetime (or array-like of dates/datetime64)
+            end: Date or datetime (or array-like of dates/datetime64)
+
+        Returns:
+            int (or int64 numpy array)
+        """
+        if isinstance(start, (date, str)) and isinstance(end, (date, str)):
+            first = _to_date(start).toordinal() - _EPOCH_ORDINAL
+            last = _to_date(end).toordinal() - _EPOCH_ORDINAL
+            return self._rank(last) - self._rank(first)
+
+        first, nat_first = self._array_index(start)
+        last, nat_last = self._array_index(end)
+        counts = self._np_counts
+        if (nat_first | nat_last).any():
+            raise ValueError("Unable to count business days of missing dates")
+        return counts[last] - counts[first]
+
+    # vectorized helpers
+    @cached_property
+    def _np_counts(self) -> Any:
+        """Business day counts as numpy array."""
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        return np.frombuffer(self._counts, dtype=np.int32).astype(np.int64)
+
+    @cached_property
+    def _np_days(self) -> Any:
+        """Days of the business day ranks as numpy array."""
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        return np.frombuffer(self._days, dtype=np.int32).astype(np.int64)
+
+    def _array_index(self, values: Any) -> tuple[Any, Any]:
+        """Returns the table positions and the missing mask of an array of dates."""
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        days_array = _as_datetime64(values).astype("datetime64[D]")
+        nat = np.isnat(days_array)
+        days = np.where(nat, _FIRST_DAY, days_array.view(np.int64))
+        if (days < _FIRST_DAY).any() or (days >= _LAST_DAY).any():
+            raise ValueError(f"Date outside of the business calendar range {FIRST_YEAR}-{LAST_YEAR}")
+        return days - _FIRST_DAY, nat
+
+    def _shift_array(self, values: Any, index: Any, rank: Any, nat: Any) -> Any:
+        """Moves each date to the business day of the given rank."""
+        rank = np.where(nat, 0, rank)
+        if (rank < 0).any() or (rank >= len(self._days)).any():
+            raise ValueError(f"Date outside of the business calendar range {FIRST_YEAR}-{LAST_YEAR}")
+        delta = (self._np_days[rank] - (index + _FIRST_DAY)).astype("timedelta64[D]")
+        delta[nat] = np.timedelta64("NaT")
+        return _as_datetime64(values) + delta
+
+
+def _as_datetime64(values: Any) -> Any:
+    """Converts array-like dates into a numpy datetime64 array."""
+    arr = np.asarray(values)
+    if not np.issubdtype(arr.dtype, np.datetime64):
+        dates_only = all(isinstance(value, str) or type(value) is date for value in arr.flat)
+        arr = arr.astype("datetime64[D]" if dates_only else "datetime64[us]")
+    return arr
+
+
+@lru_cache(maxsize=1)
+def default_calendar() -> BusinessCalendar:
+    """Returns the calendar of monday to friday without holidays."""
+    return BusinessCalendar()
+
+
+def add_business_days(value: Any, days: Any, calendar: BusinessCalendar | None = None) -> Any:
+    """Moves dates by a number of business days (see `BusinessCalendar.add_business_days`).
+
+    Args:
+        value: Date or datetime (or array-like of dates/datetime64)
+        days: Number of business days (int or array)
+        calendar: Business calendar (monday to friday without holidays if None)
+
+    Returns:
+        Shifted date(s)
+    """
+    return (calendar or default_calendar()).add_business_days(value, days)
+
+
+def business_days_between(start: Any, end: Any, calendar: BusinessCalendar | None = None) -> Any:
+    """Counts the business days in `[start, end)` (see `BusinessCalendar.business_days_between`).
+
+    Args:
+        start: Date or datetime (or array-like of dates/datetime64)
+        end: Date or datetime (or array-like of dates/datetime64)
+        calendar: Business calendar (monday to friday without holidays if None)
+
+    Returns:
+        Number(s) of business days
+    """
+    return (calendar or default_calendar()).business_days_between(start, end)
+
+
+def roll_forward(value: Any, calendar: BusinessCalendar | None = None) -> Any:
+    """Moves dates that are no business days to the next business day.
+
+    Args:
+        value: Date or datetime (or array-like of dates/datetime64)
+        calendar: Business calendar (monday to friday without holidays if None)
+
+    Returns:
+        Rolled date(s)
+    """
+    return (calendar or default_calendar()).roll_forward(value)
+
+
+def roll_backward(value: Any, calendar: BusinessCalendar | None = None) -> Any:
+    """Moves dates that are no business days to the previous business day.
+
+    Args:
+        value: Date or datetime (or array-like of dates/datetime64)
+        calendar: Business calendar (monday to friday without holidays if None)
+
+    Returns:
+        Rolled date(s)
+    """
+    return (calendar or default_calendar()).roll_backward(value)
@@ -0,0 +1,300 @@
+"""Calendar lookup tables and civil date arithmetic.
+
+Month and year boundaries are precomputed for the years `FIRST_YEAR` to `LAST_YEAR` as compact arrays
+of days since the unix epoch, so that lookups are O(1) instead of date arithmetic.
+"""
+
+from __future__ import annotations
+
+from array import array
+from calendar import monthrange
+from datetime import date
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from datetime import tzinfo
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+# range of years covered by the lookup tables
+FIRST_YEAR = 1900
+LAST_YEAR = 2200
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# days from 0000-03-01 to 1970-01-01 and days per 400 year era (proleptic gregorian calendar)
+_EPOCH_SHIFT = 719_468
+_ERA_DAYS = 146_097
+
+
+class CivilFields(NamedTuple):
+    """Calendar fields of an array of instants (-1 for missing values)."""
+
+    year: Any
+    month: Any
+    day: Any
+    hour: Any
+    minute: Any
+    second: Any
+    weekday: Any
+    day_of_year: Any
+
+
+def _build_tables() -> tuple[array[int], array[int], array[int], array[int]]:
+    """Computes the month lengths, month starts, year starts and ISO week starts of the table range."""
+    month_days: array[int] = array("B")
+    month_starts: array[int] = array("i")
+    year_starts: array[int] = array("i")
+    iso_week_starts: array[int] = array("i")
+
+    for year in range(FIRST_YEAR, LAST_YEAR + 2):
+        start = date(year, 1, 1).toordinal() - _EPOCH_ORDINAL
+        year_starts.append(start)
+        # ISO week 1 is the week containing january 4th
+        jan4 = start + 3
+        iso_week_starts.append(jan4 - date(year, 1, 4).weekday())
+        if year > LAST_YEAR:
+            month_starts.append(start)
+            break
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        for days in (31, 29 if leap else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31):
+            month_starts.append(start)
+            month_days.append(days)
+            start += days
+
+    return month_days, month_starts, year_starts, iso_week_starts
+
+
+# MONTH_DAYS[i] / MONTH_STARTS[i] describe month `i % 12 + 1` of year `FIRST_YEAR + i // 12`
+# (MONTH_STARTS, YEAR_STARTS and ISO_WEEK_STARTS hold one extra entry for the year after LAST_YEAR)
+MONTH_DAYS, MONTH_STARTS, YEAR_STARTS, ISO_WEEK_STARTS = _build_tables()
+
+
+def _in_table(year: int) -> bool:
+    """Checks if the year is covered by the lookup tables."""
+    return FIRST_YEAR <= year <= LAST_YEAR
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Returns the number of days of the month.
+
+    Args:
+        year: Year of the month
+        month: Month (1-12)
+
+    Returns:
+        Number of days (28-31)
+    """
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month: {month}")
+    if _in_table(year):
+        return MONTH_DAYS[(year - FIRST_YEAR) * 12 + month - 1]
+    return monthrange(year, month)[1]
+
+
+def month_start(year: int, month: int) -> int:
+    """Returns the first day of the month as days since the unix epoch.
+
+    Args:
+        year: Year of the month
+        month: Month (1-12)
+
+    Returns:
+        Days since 1970-01-01
+    """
+    if not 1 <= month <= 12:
+        raise ValueError(f"Invalid month: {month}")
+    if _in_table(year):
+        return MONTH_STARTS[(year - FIRST_YEAR) * 12 + month - 1]
+    return date(year, month, 1).toordinal() - _EPOCH_ORDINAL
+
+
+def year_start(year: int) -> int:
+    """Returns january 1st of the year as days since the unix epoch.
+
+    Args:
+        year: The year
+
+    Returns:
+        Days since 1970-01-01
+    """
+    if _in_table(year):
+        return YEAR_STARTS[year - FIRST_YEAR]
+    return date(year, 1, 1).toordinal() - _EPOCH_ORDINAL
+
+
+def iso_week_start(year: int) -> int:
+    """Returns the monday of ISO week 1 of the (ISO) year as days since the unix epoch.
+
+    Args:
+        year: The ISO year
+
+    Returns:
+        Days since 1970-01-01
+    """
+    if _in_table(year):
+        return ISO_WEEK_STARTS[year - FIRST_YEAR]
+    return date.fromisocalendar(year, 1, 1).toordinal() - _EPOCH_ORDINAL
+
+
+def day_of_year(year: int, month: int, day: int) -> int:
+    """Returns the day of the year (1-366).
+
+    Args:
+        year: The year
+        month: Month (1-12)
+        day: Day of the month
+
+    Returns:
+        Day of the year
+    """
+    return month_start(year, month) - year_start(year) + day
+
+
+@lru_cache(maxsize=1)
+def calendar_arrays() -> tuple[Any, Any, Any, Any]:
+    """Returns the lookup tables as read-only int64 numpy arrays.
+
+    Returns:
+        Tuple of month lengths, month starts, year starts and ISO week starts (days since the unix epoch)
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    tables = []
+    for table in (MONTH_DAYS, MONTH_STARTS, YEAR_STARTS, ISO_WEEK_STARTS):
+        values = np.frombuffer(table, dtype=np.dtype(table.typecode)).astype(np.int64)
+        values.flags.writeable = False
+        tables.append(values)
+    return tables[0], tables[1], tables[2], tables[3]
+
+
+def civil_from_days(days: Any) -> tuple[Any, Any, Any]:
+    """Converts days since the unix epoch into year, month and day.
+
+    Uses the branch-free algorithm by Howard Hinnant, so it works on python ints and numpy arrays alike.
+
+    Args:
+        days: Days since 1970-01-01 (int or int64 array)
+
+    Returns:
+        Tuple of year, month (1-12) and day (1-31)
+    """
+    shifted = days + _EPOCH_SHIFT
+    era = shifted // _ERA_DAYS
+    day_of_era = shifted - era * _ERA_DAYS
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    # months are counted from march, so that the leap day is the last day of the year
+    month_index = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month_index + 2) // 5 + 1
+    month = month_index + 3 - 12 * (month_index >= 10)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def days_from_civil(year: Any, month: Any, day: Any) -> Any:
+    """Converts year, month and day into days since the unix epoch (inverse of `civil_from_days`).
+
+    Args:
+        year: Year (int or int64 array)
+        month: Month (1-12)
+        day: Day of the month
+
+    Returns:
+        Days since 1970-01-01
+    """
+    year = year - (month <= 2)
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * _ERA_DAYS + day_of_era - _EPOCH_SHIFT
+
+
+def civil_fields(values: Any, timezone: str | tzinfo | None = None, unit: str = "s") -> CivilFields:
+    """Decomposes an array of instants into calendar fields without creating datetime objects.
+
+    Args:
+        values: int64 epoch array, datetime64 array or pandas Series
+        timezone: Timezone whose wall clock is decomposed (defaults to the timezone of an aware Series, else UTC)
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        Field arrays (weekday 0=Monday, day of year 1-366), -1 for missing values
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    from .convert import EPOCH_UNITS, NAT, to_epoch_array
+    from .dst import _array_timezone, _lookup_offsets
+
+    epochs = to_epoch_array(values, unit)
+    nat = epochs == NAT
+    seconds = np.where(nat, 0, epochs // EPOCH_UNITS[unit])
+    if timezone is not None or getattr(getattr(values, "dt", None), "tz", None) is not None:
+        seconds += _lookup_offsets(_array_timezone(values, timezone), epochs, unit)[0]
+
+    days, secs = np.divmod(seconds, 86_400)
+    year, month, day = civil_from_days(days)
+    fields = CivilFields(
+        year,
+        month,
+        day,
+        secs // 3600,
+        secs // 60 % 60,
+        secs % 60,
+        (days + 3) % 7,
+        days - days_from_civil(year, 1, 1) + 1,
+    )
+    for field in fields:
+        field[nat] = -1
+    return fields
+
+
+def compose_epochs(
+    year: Any,
+    month: Any = 1,
+    day: Any = 1,
+    hour: Any = 0,
+    minute: Any = 0,
+    second: Any = 0,
+    timezone: str | tzinfo | None = None,
+    unit: str = "s",
+    ambiguous: str = "raise",
+    nonexistent: str = "raise",
+) -> Any:
+    """Composes epochs from arrays of calendar fields (inverse of `civil_fields`).
+
+    Args:
+        year: Years (int or array)
+        month: Months (1-12)
+        day: Days of the month
+        hour: Hours
+        minute: Minutes
+        second: Seconds
+        timezone: Timezone of the wall clock fields (UTC if None)
+        unit: Unit of the resulting epochs (s, ms, us or ns)
+        ambiguous: Policy for ambiguous wall times (see `localize_many`)
+        nonexistent: Policy for nonexistent wall times (see `localize_many`)
+
+    Returns:
+        int64 numpy array of epochs
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    from .convert import EPOCH_UNITS
+
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"Invalid epoch unit: {unit}")
+    days = days_from_civil(np.asarray(year, dtype=np.int64), np.asarray(month, dtype=np.int64), np.asarray(day))
+    seconds = days * 86_400 + np.asarray(hour) * 3600 + np.asarray(minute) * 60 + np.asarray(second)
+    epochs = np.atleast_1d(seconds * EPOCH_UNITS[unit]).astype(np.int64)
+    if timezone is None:
+        return epochs
+
+    from .dst import localize_many
+
+    return localize_many(epochs, timezone, ambiguous=ambiguous, nonexistent=nonexistent, unit=unit)
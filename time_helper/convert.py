@@ -49,6 +49,12 @@ except Exception:
     np = None  # type: ignore[assignment]
     nparray = None  # type: ignore[assignment]
 
+# ticks per second for the supported epoch units
+EPOCH_UNITS = {"s": 1, "ms": 1_000, "us": 1_000_000, "ns": 1_000_000_000}
+
+# integer value used for missing entries (NaT) in epoch arrays
+NAT = -(2**63)
+
 
 def parse_time(time_str: str, format: str, timezone: tzinfo | timezone | str) -> datetime:
     """Parses the given time based on the format and timezone (if provdied).
@@ -248,6 +254,57 @@ def localize_datetime(dt: datetime | None, tz: Any | str | timezone | None = Non
     return dt.astimezone(tz)
 
 
+def to_epoch_array(values: Any, unit: str = "s") -> Any:
+    """Converts array-like datetime values into an int64 numpy array of unix epochs.
+
+    Integer arrays are assumed to already hold epochs in `unit`. Naive datetime64 values are taken as UTC,
+    timezone-aware pandas Series are converted to UTC. Missing values are set to `NAT`.
+
+    Args:
+        values: numpy array (int64 or datetime64), pandas Series or sequence of these values
+        unit: Unit of the resulting epochs (s, ms, us or ns)
+
+    Returns:
+        int64 numpy array of epochs
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"Invalid epoch unit: {unit}")
+
+    # unwrap pandas objects
+    if Series is not None and isinstance(values, Series):
+        if is_datetime(values) and values.dt.tz is not None:
+            values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+        values = values.to_numpy()
+    arr = np.asarray(values)
+
+    if np.issubdtype(arr.dtype, np.datetime64):
+        src_unit, _ = np.datetime_data(arr.dtype)
+        if src_unit not in EPOCH_UNITS:
+            arr = arr.astype("datetime64[s]")
+            src_unit = "s"
+        nat = np.isnat(arr)
+        epochs = _rescale_epochs(arr.view(np.int64), EPOCH_UNITS[src_unit], EPOCH_UNITS[unit])
+    elif np.issubdtype(arr.dtype, np.integer):
+        return arr.astype(np.int64)
+    elif np.issubdtype(arr.dtype, np.floating):
+        nat = np.isnan(arr)
+        epochs = np.floor(np.where(nat, 0, arr)).astype(np.int64)
+    else:
+        raise ValueError(f"Unable to convert values of type {arr.dtype} into epochs")
+
+    epochs[nat] = NAT
+    return epochs
+
+
+def _rescale_epochs(epochs: Any, src_ticks: int, dst_ticks: int) -> Any:
+    """Converts int64 epochs between units (rounding towards negative infinity)."""
+    if dst_ticks >= src_ticks:
+        return epochs * (dst_ticks // src_ticks)
+    return epochs // (src_ticks // dst_ticks)
+
+
 def make_aware(
     dt: datetime | str | Any,
     tz: str | timezone | Any = None,
@@ -297,7 +354,12 @@ def make_aware(
 
 
 def make_aware_pandas(
-    df: Series | DataFrame, col: str, format: str | None = None, tz: str | timezone | None = None
+    df: Series | DataFrame,
+    col: str,
+    format: str | None = None,
+    tz: str | timezone | None = None,
+    ambiguous: str | None = None,
+    nonexistent: str | None = None,
 ) -> Series | DataFrame:
     """This will make the pandas column datetime aware in the specified timezone.
 
@@ -308,6 +370,8 @@ def make_aware_pandas(
         col: name of the column to convert
         format: Default format to try
         timezone: default timezone to convert to
+        ambiguous: Policy for naive times in a DST fold (raise, earliest, latest or NaT)
+        nonexistent: Policy for naive times in a DST gap (raise, shift_forward, shift_backward or NaT)
 
     Returns:
         Updated DataFrame
@@ -342,12 +406,15 @@ def make_aware_pandas(
     if not hasattr(df[col].iloc[0], "tzinfo") or not df[col].iloc[0].tzinfo:
         cur_tz_obj = current_timezone()
         cur_tz = getattr(cur_tz_obj, "key", str(cur_tz_obj))
-        try:
-            df[col] = df[col].dt.tz_localize(cur_tz)
-        except AmbiguousTimeError:
-            # Use numpy array if available, otherwise use list
-            infer_dst = nparray([False] * df.shape[0]) if nparray is not None else [False] * df.shape[0]
-            df[col] = df[col].dt.tz_localize(cur_tz, ambiguous=infer_dst)
+        if ambiguous is not None or nonexistent is not None:
+            df[col] = _localize_series(df[col], cur_tz_obj, ambiguous or "raise", nonexistent or "raise")
+        else:
+            try:
+                df[col] = df[col].dt.tz_localize(cur_tz)
+            except AmbiguousTimeError:
+                # Use numpy array if available, otherwise use list
+                infer_dst = nparray([False] * df.shape[0]) if nparray is not None else [False] * df.shape[0]
+                df[col] = df[col].dt.tz_localize(cur_tz, ambiguous=infer_dst)
     if tz is not None:
         # convert to string (as pandas does not support ZoneInfo)
         if isinstance(tz, timezone):
@@ -357,6 +424,18 @@ def make_aware_pandas(
     return df
 
 
+def _localize_series(series: Series, tz: tzinfo, ambiguous: str, nonexistent: str) -> Series:
+    """Localizes a naive datetime series with the given gap and fold policies."""
+    from .dst import localize_many
+
+    # keep the resolution of the series (older pandas versions only support ns)
+    unit = getattr(series.dt, "unit", "ns")
+    utc = localize_many(series, tz, ambiguous=ambiguous, nonexistent=nonexistent, unit=unit)
+    localized = Series(utc.view(f"datetime64[{unit}]"), index=series.index, name=series.name).dt.tz_localize("UTC")
+    result: Series = localized.dt.tz_convert(getattr(tz, "key", str(tz)))
+    return result
+
+
 def make_unaware(dt: datetime | Any, tz: str | tzinfo | timezone = "UTC") -> datetime | None:
     """Makes the given timezone unaware in a default timezone.
 
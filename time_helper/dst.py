@@ -2,11 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import TypedDict
-from zoneinfo import ZoneInfo
-
+import bisect
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypedDict
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError, available_timezones
+
+from pytz import AmbiguousTimeError, NonExistentTimeError
+
+from .convert import EPOCH_UNITS, NAT, Series, is_datetime, to_epoch_array
 from .timezone import find_timezone
+from .tzfile import MAX_INSTANT, MIN_INSTANT, PosixRule, load_tzif
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+# start of the unix epoch (naive, to compute calendar years from instants)
+_EPOCH = datetime(1970, 1, 1)
+_UTC = ZoneInfo("UTC")
+
+# maximum number of (timezone, year) entries kept in the transition cache
+TRANSITION_CACHE_SIZE = 4096
+
+
+# codes of the transition types in a DSTCalendar
+TRANSITION_TYPES = ("fall_back", "spring_forward")
+
+# policies for local times that fall into a DST gap (nonexistent) or fold (ambiguous)
+NONEXISTENT_POLICIES = ("raise", "shift_forward", "shift_backward", "NaT")
+AMBIGUOUS_POLICIES = ("raise", "earliest", "latest", "NaT")
 
 
 class DSTTransition(TypedDict):
@@ -41,9 +72,212 @@ def is_dst_active(dt: datetime | None) -> bool:
     return dst_offset is not None and dst_offset > timedelta(0)
 
 
+def is_dst_active_many(values: Any, timezone: str | tzinfo | None = None, unit: str = "s") -> Any:
+    """Check if DST is active for an array of instants.
+
+    Args:
+        values: int64 epoch array, datetime64 array or timezone-aware pandas Series
+        timezone: Timezone to evaluate in (defaults to the timezone of the Series)
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        Boolean numpy array (False for missing values)
+    """
+    _, dst, _ = _lookup_offsets(_array_timezone(values, timezone), to_epoch_array(values, unit), unit)
+    return dst
+
+
+def utcoffset_many(values: Any, timezone: str | tzinfo | None = None, unit: str = "s") -> Any:
+    """Get the UTC offsets of a timezone for an array of instants.
+
+    Args:
+        values: int64 epoch array, datetime64 array or timezone-aware pandas Series
+        timezone: Timezone to evaluate in (defaults to the timezone of the Series)
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        timedelta64[s] numpy array (NaT for missing values)
+    """
+    offsets, _, nat = _lookup_offsets(_array_timezone(values, timezone), to_epoch_array(values, unit), unit)
+    result = offsets.astype("timedelta64[s]")
+    result[nat] = np.timedelta64("NaT")
+    return result
+
+
+def _array_timezone(values: Any, timezone: str | tzinfo | None) -> tzinfo:
+    """Resolves the timezone for array lookups (falling back to the timezone of a Series)."""
+    if timezone is not None:
+        return _resolve_timezone(timezone)
+    if Series is not None and isinstance(values, Series) and is_datetime(values) and values.dt.tz is not None:
+        tz = find_timezone(values.dt.tz)
+        if tz is not None:
+            return tz
+    raise ValueError("A timezone is required for values without timezone information")
+
+
+def _lookup_offsets(tz: tzinfo, epochs: Any, unit: str) -> tuple[Any, Any, Any]:
+    """Looks up the UTC offset (in seconds) and DST flag of each epoch by binary search over the zone changes."""
+    nat = epochs == NAT
+    seconds = epochs // EPOCH_UNITS[unit]
+    valid = seconds[~nat]
+    if valid.size == 0:
+        return np.zeros(seconds.shape, dtype=np.int64), np.zeros(seconds.shape, dtype=bool), nat
+
+    instants, offsets, dsts = _offset_table(tz, _year_of(int(valid.min())), _year_of(int(valid.max())))
+    idx = np.searchsorted(instants, seconds, side="right") - 1
+    np.clip(idx, 0, None, out=idx)
+    return np.where(nat, 0, offsets[idx]), dsts[idx] & ~nat, nat
+
+
+@lru_cache(maxsize=256)
+def _offset_table(tz: tzinfo, first_year: int, last_year: int) -> tuple[Any, Any, Any]:
+    """Builds sorted arrays of the change instants with the UTC offset (seconds) and DST flag after each one."""
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+
+    # the first entry holds the state at the start of the covered range
+    start = max(int(datetime(first_year, 1, 1, tzinfo=_UTC).timestamp()) - 86400, MIN_INSTANT)
+    end = min(int(datetime(min(last_year + 1, 9999), 1, 1, tzinfo=_UTC).timestamp()) + 86400, MAX_INSTANT)
+    offset, dst = _offset_state(tz, start)
+    instants, offsets, dsts = [start], [offset], [dst]
+    for ts, _, (offset, dst) in _iter_zone_changes(tz, start, end):
+        instants.append(ts)
+        offsets.append(offset)
+        dsts.append(dst)
+
+    return (
+        np.array(instants, dtype=np.int64),
+        np.array([int(offset.total_seconds()) for offset in offsets], dtype=np.int64),
+        np.array([dst > timedelta(0) for dst in dsts], dtype=bool),
+    )
+
+
+def classify_local_times(values: Any, timezone: str | tzinfo, unit: str = "s") -> tuple[Any, Any]:
+    """Detects local wall clock times that do not exist or exist twice in a timezone.
+
+    Args:
+        values: Naive local times as datetime64 array, naive pandas Series or int64 wall clock epochs
+        timezone: Timezone the local times belong to
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        Tuple of boolean numpy arrays (nonexistent, ambiguous)
+    """
+    _, _, nonexistent, ambiguous = _locate_local_times(_resolve_timezone(timezone), _wall_epochs(values, unit), unit)
+    return nonexistent, ambiguous
+
+
+def localize_many(
+    values: Any,
+    timezone: str | tzinfo,
+    ambiguous: str = "raise",
+    nonexistent: str = "raise",
+    unit: str = "s",
+) -> Any:
+    """Converts naive local times of a timezone into UTC epochs.
+
+    Args:
+        values: Naive local times as datetime64 array, naive pandas Series or int64 wall clock epochs
+        timezone: Timezone the local times belong to
+        ambiguous: Policy for times in a fold (raise, earliest, latest or NaT)
+        nonexistent: Policy for times in a gap (raise, shift_forward, shift_backward or NaT)
+        unit: Unit of integer epochs and of the result (s, ms, us or ns)
+
+    Returns:
+        int64 numpy array of UTC epochs (`NAT` for missing values)
+
+    Raises:
+        AmbiguousTimeError: If ambiguous times are found and the policy is raise
+        NonExistentTimeError: If nonexistent times are found and the policy is raise
+    """
+    if ambiguous not in AMBIGUOUS_POLICIES:
+        raise ValueError(f"Invalid ambiguous policy: {ambiguous}")
+    if nonexistent not in NONEXISTENT_POLICIES:
+        raise ValueError(f"Invalid nonexistent policy: {nonexistent}")
+
+    tz = _resolve_timezone(timezone)
+    wall = _wall_epochs(values, unit)
+    ticks = EPOCH_UNITS[unit]
+    offsets, changes, gap, fold = _locate_local_times(tz, wall, unit)
+
+    # default is the first occurrence (offset before the change) for both cases
+    utc = wall - offsets * ticks
+    if fold.any():
+        if ambiguous == "raise":
+            raise AmbiguousTimeError(
+                f"{int(fold.sum())} local times are ambiguous in {tz}, e.g. {wall[fold][0].astype(f'M8[{unit}]')}"
+            )
+        if ambiguous == "latest":
+            utc[fold] = wall[fold] - changes[fold, 2] * ticks
+        elif ambiguous == "NaT":
+            utc[fold] = NAT
+    if gap.any():
+        if nonexistent == "raise":
+            raise NonExistentTimeError(
+                f"{int(gap.sum())} local times do not exist in {tz}, e.g. {wall[gap][0].astype(f'M8[{unit}]')}"
+            )
+        if nonexistent == "shift_forward":
+            utc[gap] = changes[gap, 0] * ticks
+        elif nonexistent == "shift_backward":
+            utc[gap] = changes[gap, 0] * ticks - 1
+        elif nonexistent == "NaT":
+            utc[gap] = NAT
+
+    utc[wall == NAT] = NAT
+    return utc
+
+
+def _wall_epochs(values: Any, unit: str) -> Any:
+    """Converts naive local times into wall clock epochs."""
+    if Series is not None and isinstance(values, Series) and is_datetime(values) and values.dt.tz is not None:
+        raise ValueError("Expected naive local times, but got timezone-aware values")
+    return to_epoch_array(values, unit)
+
+
+def _locate_local_times(tz: tzinfo, wall: Any, unit: str) -> tuple[Any, Any, Any, Any]:
+    """Locates wall clock epochs relative to the offset changes of a zone in a single pass.
+
+    Returns:
+        Offsets (seconds) of the first occurrence of each time, the (instant, offset before, offset after)
+        of the change next to each time and the gap and fold masks
+    """
+    nat = wall == NAT
+    valid = wall[~nat]
+    if valid.size == 0:
+        empty = np.zeros(wall.shape, dtype=bool)
+        return np.zeros(wall.shape, dtype=np.int64), np.zeros((*wall.shape, 3), dtype=np.int64), empty, empty
+
+    ticks = EPOCH_UNITS[unit]
+    instants, offsets, _ = _offset_table(tz, _year_of(int(valid.min()) // ticks), _year_of(int(valid.max()) // ticks))
+    if instants.size == 1:
+        empty = np.zeros(wall.shape, dtype=bool)
+        return np.full(wall.shape, offsets[0]), np.zeros((*wall.shape, 3), dtype=np.int64), empty, empty
+    before, after = offsets[:-1], offsets[1:]
+
+    # each change blocks the local times between the old and the new wall clock
+    starts = (instants[1:] + np.minimum(before, after)) * ticks
+    ends = (instants[1:] + np.maximum(before, after)) * ticks
+    local_offsets = offsets[np.searchsorted(ends, wall, side="right")]
+
+    idx = np.searchsorted(starts, wall, side="right") - 1
+    inside = (idx >= 0) & ~nat
+    idx = np.clip(idx, 0, None)
+    inside &= wall < ends[idx]
+    changes = np.stack([instants[1:][idx], before[idx], after[idx]], axis=-1)
+
+    return local_offsets, changes, inside & (after[idx] > before[idx]), inside & (after[idx] < before[idx])
+
+
+def _year_of(ts: int) -> int:
+    """Returns the UTC year of a unix timestamp (clamped to the supported range)."""
+    return (_EPOCH + timedelta(seconds=min(max(ts, MIN_INSTANT), MAX_INSTANT))).year
+
+
 def get_dst_transitions(timezone: str | ZoneInfo, year: int) -> list[DSTTransition]:
     """Get DST transition dates for a timezone in a given year.
 
+    Results are memoized per (timezone, year), so repeated lookups are cheap.
+
     Args:
         timezone: Timezone name or ZoneInfo object
         year: Year to get transitions for
@@ -51,15 +285,145 @@ def get_dst_transitions(timezone: str | ZoneInfo, year: int) -> list[DSTTransiti
     Returns:
         List of DST transitions with type and date
     """
-    # Convert timezone string to ZoneInfo if needed
+    tz = _resolve_timezone(timezone)
+
+    # copy the cached entries so callers can not alter the cache
+    _, transitions = _year_transitions(tz, year)
+    return [DSTTransition(type=trans["type"], date=trans["date"]) for trans in transitions]
+
+
+def iter_dst_transitions(timezone: str | tzinfo, start: datetime, end: datetime) -> Iterator[DSTTransition]:
+    """Lazily yields all DST transitions of a timezone between two instants.
+
+    This walks the transition table of the zone file once and continues with the POSIX rule of the zone
+    for the years after the table, so memory usage does not depend on the length of the span.
+
+    Args:
+        timezone: Timezone name or tzinfo object
+        start: First instant to include (naive datetimes are interpreted in the timezone)
+        end: Instant to stop at (exclusive)
+
+    Returns:
+        Iterator of DST transitions with type and date
+    """
+    tz = _resolve_timezone(timezone)
+    start = start if start.tzinfo else start.replace(tzinfo=tz)
+    end = end if end.tzinfo else end.replace(tzinfo=tz)
+    start_ts, end_ts = int(start.timestamp()), int(end.timestamp())
+
+    # zones without a zone file fall back to the (cached) yearly scan
+    if load_tzif(tz) is None:
+        for year in range(start.astimezone(tz).year, end.astimezone(tz).year + 1):
+            instants, transitions = _year_transitions(tz, year)
+            for ts, trans in zip(instants, transitions, strict=True):
+                if start_ts <= ts < end_ts:
+                    yield DSTTransition(type=trans["type"], date=trans["date"])
+        return
+
+    for ts, before, after in _iter_zone_changes(tz, start_ts, end_ts):
+        if after[1] != before[1]:
+            yield _make_transition(tz, ts, before[1], after[1])
+
+
+def _resolve_timezone(timezone: str | tzinfo) -> tzinfo:
+    """Converts a timezone name into a tzinfo object."""
     if isinstance(timezone, str):
         tz_obj = find_timezone(timezone)
         if tz_obj is None:
             raise ValueError(f"Invalid timezone: {timezone}")
-        tz = tz_obj
-    else:
-        tz = timezone
+        return tz_obj
+    return timezone
+
+
+def _zone_key_timezone(zone: str) -> tzinfo:
+    """Converts a zone key into a tzinfo (IANA keys are taken literally, other names are looked up)."""
+    try:
+        return ZoneInfo(zone)
+    except (ZoneInfoNotFoundError, ValueError, OSError):
+        return _resolve_timezone(zone)
+
+
+def _make_transition(tz: tzinfo, ts: int, dst_before: timedelta, dst_after: timedelta) -> DSTTransition:
+    """Creates the transition info for the given instant."""
+    trans_type = "spring_forward" if dst_after > dst_before else "fall_back"
+    return DSTTransition(type=trans_type, date=datetime.fromtimestamp(ts, tz))
+
+
+def _offset_state(tz: tzinfo, ts: int) -> tuple[timedelta, timedelta]:
+    """Returns the UTC offset and DST offset of the timezone at the given instant."""
+    local = datetime.fromtimestamp(ts, tz)
+    return local.utcoffset() or timedelta(0), local.dst() or timedelta(0)
+
+
+def _rule_instants(rule: PosixRule | None, after: int, end: int) -> Iterator[int]:
+    """Yields the instants of the POSIX rule that lie in (after, end)."""
+    if rule is None or rule.start is None:
+        return
+    year = max(_year_of(after) - 1, 1)
+    last_year = min(_year_of(end) + 1, 9999)
+    while year <= last_year:
+        for ts in rule.transitions(year):
+            if after < ts < end:
+                yield ts
+        year += 1
+
 
+def _iter_zone_changes(
+    tz: tzinfo, start: int, end: int
+) -> Iterator[tuple[int, tuple[timedelta, timedelta], tuple[timedelta, timedelta]]]:
+    """Walks all instants in [start, end) at which the UTC or DST offset of a zone file backed timezone changes.
+
+    Yields:
+        Tuples of the instant (unix seconds) and the (utcoffset, dst) state before and after it
+    """
+    data = load_tzif(tz)
+    if data is None:
+        # derive the changes from the (cached) yearly scan
+        for year in range(max(_year_of(start) - 1, 1), min(_year_of(end) + 2, 10000)):
+            for ts in _year_transitions(tz, year)[0]:
+                if start <= ts < end:
+                    yield ts, _offset_state(tz, ts - 1), _offset_state(tz, ts)
+        return
+    table = data.transitions
+    table_end = table[-1] if table else start - 1
+
+    # the table lists every change up to its last entry, the rule takes over after that
+    idx = bisect.bisect_left(table, start)
+    state = _offset_state(tz, max(start - 1, MIN_INSTANT))
+    for ts in table[idx:]:
+        if ts >= end:
+            return
+        new_state = _offset_state(tz, ts)
+        if new_state != state:
+            yield ts, state, new_state
+        state = new_state
+
+    for ts in _rule_instants(data.rule, max(table_end, start - 1), end):
+        new_state = _offset_state(tz, ts)
+        if new_state != state:
+            yield ts, state, new_state
+        state = new_state
+
+
+@lru_cache(maxsize=TRANSITION_CACHE_SIZE)
+def _year_transitions(tz: tzinfo, year: int) -> tuple[tuple[int, ...], tuple[DSTTransition, ...]]:
+    """Computes the sorted transition instants (as unix timestamps) and transitions of a year."""
+    if load_tzif(tz) is None:
+        scanned = tuple(_scan_year_transitions(tz, year))
+        return tuple(int(trans["date"].timestamp()) for trans in scanned), scanned
+
+    # the year is delimited by the local midnights of new year
+    start = int(datetime(year, 1, 1, tzinfo=tz).timestamp())
+    end = int(datetime(year + 1, 1, 1, tzinfo=tz).timestamp()) if year < 9999 else MAX_INSTANT
+    changes = [(ts, before[1], after[1]) for ts, before, after in _iter_zone_changes(tz, start, end)]
+    return (
+        tuple(ts for ts, before, after in changes if before != after),
+        tuple(_make_transition(tz, ts, before, after) for ts, before, after in changes if before != after),
+    )
+
+
+def _scan_year_transitions(tz: tzinfo, year: int) -> list[DSTTransition]:
+    """Scans every day of the year for changes of the DST offset."""
     transitions = []
 
     # Check each day of the year for DST changes
@@ -127,19 +491,194 @@ def next_dst_transition(dt: datetime) -> DSTTransition | None:
     if dt.tzinfo is None:
         raise ValueError("Cannot find DST transition for timezone-unaware datetime")
 
-    # Get transitions for current year
     if not isinstance(dt.tzinfo, ZoneInfo):
         raise ValueError("DST transitions only supported for ZoneInfo timezones")
-    transitions = get_dst_transitions(dt.tzinfo, dt.year)
 
-    # Find next transition after current datetime
-    for trans in transitions:
-        if trans["date"] > dt:
-            return trans
+    # binary search the cached transitions of the current and the next year
+    ts = dt.timestamp()
+    for year in (dt.year, dt.year + 1):
+        instants, transitions = _year_transitions(dt.tzinfo, year)
+        idx = bisect.bisect_right(instants, ts)
+        if idx < len(transitions):
+            return DSTTransition(type=transitions[idx]["type"], date=transitions[idx]["date"])
+
+    return None
+
+
+def previous_dst_transition(dt: datetime) -> DSTTransition | None:
+    """Find the most recent DST transition at or before the given datetime.
+
+    Args:
+        dt: Timezone-aware datetime to start from
+
+    Returns:
+        Previous DST transition info or None if no transition found
+
+    Raises:
+        ValueError: If datetime is None or not timezone-aware
+    """
+    if dt is None:
+        raise ValueError("Cannot find DST transition for None datetime")
 
-    # Check next year if no transition found in current year
-    next_year_transitions = get_dst_transitions(dt.tzinfo, dt.year + 1)
-    if next_year_transitions:
-        return next_year_transitions[0]
+    if dt.tzinfo is None:
+        raise ValueError("Cannot find DST transition for timezone-unaware datetime")
+
+    if not isinstance(dt.tzinfo, ZoneInfo):
+        raise ValueError("DST transitions only supported for ZoneInfo timezones")
+
+    # binary search the cached transitions of the current and the previous year
+    ts = dt.timestamp()
+    for year in (dt.year, dt.year - 1):
+        instants, transitions = _year_transitions(dt.tzinfo, year)
+        idx = bisect.bisect_right(instants, ts)
+        if idx > 0:
+            return DSTTransition(type=transitions[idx - 1]["type"], date=transitions[idx - 1]["date"])
 
     return None
+
+
+@dataclass(frozen=True)
+class DSTCalendar:
+    """Columnar table of DST transitions for many zones.
+
+    Row `i` describes a transition of zone `zones[zone_id[i]]` at `instant[i]` (unix seconds) of type
+    `TRANSITION_TYPES[type[i]]`, with the UTC offsets (seconds) before and after the change.
+    """
+
+    zones: tuple[str, ...]
+    zone_id: Any
+    instant: Any
+    type: Any
+    offset_before: Any
+    offset_after: Any
+
+    def __len__(self) -> int:
+        return len(self.instant)
+
+    def transitions(self, zone: str) -> list[DSTTransition]:
+        """Returns the transitions of a single zone.
+
+        Args:
+            zone: Name of the zone
+
+        Returns:
+            List of DST transitions with type and date
+        """
+        if zone not in self.zones:
+            return []
+        tz = _zone_key_timezone(zone)
+        rows = np.flatnonzero(self.zone_id == self.zones.index(zone))
+        return [
+            DSTTransition(
+                type=TRANSITION_TYPES[self.type[row]], date=datetime.fromtimestamp(int(self.instant[row]), tz)
+            )
+            for row in rows
+        ]
+
+    def save(self, path: str | Path) -> None:
+        """Stores the calendar in a (numpy) binary file.
+
+        Args:
+            path: File to write to
+        """
+        with Path(path).open("wb") as file:
+            np.savez(
+                file,
+                zones=np.array(self.zones, dtype=str),
+                zone_id=self.zone_id,
+                instant=self.instant,
+                type=self.type,
+                offset_before=self.offset_before,
+                offset_after=self.offset_after,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> DSTCalendar:
+        """Loads a calendar stored with `save`.
+
+        Args:
+            path: File to read from
+
+        Returns:
+            The loaded calendar
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        with np.load(Path(path), allow_pickle=False) as data:
+            return cls(
+                zones=tuple(str(zone) for zone in data["zones"]),
+                zone_id=data["zone_id"],
+                instant=data["instant"],
+                type=data["type"],
+                offset_before=data["offset_before"],
+                offset_after=data["offset_after"],
+            )
+
+
+def dst_calendar(
+    years: int | Iterable[int], zones: Iterable[str] | None = None, workers: int | None = None
+) -> DSTCalendar:
+    """Computes the DST transitions of many zones over the given years.
+
+    The zones are processed in parallel across a process pool.
+
+    Args:
+        years: Year or years to compute the transitions for
+        zones: Zone names (defaults to all available zones)
+        workers: Number of worker processes (defaults to the number of CPUs, 1 runs in the current process)
+
+    Returns:
+        Columnar calendar of all transitions, sorted by zone and instant
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+
+    year_list = sorted({years} if isinstance(years, int) else set(years))
+    zone_list = tuple(sorted(available_timezones()) if zones is None else zones)
+    for zone in zone_list:
+        _zone_key_timezone(zone)
+    workers = workers or os.cpu_count() or 1
+
+    # group the years into contiguous spans so each zone is walked once per span
+    spans: list[tuple[int, int]] = []
+    for year in year_list:
+        if spans and spans[-1][1] == year - 1:
+            spans[-1] = (spans[-1][0], year)
+        else:
+            spans.append((year, year))
+
+    args = [(zone, spans) for zone in zone_list]
+    if workers <= 1 or len(zone_list) <= 1:
+        rows = [_zone_calendar(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_zone_calendar, *zip(*args, strict=True), chunksize=max(len(args) // workers // 4, 1)))
+
+    return DSTCalendar(
+        zones=zone_list,
+        zone_id=np.repeat(np.arange(len(zone_list), dtype=np.int32), [len(zone_rows) for zone_rows in rows]),
+        instant=np.array([row[0] for zone_rows in rows for row in zone_rows], dtype=np.int64),
+        type=np.array([row[1] for zone_rows in rows for row in zone_rows], dtype=np.int8),
+        offset_before=np.array([row[2] for zone_rows in rows for row in zone_rows], dtype=np.int32),
+        offset_after=np.array([row[3] for zone_rows in rows for row in zone_rows], dtype=np.int32),
+    )
+
+
+def _zone_calendar(zone: str, spans: list[tuple[int, int]]) -> list[tuple[int, int, int, int]]:
+    """Computes the calendar rows (instant, type, offset before, offset after) of a single zone."""
+    tz = _zone_key_timezone(zone)
+    rows = []
+    for first, last in spans:
+        start = int(datetime(first, 1, 1, tzinfo=tz).timestamp())
+        end = int(datetime(last + 1, 1, 1, tzinfo=tz).timestamp()) if last < 9999 else MAX_INSTANT
+        for ts, before, after in _iter_zone_changes(tz, start, end):
+            if before[1] != after[1]:
+                rows.append(
+                    (
+                        ts,
+                        TRANSITION_TYPES.index(_make_transition(tz, ts, before[1], after[1])["type"]),
+                        int(before[0].total_seconds()),
+                        int(after[0].total_seconds()),
+                    )
+                )
+    return rows
@@ -0,0 +1,164 @@
+"""Numeric time features (e.g. cyclical encodings for machine learning pipelines).
+
+All features are computed from the wall clock of the values in one pass over an epoch array, without
+creating datetime objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import date, timedelta, tzinfo
+from typing import Any
+
+from .business import _FIRST_DAY, _LAST_DAY, BusinessCalendar, default_calendar
+from .civil import civil_from_days, days_from_civil
+from .convert import EPOCH_UNITS, NAT, to_epoch_array
+from .dst import _array_timezone, _lookup_offsets
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+# cycles of the position features (each also available with `_sin` and `_cos` suffix)
+CYCLES = ("time_of_day", "day_of_week", "day_of_year", "month")
+
+# all supported features
+FEATURES = (
+    *(f"{cycle}{suffix}" for cycle in CYCLES for suffix in ("", "_sin", "_cos")),
+    "dst",
+    "business_day",
+)
+
+DEFAULT_FEATURES = tuple(f"{cycle}{suffix}" for cycle in CYCLES for suffix in ("_sin", "_cos"))
+
+_EPOCH_DATE = date(1970, 1, 1)
+
+
+class TimeFeatures:
+    """Extracts a configurable set of numeric features from timestamps.
+
+    Positions are normalized to `[0, 1)` along their cycle (time of day, ISO weekday, day of the year and
+    month), the `_sin` and `_cos` features encode these positions on the unit circle. The `dst` and
+    `business_day` features are 0/1 flags. Missing values produce rows of NaN.
+    """
+
+    def __init__(
+        self,
+        features: Sequence[str] = DEFAULT_FEATURES,
+        timezone: str | tzinfo | None = None,
+        calendar: BusinessCalendar | None = None,
+    ) -> None:
+        """Creates the extractor.
+
+        Args:
+            features: Names of the features (columns) to compute (see `FEATURES`)
+            timezone: Timezone whose wall clock is used (defaults to the timezone of an aware Series, else
+                the values are taken as UTC)
+            calendar: Business calendar of the `business_day` feature (monday to friday if None)
+        """
+        invalid = [name for name in features if name not in FEATURES]
+        if invalid:
+            raise ValueError(f"Invalid features: {', '.join(invalid)}")
+        self.features = tuple(features)
+        self.timezone = timezone
+        self.calendar = calendar
+
+    def __repr__(self) -> str:
+        """Return the features and timezone."""
+        return f"TimeFeatures(features={list(self.features)}, timezone={self.timezone!r})"
+
+    def transform(self, values: Any, unit: str = "s", out: Any = None) -> Any:
+        """Computes the features of the timestamps.
+
+        Args:
+            values: int64 epoch array, datetime64 array or pandas Series
+            unit: Unit of integer epochs (s, ms, us or ns)
+            out: Preallocated float array of shape (len(values), len(features)) to write into
+
+        Returns:
+            2-D float numpy array with one column per feature
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        epochs = to_epoch_array(values, unit).ravel()
+        shape = (len(epochs), len(self.features))
+        if out is None:
+            out = np.empty(shape, dtype=np.float64)
+        elif out.shape != shape:
+            raise ValueError(f"Output array needs the shape {shape}")
+
+        # wall clock seconds (and DST flags) of the values
+        nat = epochs == NAT
+        seconds = np.where(nat, 0, epochs // EPOCH_UNITS[unit])
+        dst = np.zeros(len(epochs), dtype=bool)
+        if self.timezone is not None or getattr(getattr(values, "dt", None), "tz", None) is not None:
+            offsets, dst, _ = _lookup_offsets(_array_timezone(values, self.timezone), epochs, unit)
+            seconds += offsets
+        days, secs = np.divmod(seconds, 86_400)
+
+        positions: dict[str, Any] = {}
+        for col, name in enumerate(self.features):
+            if name == "dst":
+                out[:, col] = dst
+            elif name == "business_day":
+                out[:, col] = self._business_days(days, nat)
+            else:
+                cycle, encoding = (name[:-4], name[-3:]) if name.endswith(("_sin", "_cos")) else (name, "")
+                if cycle not in positions:
+                    positions[cycle] = _position(cycle, days, secs)
+                if encoding == "sin":
+                    out[:, col] = np.sin(2 * np.pi * positions[cycle])
+                elif encoding == "cos":
+                    out[:, col] = np.cos(2 * np.pi * positions[cycle])
+                else:
+                    out[:, col] = positions[cycle]
+        out[nat] = np.nan
+        return out
+
+    def _business_days(self, days: Any, nat: Any) -> Any:
+        """Returns the business day flags of days since the unix epoch."""
+        calendar = self.calendar or default_calendar()
+        days = np.where(nat, 0, days)
+        flags = np.zeros(len(days), dtype=bool)
+
+        # days outside of the calendar tables are checked one by one
+        inside = (days >= _FIRST_DAY) & (days < _LAST_DAY)
+        flags[inside] = calendar.is_business_day(days[inside].astype("datetime64[D]"))
+        flags[~inside] = [calendar.is_business_day(_EPOCH_DATE + timedelta(days=int(day))) for day in days[~inside]]
+        return flags
+
+
+def _position(cycle: str, days: Any, secs: Any) -> Any:
+    """Computes the normalized position `[0, 1)` of the wall clock days and seconds along a cycle."""
+    if cycle == "time_of_day":
+        return secs / 86_400
+    if cycle == "day_of_week":
+        return (days + 3) % 7 / 7
+    year, month, _ = civil_from_days(days)
+    if cycle == "month":
+        return (month - 1) / 12
+    start = days_from_civil(year, 1, 1)
+    return (days - start) / (days_from_civil(year + 1, 1, 1) - start)
+
+
+def time_features(
+    values: Any,
+    features: Sequence[str] = DEFAULT_FEATURES,
+    timezone: str | tzinfo | None = None,
+    unit: str = "s",
+    calendar: BusinessCalendar | None = None,
+) -> Any:
+    """Computes numeric time features of timestamps (see `TimeFeatures`).
+
+    Args:
+        values: int64 epoch array, datetime64 array or pandas Series
+        features: Names of the features (columns) to compute (see `FEATURES`)
+        timezone: Timezone whose wall clock is used (defaults to the timezone of an aware Series, else UTC)
+        unit: Unit of integer epochs (s, ms, us or ns)
+        calendar: Business calendar of the `business_day` feature (monday to friday if None)
+
+    Returns:
+        2-D float numpy array with one column per feature
+    """
+    return TimeFeatures(features, timezone, calendar).transform(values, unit)
@@ -0,0 +1,492 @@
+"""Interval structures on epoch arrays (e.g. to assign timestamps to the output of `create_intervals`).
+
+Intervals are half-open `[start, end)` and stored as int64 epochs of a unit (aware datetimes as UTC,
+naive datetimes by their wall clock time, as in `to_epoch_array`). Naive and aware datetimes can not be
+mixed between intervals and timestamps (a TypeError is raised, as when comparing datetimes), since their
+epochs would be shifted by the UTC offset.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from heapq import heappop, heappush
+from typing import Any
+
+from .convert import EPOCH_UNITS, NAT, any_to_datetime, to_epoch_array
+from .range import _epoch_ticks
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+
+def interval_arrays(intervals: Any, unit: str = "s") -> tuple[Any, Any]:
+    """Converts intervals into int64 arrays of start and end epochs.
+
+    Args:
+        intervals: Output of `create_intervals` (list of datetime tuples), a lazy interval sequence
+            (`iter_intervals`, `calendar_intervals`) or a tuple of start and end arrays
+        unit: Unit of the epochs (s, ms, us or ns)
+
+    Returns:
+        Tuple of int64 start and end arrays
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"Invalid epoch unit: {unit}")
+    if hasattr(intervals, "to_arrays"):
+        return intervals.to_arrays(unit, as_datetime64=False)  # type: ignore[no-any-return]
+    if isinstance(intervals, tuple) and len(intervals) == 2 and all(hasattr(side, "__array__") for side in intervals):
+        return to_epoch_array(intervals[0], unit), to_epoch_array(intervals[1], unit)
+
+    ticks = EPOCH_UNITS[unit]
+    pairs = [(_to_epoch(start, unit, ticks), _to_epoch(end, unit, ticks)) for start, end in intervals]
+    starts = np.array([start for start, _ in pairs], dtype=np.int64)
+    ends = np.array([end for _, end in pairs], dtype=np.int64)
+    return starts, ends
+
+
+def _to_epoch(value: Any, unit: str, ticks: int, aware: bool | None = None) -> int:
+    """Converts a single time value (datetime, string, datetime64 or integer epoch) into an epoch.
+
+    Datetimes have to match the awareness of the intervals (if known).
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool):
+        return int(value)
+    if isinstance(value, np.datetime64):
+        return int(to_epoch_array(np.array([value]), unit)[0])
+    if not isinstance(value, datetime):
+        parsed = any_to_datetime(value) if isinstance(value, (str, date)) else None
+        if parsed is None:
+            raise ValueError(f"Unable to convert {value} into an epoch")
+        value = parsed
+    _check_awareness(aware, value.tzinfo is not None)
+    return _epoch_ticks(value, ticks)
+
+
+def _check_awareness(aware: bool | None, other: bool | None) -> None:
+    """Raises if naive and aware values are mixed (None if the awareness is unknown, e.g. for epochs)."""
+    if aware is not None and other is not None and aware != other:
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+
+
+def _awareness(values: Any) -> bool | None:
+    """Returns if datetime values (intervals or a pandas Series) are timezone aware (None for epoch arrays)."""
+    if isinstance(values, tuple) and len(values) == 2 and all(hasattr(side, "__array__") for side in values):
+        values = values[0]
+    if hasattr(values, "__array__"):
+        tz = getattr(getattr(values, "dt", None), "tz", False)
+        return None if tz is False else tz is not None
+    first = values[0] if len(values) > 0 else None
+    if isinstance(first, tuple):
+        first = first[0]
+    return first.tzinfo is not None if isinstance(first, datetime) else None
+
+
+class IntervalIndex:
+    """Lookup index of non-overlapping intervals for assigning timestamps to them.
+
+    Positions refer to the order in which the intervals were passed. Timestamps outside of all intervals
+    (including gaps left by the `skip` threshold of `create_intervals`) are located at -1.
+    """
+
+    def __init__(self, starts: Any, ends: Any, unit: str = "s") -> None:
+        """Creates the index.
+
+        Args:
+            starts: Start epochs (int64) or datetime64 array of the intervals
+            ends: End epochs (int64) or datetime64 array of the intervals
+            unit: Unit of the epochs (s, ms, us or ns)
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        aware = _awareness(starts)
+        starts, ends = to_epoch_array(starts, unit), to_epoch_array(ends, unit)
+        if starts.shape != ends.shape:
+            raise ValueError("Starts and ends need to have the same length")
+        if ((starts == NAT) | (ends == NAT)).any():
+            raise ValueError("Intervals must not contain missing values")
+        if (ends < starts).any():
+            raise ValueError("Intervals must not end before they start")
+
+        # sort by start (the intervals of create_intervals are sorted already)
+        order = np.argsort(starts, kind="stable")
+        self.unit = unit
+        self.aware = aware
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self._order = order
+        if (self.ends[:-1] > self.starts[1:]).any():
+            raise ValueError("Intervals must not overlap")
+
+    @classmethod
+    def from_intervals(cls, intervals: Any, unit: str = "s") -> IntervalIndex:
+        """Creates the index from intervals (see `interval_arrays` for the supported inputs).
+
+        Args:
+            intervals: Output of `create_intervals`, a lazy interval sequence or a tuple of arrays
+            unit: Unit of the epochs (s, ms, us or ns)
+
+        Returns:
+            Lookup index over the intervals
+        """
+        if not hasattr(intervals, "__getitem__"):
+            intervals = list(intervals)
+        index = cls(*interval_arrays(intervals, unit), unit=unit)
+        index.aware = _awareness(intervals)
+        return index
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        """Return the number of intervals and the unit."""
+        return f"IntervalIndex(n={len(self)}, unit={self.unit!r})"
+
+    @cached_property
+    def _bounds(self) -> tuple[list[int], list[int], list[int]]:
+        """Python lists of the sorted starts, ends and positions for scalar lookups."""
+        return self.starts.tolist(), self.ends.tolist(), self._order.tolist()
+
+    def locate(self, value: Any) -> int:
+        """Finds the interval that contains a timestamp in O(log n).
+
+        Args:
+            value: Datetime, string, datetime64 or epoch in the unit of the index
+
+        Returns:
+            Position of the interval or -1 if no interval contains the timestamp
+        """
+        starts, ends, order = self._bounds
+        epoch = _to_epoch(value, self.unit, EPOCH_UNITS[self.unit], self.aware)
+        idx = bisect_right(starts, epoch) - 1
+        if idx < 0 or epoch >= ends[idx]:
+            return -1
+        return order[idx]
+
+    def locate_many(self, values: Any) -> Any:
+        """Finds the intervals of an array of timestamps by binary search over the sorted boundaries.
+
+        Args:
+            values: int64 epoch array (in the unit of the index), datetime64 array or pandas Series
+
+        Returns:
+            int64 array of interval positions (-1 if no interval contains the timestamp)
+        """
+        _check_awareness(self.aware, _awareness(values))
+        epochs = to_epoch_array(values, self.unit)
+        if len(self) == 0:
+            return np.full(epochs.shape, -1, dtype=np.int64)
+        idx = np.searchsorted(self.starts, epochs, side="right") - 1
+        valid = idx >= 0
+        idx = np.clip(idx, 0, None)
+        valid &= (epochs < self.ends[idx]) & (epochs != NAT)
+        return np.where(valid, self._order[idx], -1)
+
+    def contains(self, values: Any) -> Any:
+        """Checks which timestamps fall into any interval.
+
+        Args:
+            values: int64 epoch array (in the unit of the index), datetime64 array or pandas Series
+
+        Returns:
+            Boolean numpy array
+        """
+        return self.locate_many(values) >= 0
+
+    def gaps(self) -> tuple[Any, Any]:
+        """Returns the gaps between consecutive intervals (e.g. left by the skip threshold).
+
+        Returns:
+            Tuple of int64 start and end arrays of the gaps
+        """
+        has_gap = self.ends[:-1] < self.starts[1:]
+        return self.ends[:-1][has_gap], self.starts[1:][has_gap]
+
+
+class IntervalSet:
+    """Immutable set of time covered by half-open intervals.
+
+    Overlapping and adjacent intervals are merged on creation, so the set is stored as sorted, disjoint
+    start and end epochs. Set operations are sweeps over the sorted boundaries in O(n log n).
+    """
+
+    def __init__(self, starts: Any, ends: Any, unit: str = "s") -> None:
+        """Creates the set.
+
+        Args:
+            starts: Start epochs (int64) or datetime64 array of the intervals (unsorted and overlapping allowed)
+            ends: End epochs (int64) or datetime64 array of the intervals
+            unit: Unit of the epochs (s, ms, us or ns)
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        if unit not in EPOCH_UNITS:
+            raise ValueError(f"Invalid epoch unit: {unit}")
+        starts, ends = to_epoch_array(starts, unit).ravel(), to_epoch_array(ends, unit).ravel()
+        if starts.shape != ends.shape:
+            raise ValueError("Starts and ends need to have the same length")
+        if ((starts == NAT) | (ends == NAT)).any():
+            raise ValueError("Intervals must not contain missing values")
+        if (ends < starts).any():
+            raise ValueError("Intervals must not end before they start")
+
+        self.unit = unit
+        self.starts, self.ends = _merge_intervals(starts, ends)
+        self.starts.flags.writeable = False
+        self.ends.flags.writeable = False
+
+    @classmethod
+    def from_intervals(cls, intervals: Any, unit: str = "s") -> IntervalSet:
+        """Creates the set from intervals (see `interval_arrays` for the supported inputs).
+
+        Args:
+            intervals: Output of `create_intervals`, a lazy interval sequence or a tuple of arrays
+            unit: Unit of the epochs (s, ms, us or ns)
+
+        Returns:
+            Normalized interval set
+        """
+        return cls(*interval_arrays(intervals, unit), unit=unit)
+
+    def __len__(self) -> int:
+        """Return the number of disjoint intervals."""
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the (start, end) epochs of the disjoint intervals."""
+        return zip(self.starts.tolist(), self.ends.tolist(), strict=True)
+
+    def __repr__(self) -> str:
+        """Return the number of intervals and the unit."""
+        return f"IntervalSet(n={len(self)}, unit={self.unit!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Check if both sets cover the same time."""
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return (
+            self.unit == other.unit
+            and np.array_equal(self.starts, other.starts)
+            and np.array_equal(self.ends, other.ends)
+        )
+
+    def __hash__(self) -> int:
+        """Hash of the normalized boundaries."""
+        return hash((self.unit, self.starts.tobytes(), self.ends.tobytes()))
+
+    def __or__(self, other: Any) -> IntervalSet:
+        """Union of the sets."""
+        return self.union(other)
+
+    def __and__(self, other: Any) -> IntervalSet:
+        """Intersection of the sets."""
+        return self.intersection(other)
+
+    def __sub__(self, other: Any) -> IntervalSet:
+        """Difference of the sets."""
+        return self.difference(other)
+
+    def _coerce(self, other: Any) -> IntervalSet:
+        """Converts the other operand into a set of the same unit."""
+        if not isinstance(other, IntervalSet):
+            return IntervalSet.from_intervals(other, self.unit)
+        if other.unit != self.unit:
+            raise ValueError(f"Interval sets have different units: {self.unit} and {other.unit}")
+        return other
+
+    def union(self, other: Any) -> IntervalSet:
+        """Returns the time covered by either set.
+
+        Args:
+            other: Interval set (or intervals as supported by `interval_arrays`)
+
+        Returns:
+            New interval set
+        """
+        other = self._coerce(other)
+        starts = np.concatenate([self.starts, other.starts])
+        ends = np.concatenate([self.ends, other.ends])
+        return IntervalSet(starts, ends, self.unit)
+
+    def intersection(self, other: Any) -> IntervalSet:
+        """Returns the time covered by both sets.
+
+        Args:
+            other: Interval set (or intervals as supported by `interval_arrays`)
+
+        Returns:
+            New interval set
+        """
+        return self._sweep(self._coerce(other), np.logical_and)
+
+    def difference(self, other: Any) -> IntervalSet:
+        """Returns the time covered by this set but not by the other.
+
+        Args:
+            other: Interval set (or intervals as supported by `interval_arrays`)
+
+        Returns:
+            New interval set
+        """
+        return self._sweep(self._coerce(other), lambda inside, outside: inside & ~outside)
+
+    def complement(self, start: Any, end: Any) -> IntervalSet:
+        """Returns the time between start and end that is not covered by the set.
+
+        Args:
+            start: Start of the bounds (datetime, string, datetime64 or epoch)
+            end: End of the bounds (datetime, string, datetime64 or epoch)
+
+        Returns:
+            New interval set
+        """
+        ticks = EPOCH_UNITS[self.unit]
+        bounds = IntervalSet([_to_epoch(start, self.unit, ticks)], [_to_epoch(end, self.unit, ticks)], self.unit)
+        return bounds.difference(self)
+
+    def _sweep(self, other: IntervalSet, keep: Any) -> IntervalSet:
+        """Keeps the elementary segments between all boundaries whose membership satisfies `keep`."""
+        points = np.unique(np.concatenate([self.starts, self.ends, other.starts, other.ends]))
+        if len(points) < 2:
+            return IntervalSet(points[:0], points[:0], self.unit)
+        starts, ends = points[:-1], points[1:]
+        mask = keep(self.contains(starts), other.contains(starts))
+        return IntervalSet(starts[mask], ends[mask], self.unit)
+
+    def contains(self, values: Any) -> Any:
+        """Checks which timestamps are covered by the set.
+
+        Args:
+            values: int64 epoch array (in the unit of the set), datetime64 array or pandas Series
+
+        Returns:
+            Boolean numpy array
+        """
+        epochs = to_epoch_array(values, self.unit)
+        idx = np.searchsorted(self.starts, epochs, side="right") - 1
+        if len(self) == 0:
+            return np.zeros(epochs.shape, dtype=bool)
+        return (idx >= 0) & (epochs < self.ends[np.clip(idx, 0, None)]) & (epochs != NAT)
+
+    def total_duration(self) -> timedelta:
+        """Returns the total covered time (without expanding the intervals).
+
+        Returns:
+            Sum of the interval lengths (truncated to microseconds)
+        """
+        total = int((self.ends - self.starts).sum())
+        return timedelta(microseconds=total * 1_000_000 // EPOCH_UNITS[self.unit])
+
+    def to_arrays(self, as_datetime64: bool = True) -> tuple[Any, Any]:
+        """Returns the disjoint intervals as arrays.
+
+        Args:
+            as_datetime64: Return datetime64 arrays of the unit instead of int64 epochs
+
+        Returns:
+            Tuple of start and end arrays
+        """
+        if as_datetime64:
+            dtype = f"datetime64[{self.unit}]"
+            return self.starts.astype(dtype), self.ends.astype(dtype)
+        return self.starts.copy(), self.ends.copy()
+
+
+def _merge_intervals(starts: Any, ends: Any) -> tuple[Any, Any]:
+    """Sorts intervals and merges overlapping and adjacent ones (empty intervals are dropped)."""
+    keep = ends > starts
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0:
+        return starts.astype(np.int64), ends.astype(np.int64)
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+
+    # a new interval begins where the start lies after the furthest end so far
+    reach = np.maximum.accumulate(ends)
+    new = np.empty(len(starts), dtype=bool)
+    new[0] = True
+    new[1:] = starts[1:] > reach[:-1]
+    first = np.flatnonzero(new)
+    last = np.append(first[1:], len(starts)) - 1
+    return starts[first], reach[last]
+
+
+def iter_overlaps(left: Any, right: Any, unit: str = "s") -> Iterator[tuple[int, int, int]]:
+    """Streams all overlapping pairs of two interval collections (sort-merge join).
+
+    Both sides are sorted once and swept by start, keeping the intervals that are still open in an
+    active heap per side. Every pair is emitted when the later of both intervals starts, so the sweep
+    runs in O((n + m) log(n + m) + k) for k overlapping pairs. Empty intervals never overlap.
+
+    Args:
+        left: Intervals as supported by `interval_arrays` (e.g. output of `create_intervals` or arrays)
+        right: Intervals as supported by `interval_arrays`
+        unit: Unit of the epochs (s, ms, us or ns)
+
+    Returns:
+        Iterator of (left position, right position, overlap) with the overlap in ticks of the unit
+    """
+    left_starts, left_ends = (side.tolist() for side in interval_arrays(left, unit))
+    right_starts, right_ends = (side.tolist() for side in interval_arrays(right, unit))
+    for starts, ends in ((left_starts, left_ends), (right_starts, right_ends)):
+        if NAT in starts or NAT in ends:
+            raise ValueError("Intervals must not contain missing values")
+    left_order = sorted(range(len(left_starts)), key=left_starts.__getitem__)
+    right_order = sorted(range(len(right_starts)), key=right_starts.__getitem__)
+
+    # heaps of (end, position) of the intervals that are open at the sweep position
+    left_active: list[tuple[int, int]] = []
+    right_active: list[tuple[int, int]] = []
+    i = j = 0
+    while i < len(left_order) or j < len(right_order):
+        take_left = j >= len(right_order) or (
+            i < len(left_order) and left_starts[left_order[i]] <= right_starts[right_order[j]]
+        )
+        if take_left:
+            pos = left_order[i]
+            i += 1
+            start, end = left_starts[pos], left_ends[pos]
+            if end <= start:
+                continue
+            while right_active and right_active[0][0] <= start:
+                heappop(right_active)
+            for other_end, other in right_active:
+                yield pos, other, min(end, other_end) - start
+            heappush(left_active, (end, pos))
+        else:
+            pos = right_order[j]
+            j += 1
+            start, end = right_starts[pos], right_ends[pos]
+            if end <= start:
+                continue
+            while left_active and left_active[0][0] <= start:
+                heappop(left_active)
+            for other_end, other in left_active:
+                yield other, pos, min(end, other_end) - start
+            heappush(right_active, (end, pos))
+
+
+def overlap_join(left: Any, right: Any, unit: str = "s") -> tuple[Any, Any, Any]:
+    """Joins two interval collections on overlap (see `iter_overlaps`).
+
+    Args:
+        left: Intervals as supported by `interval_arrays` (e.g. output of `create_intervals` or arrays)
+        right: Intervals as supported by `interval_arrays`
+        unit: Unit of the epochs (s, ms, us or ns)
+
+    Returns:
+        Tuple of int64 arrays of the left positions, right positions and overlaps (in ticks of the unit)
+    """
+    pairs = np.fromiter((value for pair in iter_overlaps(left, right, unit) for value in pair), dtype=np.int64).reshape(
+        -1, 3
+    )
+    return pairs[:, 0], pairs[:, 1], pairs[:, 2]
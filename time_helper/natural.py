@@ -6,13 +6,17 @@ import re
 from datetime import datetime, timedelta
 from typing import Any
 
+from .business import BusinessCalendar, add_business_days
+from .civil import days_in_month
 
-def parse_natural(text: str, reference: datetime | None = None) -> datetime:
+
+def parse_natural(text: str, reference: datetime | None = None, calendar: BusinessCalendar | None = None) -> datetime:
     """Parse natural language datetime expressions.
 
     Args:
         text: Natural language datetime expression
         reference: Reference datetime for relative expressions (default: now)
+        calendar: Business calendar for business day expressions (default: monday to friday)
 
     Returns:
         Parsed datetime object
@@ -104,9 +108,7 @@ def parse_natural(text: str, reference: datetime | None = None) -> datetime:
         return reference.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
     if text == "end of month":
-        # Get last day of month
-        next_month = reference.replace(day=28) + timedelta(days=4)
-        last_day = (next_month - timedelta(days=next_month.day)).day
+        last_day = days_in_month(reference.year, reference.month)
         return reference.replace(day=last_day, hour=23, minute=59, second=59, microsecond=999999)
 
     # First/last day of month
@@ -114,8 +116,7 @@ def parse_natural(text: str, reference: datetime | None = None) -> datetime:
         return reference.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
     if text == "last day of the month":
-        next_month = reference.replace(day=28) + timedelta(days=4)
-        last_day = (next_month - timedelta(days=next_month.day)).day
+        last_day = days_in_month(reference.year, reference.month)
         return reference.replace(day=last_day, hour=0, minute=0, second=0, microsecond=0)
 
     # Weekend references
@@ -137,16 +138,10 @@ def parse_natural(text: str, reference: datetime | None = None) -> datetime:
 
     # Business day references
     if text == "next business day":
-        next_day = reference + timedelta(days=1)
-        while next_day.weekday() > 4:  # Skip weekends
-            next_day += timedelta(days=1)
-        return next_day
+        return add_business_days(reference, 1, calendar)  # type: ignore[no-any-return]
 
     if text == "last business day":
-        prev_day = reference - timedelta(days=1)
-        while prev_day.weekday() > 4:  # Skip weekends
-            prev_day -= timedelta(days=1)
-        return prev_day
+        return add_business_days(reference, -1, calendar)  # type: ignore[no-any-return]
 
     # Days of the week
     weekdays = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, "friday": 4, "saturday": 5, "sunday": 6}
@@ -179,7 +174,7 @@ def parse_natural(text: str, reference: datetime | None = None) -> datetime:
         _tz_part = match.group(2).strip().upper()
 
         # Parse the time part without timezone
-        time_dt = parse_natural(time_part, reference)
+        time_dt = parse_natural(time_part, reference, calendar)
 
         # For now, just return the time without timezone conversion
         # This could be enhanced to actually apply timezone conversion
@@ -241,10 +236,10 @@ def parse_natural(text: str, reference: datetime | None = None) -> datetime:
         time_part = match.group(2).strip()
 
         # Parse the day part
-        day_dt = parse_natural(day_part, reference)
+        day_dt = parse_natural(day_part, reference, calendar)
 
         # Parse the time part
-        time_dt = parse_natural(time_part, reference)
+        time_dt = parse_natural(time_part, reference, calendar)
 
         # Combine them
         return day_dt.replace(
@@ -2,27 +2,71 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import Any
+import re
+from collections import Counter
+from datetime import date, datetime, timedelta, tzinfo
+from typing import Any, NamedTuple
+from zoneinfo import ZoneInfo
 
 try:
-    from pandas import DataFrame, Series
+    from pandas import DataFrame, DatetimeTZDtype, Series
     from pandas.api.types import is_datetime64_any_dtype as is_datetime
 except Exception:
     Series = None  # type: ignore[assignment,misc]
     DataFrame = None  # type: ignore[assignment,misc]
+    DatetimeTZDtype = None  # type: ignore[assignment,misc]
 
     def is_datetime(x: Any) -> bool:  # type: ignore[misc] # noqa: ARG001
         """Mock function when pandas is not installed."""
         return False
 
 
-from time_helper.convert import any_to_datetime, localize_datetime, make_aware
+from time_helper.civil import FIRST_YEAR, LAST_YEAR, calendar_arrays, days_in_month
+from time_helper.convert import EPOCH_UNITS, NAT, any_to_datetime, localize_datetime, make_aware, to_epoch_array
+from time_helper.dst import _array_timezone, _locate_local_times, localize_many, utcoffset_many
+from time_helper.timezone import current_timezone, find_timezone
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+# microseconds per step unit (note: "M" is minutes as in the round_time frequencies, "m" are months)
+STEP_UNITS = {
+    "us": 1,
+    "ms": 1_000,
+    "s": 1_000_000,
+    "S": 1_000_000,
+    "min": 60_000_000,
+    "M": 60_000_000,
+    "h": 3_600_000_000,
+    "H": 3_600_000_000,
+    "d": 86_400_000_000,
+    "D": 86_400_000_000,
+    "w": 604_800_000_000,
+    "W": 604_800_000_000,
+}
+
+# supported rounding modes
+ROUND_MODES = ("floor", "ceil", "nearest")
+
+_STEP_PATTERN = re.compile(r"^(\d*)\s*([a-zA-Z]+)$")
+
+# number of object values classified at once by scan_timezones
+_SCAN_CHUNK = 65_536
+
+# naive start of the unix epoch, weeks are aligned to the monday before it (1969-12-29)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=ZoneInfo("UTC"))
+_WEEK_ORIGIN = -3 * 86_400_000_000
 
 
 def has_timezone(df: Series | DataFrame, col: str | None = None) -> bool:
     """Checks if a given pandas object has a timezone.
 
+    Datetime columns are decided from their dtype. Object columns of datetimes are scanned and only count
+    as timezone-aware if all of their values are aware (see `scan_timezones` for details).
+
     Args:
         df: Pandas DataFrame or Series to check
         col: Column name if df is a DataFrame
@@ -30,7 +74,132 @@ def has_timezone(df: Series | DataFrame, col: str | None = None) -> bool:
     Returns:
         True if the object has timezone information, False otherwise
     """
-    # perform security
+    df_col = _select_column(df, col)
+    if is_datetime(df_col):
+        if len(df_col) == 0:
+            raise ValueError("The Dataframe is empty")
+        return isinstance(df_col.dtype, DatetimeTZDtype)
+
+    # object columns can hold (partially) aware datetimes of different zones
+    if getattr(df_col, "dtype", None) == object and len(df_col) > 0:
+        scan = scan_timezones(df_col, early_exit=True)
+        if scan.other == 0 and scan.aware + scan.naive > 0:
+            return scan.naive == 0
+    if isinstance(df, DataFrame):
+        raise ValueError("Specified column is not a datetime object!")
+    raise ValueError("Provided series is not a datetime object!")
+
+
+class TimezoneScan(NamedTuple):
+    """Timezones found in a column by `scan_timezones`."""
+
+    zones: frozenset[str]
+    offsets: frozenset[timedelta]
+    aware: int
+    naive: int
+    missing: int
+    other: int
+    scanned: int
+    rows: int
+
+    @property
+    def mixed(self) -> bool:
+        """True if the column mixes zones or aware and naive values."""
+        return len(self.zones) > 1 or (self.aware > 0 and self.naive > 0)
+
+
+def scan_timezones(
+    df: Series | DataFrame, col: str | None = None, sample: int | None = None, early_exit: bool = False
+) -> TimezoneScan:
+    """Reports the timezones and UTC offsets present in a datetime or object column.
+
+    Datetime columns are answered from their dtype. Object columns are scanned in chunks, optionally
+    only on an evenly spaced sample of the rows.
+
+    Args:
+        df: Pandas DataFrame or Series to scan
+        col: Column name if df is a DataFrame
+        sample: Maximal number of rows to scan in object columns (all rows if None)
+        early_exit: Stop scanning once the column is known to be mixed or to hold non-datetime values
+
+    Returns:
+        Zones, offsets and counts of aware, naive, missing and other (non-datetime) values
+    """
+    df_col = _select_column(df, col)
+    rows = len(df_col)
+    if is_datetime(df_col):
+        missing = int(df_col.isna().sum())
+        tz = df_col.dt.tz
+        if tz is None:
+            return TimezoneScan(frozenset(), frozenset(), 0, rows - missing, missing, 0, rows, rows)
+        valid = df_col.dropna()
+        offsets = np.unique((valid.dt.tz_localize(None) - valid.dt.tz_convert("UTC").dt.tz_localize(None)).to_numpy())
+        zones = frozenset([_zone_name(tz)])
+        return TimezoneScan(
+            zones,
+            frozenset(offset.item() for offset in offsets.astype("timedelta64[us]")),
+            rows - missing,
+            0,
+            missing,
+            0,
+            rows,
+            rows,
+        )
+
+    values = np.asarray(df_col, dtype=object)
+    if sample is not None and rows > sample:
+        values = values[np.linspace(0, rows - 1, sample).astype(np.int64)]
+
+    counts: Counter[tuple[Any, ...]] = Counter()
+    scanned = 0
+    for start in range(0, len(values), _SCAN_CHUNK):
+        chunk = values[start : start + _SCAN_CHUNK]
+        counts.update(_scan_keys(chunk).tolist())
+        scanned += len(chunk)
+        if early_exit and (counts[("other",)] > 0 or _scan_result(counts, scanned, rows).mixed):
+            break
+    return _scan_result(counts, scanned, rows)
+
+
+def _scan_key(value: Any) -> tuple[Any, ...]:
+    """Classifies a single value of an object column for `scan_timezones`."""
+    if value is None or (isinstance(value, (float, datetime, np.datetime64)) and value != value):
+        return ("missing",)
+    if isinstance(value, np.datetime64):
+        return ("naive",)
+    if not isinstance(value, datetime):
+        return ("other",)
+    if value.tzinfo is None:
+        return ("naive",)
+    return ("aware", _zone_name(value.tzinfo), value.utcoffset())
+
+
+_scan_keys = np.frompyfunc(_scan_key, 1, 1) if np is not None else None
+
+
+def _scan_result(counts: Counter[tuple[Any, ...]], scanned: int, rows: int) -> TimezoneScan:
+    """Aggregates the classified values of `scan_timezones`."""
+    aware = [key for key in counts if key[0] == "aware"]
+    return TimezoneScan(
+        frozenset(key[1] for key in aware),
+        frozenset(key[2] for key in aware),
+        sum(counts[key] for key in aware),
+        counts[("naive",)],
+        counts[("missing",)],
+        counts[("other",)],
+        scanned,
+        rows,
+    )
+
+
+def _zone_name(tz: tzinfo) -> str:
+    """Returns the name of a timezone object (IANA key where available)."""
+    name = getattr(tz, "key", None) or getattr(tz, "zone", None)
+    return name if isinstance(name, str) else str(tz)
+
+
+def _select_column(df: Series | DataFrame, col: str | None) -> Any:
+    """Validates the arguments of `has_timezone` and returns the selected column."""
     if df is None:
         raise ValueError("Expected a dataframe but got None")
     if isinstance(df, DataFrame):
@@ -38,19 +207,8 @@ def has_timezone(df: Series | DataFrame, col: str | None = None) -> bool:
             raise ValueError("Expected a column name, but got None")
         if col not in df.columns:
             raise ValueError(f"The provided column {col} is not in the dataframe {df.columns}")
-        if not is_datetime(df[col]):
-            raise ValueError("Specified column is not a datetime object!")
-    elif not is_datetime(df):
-        raise ValueError("Provided series is not a datetime object!")
-    if len(df) == 0:
-        raise ValueError("The Dataframe is empty")
-
-    # perform checks
-    df_col = df if isinstance(df, Series) else df[col]
-    obj = df_col.iloc[0]
-    if not hasattr(obj, "tzinfo"):
-        return False
-    return obj.tzinfo is not None
+        return df[col]
+    return df
 
 
 def time_diff(dt1: datetime, dt2: datetime, tz: str | Any = None) -> timedelta:
@@ -94,13 +252,234 @@ def time_diff(dt1: datetime, dt2: datetime, tz: str | Any = None) -> timedelta:
     return dt1 - dt2
 
 
-def round_time(dt: datetime, freq: str = "D", max_out: bool = False) -> datetime | None:
+def time_diff_many(a: Any, b: Any, tz: str | tzinfo | None = None, unit: str = "s") -> Any:
+    """Computes the element-wise differences `a - b` of two arrays of datetimes from different timezones.
+
+    Both sides are normalized to UTC epochs in bulk. As in `time_diff`, naive values are compared on the
+    wall clock if both sides are naive and are otherwise taken as local time in `tz` (the system timezone
+    if None). Integer arrays are taken as UTC epochs in `unit`.
+
+    Args:
+        a: Datetimes (sequence, int64 or datetime64 array or pandas Series)
+        b: Datetimes to subtract (same length as `a` or a single value)
+        tz: Timezone of naive values that are compared to aware ones
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        timedelta64 numpy array in the finest resolution of `unit` and the inputs (datetime objects have
+        microseconds, int64 in `unit` if both inputs are integer epochs), missing values are NaT
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    # the differences are computed in the finest resolution of the inputs
+    native = max((unit, _operand_unit(a, unit), _operand_unit(b, unit)), key=EPOCH_UNITS.__getitem__)
+    epochs_a, naive_a, is_int_a = _diff_operand(a, unit, native)
+    epochs_b, naive_b, is_int_b = _diff_operand(b, unit, native)
+    epochs_a, epochs_b, naive_a, naive_b = np.broadcast_arrays(epochs_a, epochs_b, naive_a, naive_b)
+    epochs_a, epochs_b = epochs_a.copy(), epochs_b.copy()
+    nat = (epochs_a == NAT) | (epochs_b == NAT)
+
+    # naive values that are compared to aware ones are localized in the given timezone
+    zone = None
+    for epochs, naive, other in ((epochs_a, naive_a, naive_b), (epochs_b, naive_b, naive_a)):
+        convert = naive & ~other & ~nat
+        if convert.any():
+            zone = zone or (find_timezone(tz) if tz is not None else current_timezone())
+            if zone is None:
+                raise ValueError(f"Invalid timezone: {tz}")
+            epochs[convert] = _local_to_utc(epochs[convert], zone, native)
+
+    result = epochs_a - epochs_b
+    result[nat] = NAT
+    return result if is_int_a and is_int_b else result.view(f"timedelta64[{native}]")
+
+
+def _operand_unit(values: Any, unit: str) -> str:
+    """Returns the resolution of one side of `time_diff_many` (`unit` for integer epochs)."""
+    if isinstance(values, (str, date)) or not hasattr(values, "__len__"):
+        values = [values]
+    if Series is not None and isinstance(values, Series) and is_datetime(values):
+        return _datetime_unit(values)
+    arr = np.asarray(values)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return _datetime_unit(arr)
+    return "us" if arr.dtype == object else unit
+
+
+def _rescale_ticks(epochs: Any, unit: str, native: str) -> Any:
+    """Converts integer epochs into the (finer) native unit of the differences."""
+    if native == unit:
+        return epochs
+    return np.where(epochs == NAT, NAT, epochs * (EPOCH_UNITS[native] // EPOCH_UNITS[unit]))
+
+
+def _local_to_utc(epochs: Any, zone: tzinfo, unit: str) -> Any:
+    """Converts wall clock epochs into UTC epochs with the offset before a DST change (as `replace(tzinfo=zone)`)."""
+    return epochs - _locate_local_times(zone, epochs, unit)[0] * EPOCH_UNITS[unit]
+
+
+def _diff_operand(values: Any, unit: str, native: str | None = None) -> tuple[Any, Any, bool]:
+    """Converts one side of `time_diff_many` into (epochs, naive mask, is integer input).
+
+    Integer epochs are given in `unit`, the resulting epochs are in `native` (defaults to `unit`).
+    """
+    native = native or unit
+    if isinstance(values, (str, date)) or not hasattr(values, "__len__"):
+        values = [values]
+    if Series is not None and isinstance(values, Series) and is_datetime(values):
+        return to_epoch_array(values, native), not _is_aware_series(values), False
+    if Series is not None and isinstance(values, Series) and values.dtype != object:
+        return _rescale_ticks(to_epoch_array(values, unit), unit, native), False, False
+
+    arr = np.asarray(values)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return to_epoch_array(arr, native), True, False
+    if arr.dtype != object:
+        return _rescale_ticks(to_epoch_array(arr, unit), unit, native), False, np.issubdtype(arr.dtype, np.number)
+
+    # object values are converted one by one (aware values through the exact datetime arithmetic)
+    ticks = EPOCH_UNITS[native]
+    epochs = np.empty(len(arr), dtype=np.int64)
+    naive = np.zeros(len(arr), dtype=bool)
+    for i, value in enumerate(arr):
+        dt = value if isinstance(value, datetime) or value is None else any_to_datetime(value)
+        if dt is None or dt != dt:
+            epochs[i] = NAT
+            continue
+        naive[i] = dt.tzinfo is None
+        delta = dt - _EPOCH if naive[i] else dt - _EPOCH_UTC
+        epochs[i] = delta // timedelta(microseconds=1) * ticks // 1_000_000
+    return epochs, naive, False
+
+
+def asof_match(
+    left: Any,
+    right: Any,
+    direction: str = "backward",
+    tolerance: str | timedelta | int | None = None,
+    allow_exact_matches: bool = True,
+    tz: str | tzinfo | None = None,
+    unit: str = "s",
+) -> Any:
+    """Matches each left timestamp to the closest right timestamp (as-of join without pandas).
+
+    Both sides are normalized to UTC epochs once (naive values are taken as local time in `tz` if they are
+    mixed with aware ones, as in `time_diff_many`) and matched by binary search over the sorted right side.
+
+    Args:
+        left: Timestamps to match (sequence, int64 or datetime64 array or pandas Series)
+        right: Timestamps to match against (need not be sorted)
+        direction: Match the last right value at or before (backward), the first at or after (forward)
+            or the closest one (nearest, ties go backward)
+        tolerance: Maximal distance of a match (step like "5min", timedelta or ticks of the unit)
+        allow_exact_matches: Whether equal timestamps match (else only strictly earlier/later ones)
+        tz: Timezone of naive values that are mixed with aware ones (the system timezone if None)
+        unit: Unit of integer epochs and tolerances (s, ms, us or ns)
+
+    Returns:
+        int64 numpy array with the position in `right` for each left value (-1 if there is no match)
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(f"Invalid direction: {direction}")
+    epochs_left, naive_left, _ = _diff_operand(left, unit)
+    epochs_right, naive_right, _ = _diff_operand(right, unit)
+    epochs_left, epochs_right = np.array(epochs_left, dtype=np.int64), np.array(epochs_right, dtype=np.int64)
+    nat_left, nat_right = epochs_left == NAT, epochs_right == NAT
+
+    # naive values are only localized if both kinds of values are mixed
+    naive_left = np.broadcast_to(naive_left, epochs_left.shape) & ~nat_left
+    naive_right = np.broadcast_to(naive_right, epochs_right.shape) & ~nat_right
+    naive_count = int(naive_left.sum() + naive_right.sum())
+    if 0 < naive_count < int((~nat_left).sum() + (~nat_right).sum()):
+        zone = find_timezone(tz) if tz is not None else current_timezone()
+        if zone is None:
+            raise ValueError(f"Invalid timezone: {tz}")
+        for epochs, naive in ((epochs_left, naive_left), (epochs_right, naive_right)):
+            if naive.any():
+                epochs[naive] = _local_to_utc(epochs[naive], zone, unit)
+
+    # missing right values never match, missing left values are not matched
+    order = np.flatnonzero(~nat_right)
+    order = order[np.argsort(epochs_right[order], kind="stable")]
+    ordered = epochs_right[order]
+    result = np.full(epochs_left.shape, -1, dtype=np.int64)
+    if len(ordered) == 0:
+        return result
+
+    candidates = []
+    if direction != "forward":
+        idx = np.searchsorted(ordered, epochs_left, side="right" if allow_exact_matches else "left") - 1
+        candidates.append((idx, idx >= 0))
+    if direction != "backward":
+        idx = np.searchsorted(ordered, epochs_left, side="left" if allow_exact_matches else "right")
+        candidates.append((idx, idx < len(ordered)))
+
+    best_idx = np.zeros(epochs_left.shape, dtype=np.int64)
+    best_dist = np.full(epochs_left.shape, np.iinfo(np.int64).max, dtype=np.int64)
+    for idx, valid in candidates:
+        idx = np.clip(idx, 0, len(ordered) - 1)
+        dist = np.abs(ordered[idx] - epochs_left)
+        better = valid & (dist < best_dist)
+        best_idx[better], best_dist[better] = idx[better], dist[better]
+
+    found = (best_dist != np.iinfo(np.int64).max) & ~nat_left
+    if tolerance is not None:
+        if isinstance(tolerance, (int, np.integer)):
+            limit = int(tolerance)
+        else:
+            limit = parse_step(tolerance) * EPOCH_UNITS[unit] // 1_000_000
+        found &= best_dist <= limit
+    result[found] = order[best_idx[found]]
+    return result
+
+
+def parse_step(freq: str | timedelta) -> int:
+    """Parses a fixed step size into microseconds.
+
+    Args:
+        freq: Step as string (e.g. "15min", "5s", "6H", "W") or timedelta
+
+    Returns:
+        Number of microseconds of the step
+    """
+    if isinstance(freq, timedelta):
+        step = freq // timedelta(microseconds=1)
+    else:
+        match = _STEP_PATTERN.match(freq.strip()) if isinstance(freq, str) else None
+        if match is None or match.group(2) not in STEP_UNITS:
+            raise ValueError(f"Invalid step size: {freq}")
+        step = int(match.group(1) or 1) * STEP_UNITS[match.group(2)]
+    if step <= 0:
+        raise ValueError(f"Step size has to be positive: {freq}")
+    return step
+
+
+def _round_ticks(values: Any, step: int, mode: str, origin: int = 0) -> Any:
+    """Rounds integer ticks (python ints or numpy arrays) to multiples of the step (counted from the origin)."""
+    shifted = values - origin
+    if mode == "floor":
+        rounded = shifted // step * step
+    elif mode == "ceil":
+        rounded = -(-shifted // step) * step
+    elif mode == "nearest":
+        rounded = (shifted + step // 2) // step * step
+    else:
+        raise ValueError(f"Invalid rounding mode: {mode}")
+    return rounded + origin
+
+
+def round_time(dt: datetime, freq: str = "D", max_out: bool = False, mode: str = "floor") -> datetime | None:
     """Rounds the given timestamp to the start or end of the day.
 
+    Fixed steps are rounded on the local wall clock time (e.g. "D" rounds to local midnight).
+
     Args:
         timestamp (datetime): Datetime that should be rounded
-        freq (str): Frequency to round it to (options are S, M, H, D, W, m, Y)
+        freq (str): Frequency to round it to (options are S, M, H, D, W, m, Y or a step like "15min", "5s", "6H")
         max_out (bool): Defines if remaining attributes should be zeroed (False) or maxed out (True)
+        mode (str): Rounding of fixed steps (floor, ceil or nearest)
 
     Returns:
         Updated datetime
@@ -120,25 +499,152 @@ def round_time(dt: datetime, freq: str = "D", max_out: bool = False) -> datetime
     if not isinstance(dt, datetime) and isinstance(dt, date) and freq in ["H", "M", "S"]:
         raise ValueError("Got a date, but frequency requires datetime")
 
-    # check for week special case
-    if freq == "W":
-        day = dt.weekday()
-        dt = dt + timedelta(days=6 - day) if max_out else dt - timedelta(days=day)
+    # fixed steps are computed on the wall clock microseconds
+    if freq not in ["m", "Y"]:
+        step = parse_step(freq)
+        origin = _WEEK_ORIGIN if step % STEP_UNITS["W"] == 0 else 0
+        wall = (dt.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1)
+        rounded = _round_ticks(wall, step, mode, origin)
+        if max_out:
+            rounded += step - 1
+        local = (_EPOCH + timedelta(microseconds=rounded)).replace(tzinfo=dt.tzinfo, fold=dt.fold)
+        if dt.tzinfo is not None and _exists(dt) and not _exists(local):
+            # a valid time rounded into a gap of the zone moves to its end (as in `round_time_many`)
+            epoch = localize_many(np.array([rounded]), dt.tzinfo, "earliest", "shift_forward", unit="us")[0]
+            return (_EPOCH_UTC + timedelta(microseconds=int(epoch))).astimezone(dt.tzinfo)
+        return local
+    if mode != "floor":
+        raise ValueError(f"Rounding mode {mode} is only supported for fixed steps")
 
     # update time to get most out of day
-    items = {"microsecond": 999999 if max_out else 0}
-    if freq not in ["S"]:
-        items["second"] = 59 if max_out else 0
-    if freq not in ["S", "M"]:
-        items["minute"] = 59 if max_out else 0
-    if freq not in ["S", "M", "H"]:
-        items["hour"] = 23 if max_out else 0
-    if freq in ["Y", "m"]:
-        day_in_month = (dt.replace(month=dt.month % 12 + 1, day=1) - timedelta(days=1)).day
-        items["day"] = day_in_month if max_out else 1
+    items = {"microsecond": 999999 if max_out else 0, "second": 59 if max_out else 0}
+    items["minute"] = 59 if max_out else 0
+    items["hour"] = 23 if max_out else 0
+    items["day"] = days_in_month(dt.year, dt.month) if max_out else 1
     if freq in ["Y"]:
         items["month"] = 12 if max_out else 1
         items["day"] = 31 if max_out else items["day"]
     dt = dt.replace(**items)  # type: ignore[arg-type]
 
     return dt
+
+
+def _exists(dt: datetime) -> bool:
+    """Checks if the wall clock time of the datetime exists in its timezone (i.e. is not in a DST gap)."""
+    if dt.tzinfo is None:
+        return True
+    return dt.astimezone(_EPOCH_UTC.tzinfo).astimezone(dt.tzinfo).replace(tzinfo=None) == dt.replace(tzinfo=None)
+
+
+def round_time_many(
+    values: Any,
+    freq: str | timedelta,
+    mode: str = "floor",
+    max_out: bool = False,
+    timezone: str | tzinfo | None = None,
+    unit: str = "s",
+) -> Any:
+    """Rounds an array of instants to fixed steps using integer arithmetic on the epochs.
+
+    With a timezone (or a timezone-aware Series) the steps are aligned to the local wall clock,
+    so "D" rounds to local midnight also across DST changes.
+
+    Args:
+        values: int64 epoch array, datetime64 array or pandas Series
+        freq: Step size (e.g. "15min", "5s", "6H", "D", "W" or a timedelta), "m" or "Y" for calendar months and years
+        mode: Rounding mode (floor, ceil or nearest)
+        max_out: If True, return the last tick of the bucket instead of its start
+        timezone: Timezone whose wall clock defines the boundaries (UTC if None)
+        unit: Unit of integer epochs and of the result (s, ms, us or ns), datetime64 values keep their resolution
+
+    Returns:
+        numpy array of rounded epochs (datetime64 if the input was datetime64, otherwise int64)
+    """
+    if mode not in ROUND_MODES:
+        raise ValueError(f"Invalid rounding mode: {mode}")
+    is_datetime64 = np.issubdtype(np.asarray(values).dtype, np.datetime64) or (
+        Series is not None and isinstance(values, Series) and is_datetime(values)
+    )
+    if is_datetime64:
+        unit = _datetime_unit(values)
+    epochs = to_epoch_array(values, unit)
+
+    nat = epochs == NAT
+    tz = _array_timezone(values, timezone) if timezone is not None or _is_aware_series(values) else None
+    if tz is None:
+        result = _round_epochs(epochs, freq, mode, max_out, unit, nat)
+    else:
+        # round on the wall clock and keep the offset of the value if it is still valid there
+        ticks = EPOCH_UNITS[unit]
+        offsets = utcoffset_many(epochs, tz, unit).astype(np.int64) * ticks
+        offsets[nat] = 0
+        wall = _round_epochs(epochs + offsets, freq, mode, max_out, unit, nat)
+        wall[nat] = NAT
+        result = wall - offsets
+        moved = utcoffset_many(result, tz, unit).astype(np.int64) * ticks != offsets
+        if moved.any():
+            result[moved] = localize_many(wall[moved], tz, ambiguous="earliest", nonexistent="shift_forward", unit=unit)
+
+    result[nat] = NAT
+    return result.view(f"datetime64[{unit}]") if is_datetime64 else result
+
+
+def _round_epochs(epochs: Any, freq: str | timedelta, mode: str, max_out: bool, unit: str, nat: Any) -> Any:
+    """Rounds (wall clock) epochs to fixed steps or to calendar months and years."""
+    ticks = EPOCH_UNITS[unit]
+    if isinstance(freq, str) and freq in ("m", "Y"):
+        return _round_calendar(epochs, freq, mode, max_out, ticks, nat)
+
+    # convert the step into ticks of the unit
+    step_us = parse_step(freq)
+    if step_us * ticks % 1_000_000 != 0:
+        raise ValueError(f"Step size {freq} is not a multiple of the unit {unit}")
+    step = step_us * ticks // 1_000_000
+    origin = _WEEK_ORIGIN * ticks // 1_000_000 if step_us % STEP_UNITS["W"] == 0 else 0
+    return _round_ticks(epochs, step, mode, origin) + (step - 1 if max_out else 0)
+
+
+def _round_calendar(epochs: Any, freq: str, mode: str, max_out: bool, ticks: int, nat: Any) -> Any:
+    """Rounds epochs to month or year boundaries using the calendar lookup tables."""
+    _, month_starts, year_starts, _ = calendar_arrays()
+    boundaries = month_starts if freq == "m" else year_starts
+    day = 86_400 * ticks
+
+    days = np.where(nat, boundaries[0], epochs // day)
+    if (days < boundaries[0]).any() or (days >= boundaries[-1]).any():
+        raise ValueError(f"Values outside of the calendar range {FIRST_YEAR}-{LAST_YEAR}")
+    idx = np.searchsorted(boundaries, days, side="right") - 1
+    start = boundaries[idx] * day
+    end = boundaries[idx + 1] * day
+
+    if mode == "floor":
+        up = np.zeros(len(epochs), dtype=bool)
+    elif mode == "ceil":
+        up = epochs != start
+    elif mode == "nearest":
+        up = epochs - start >= end - epochs
+    else:
+        raise ValueError(f"Invalid rounding mode: {mode}")
+    up &= ~nat
+    if not max_out:
+        return np.where(up, end, start)
+
+    # the last tick before the boundary that follows the rounded one
+    idx = idx + up + 1
+    if (idx >= len(boundaries)).any():
+        raise ValueError(f"Values outside of the calendar range {FIRST_YEAR}-{LAST_YEAR}")
+    return boundaries[idx] * day - 1
+
+
+def _is_aware_series(values: Any) -> bool:
+    """Checks if the values are a timezone-aware pandas Series."""
+    return Series is not None and isinstance(values, Series) and is_datetime(values) and values.dt.tz is not None
+
+
+def _datetime_unit(values: Any) -> str:
+    """Returns the epoch unit that keeps the resolution of datetime64 values (s for coarser units)."""
+    if Series is not None and isinstance(values, Series) and isinstance(values.dtype, DatetimeTZDtype):
+        unit = str(values.dtype.unit)
+    else:
+        unit = np.datetime_data(np.asarray(values).dtype)[0]
+    return unit if unit in EPOCH_UNITS else "s"
@@ -2,10 +2,31 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Any
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, tzinfo
+from itertools import islice, pairwise
+from typing import Any, TypeVar, overload
+from zoneinfo import ZoneInfo
 
-from .convert import any_to_datetime, convert_to_datetime
+from .civil import civil_from_days, days_from_civil
+from .convert import EPOCH_UNITS, NAT, Series, any_to_datetime, convert_to_datetime, to_epoch_array
+from .dst import _array_timezone, _locate_local_times, _lookup_offsets, localize_many
+from .ops import parse_step, round_time
+from .timezone import find_timezone
+
+try:
+    import numpy as np
+except Exception:
+    np = None  # type: ignore[assignment]
+
+# calendar periods of `calendar_intervals` (local days, ISO weeks, months, quarters and years)
+CALENDAR_FREQS = ("D", "W", "m", "Q", "Y")
+
+# naive start of the unix epoch
+_EPOCH = datetime(1970, 1, 1)
+_UTC = ZoneInfo("UTC")
 
 
 def time_to_interval(
@@ -32,7 +53,6 @@ def time_to_interval(
         Float value of the time position - if normalized a value between 0 and 1 (1 = last possible time) - otherwise a value in minutes
     """
     # convert to unaware
-    dt_base = convert_to_datetime(baseline, None, True) if baseline else None
     dt_uw = convert_to_datetime(dt, baseline, True)
     dt_base = baseline if baseline else dt_uw
 
@@ -62,6 +82,98 @@ def time_to_interval(
     return dt_min
 
 
+class IntervalScaler:
+    """Vectorized version of `time_to_interval` for feature transforms over large arrays.
+
+    The constants of the offset and baseline policy are computed once, `transform` then maps whole arrays
+    of timestamps with a few numpy operations (no datetime objects are created).
+    """
+
+    def __init__(
+        self,
+        offset: int | tuple[int, int] | list[int] = 12,
+        baseline: datetime | None = None,
+        zero_center: bool = True,
+        normalize: bool = True,
+        timezone: str | tzinfo | None = None,
+    ) -> None:
+        """Creates the scaler.
+
+        Args:
+            offset: Number of hours to add to both ends of the day (or a tuple for asymmetric offsets)
+            baseline: Datetime whose day is used as baseline (if None take the day of each value)
+            zero_center: Defines if the middle of the time range should be 0 centered
+            normalize: Defines if the values are scaled to the time range (otherwise minutes)
+            timezone: Timezone whose wall clock is used for array values (defaults to the timezone of an
+                aware Series, else the values are taken as wall clock time)
+        """
+        if isinstance(offset, (tuple, list)):
+            offset_start, offset_end = offset[0], offset[1]
+        else:
+            offset_start = offset_end = offset
+        self.offset = (offset_start, offset_end)
+        self.baseline = baseline
+        self.zero_center = zero_center
+        self.normalize = normalize
+        self.timezone = timezone
+
+        # minutes = wall seconds since the baseline midnight / 60 + offset start (then centered and scaled)
+        total_min = (24 + offset_start + offset_end) * 60
+        divisor = total_min if normalize else 1
+        self._scale = 1 / 60 / divisor
+        self._shift = (offset_start * 60 - (total_min / 2 if zero_center else 0)) / divisor
+        self._midnight = None
+        if baseline is not None:
+            self._midnight = _wall_ticks(baseline.replace(hour=0, minute=0, second=0, microsecond=0), 1)
+
+    def __repr__(self) -> str:
+        """Return the offset and policy of the scaler."""
+        return (
+            f"IntervalScaler(offset={self.offset}, baseline={self.baseline!r}, zero_center={self.zero_center}, "
+            f"normalize={self.normalize})"
+        )
+
+    def transform(self, values: Any, unit: str = "s") -> Any:
+        """Converts timestamps into positions along the day (see `time_to_interval`).
+
+        Args:
+            values: int64 epoch array, datetime64 array, pandas Series or sequence of datetimes
+            unit: Unit of integer epochs (s, ms, us or ns)
+
+        Returns:
+            float64 numpy array (NaN for missing values)
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        wall, nat = self._wall_seconds(values, unit)
+        midnight = wall // 86_400 * 86_400 if self._midnight is None else self._midnight
+        result = (wall - midnight) * self._scale + self._shift
+        result[nat] = np.nan
+        return result
+
+    def _wall_seconds(self, values: Any, unit: str) -> tuple[Any, Any]:
+        """Returns the wall clock time of the values as float seconds since the epoch and the missing mask."""
+        arr = values if Series is not None and isinstance(values, Series) else np.asarray(values)
+        if arr.dtype == object:
+            # datetimes are taken by their own wall clock, times are placed on the baseline day (as in
+            # `time_to_interval`)
+            anchor = self.baseline or _EPOCH
+            nat = np.array([value is None for value in arr], dtype=bool)
+            wall = np.array(
+                [0 if value is None else _wall_ticks(convert_to_datetime(value, anchor), 1_000_000) for value in arr],
+                dtype=np.int64,
+            )
+            return wall / 1_000_000, nat
+
+        epochs = to_epoch_array(arr, unit)
+        nat = epochs == NAT
+        ticks = EPOCH_UNITS[unit]
+        seconds, rest = np.divmod(np.where(nat, 0, epochs), ticks)
+        if self.timezone is not None or getattr(getattr(values, "dt", None), "tz", None) is not None:
+            seconds += _lookup_offsets(_array_timezone(values, self.timezone), epochs, unit)[0]
+        return seconds + rest / ticks, nat
+
+
 def create_intervals(
     start: Any,
     end: Any = None,
@@ -80,7 +192,441 @@ def create_intervals(
     Returns:
         List of datetime tuples (note that these are timezone aware) of start and end date
     """
-    # update the start and end dates
+    return list(iter_intervals(start, end, interval, round_days, skip))
+
+
+def iter_intervals(
+    start: Any,
+    end: Any = None,
+    interval: int | float | timedelta = 6,
+    round_days: bool = False,
+    skip: timedelta = timedelta(seconds=1),
+) -> IntervalSequence:
+    """Lazy version of `create_intervals` that computes the intervals on access.
+
+    Args:
+        start: The time to start at
+        end: The time to end at (now if None)
+        interval: Number of days for each interval (or timedelta)
+        round_days: If the time from the input should be preserved or rounded to whole days
+        skip: Intervals that are not longer than this are left out
+
+    Returns:
+        Sequence of (start, end) tuples with O(1) length, indexing and slicing
+    """
+    start_date, end_date, step = _interval_args(start, end, interval, round_days)
+    return IntervalSequence(start_date, end_date, step, _interval_indices(start_date, end_date, step, skip))
+
+
+_Intervals = TypeVar("_Intervals", bound="_LazyIntervals")
+
+
+class _LazyIntervals(Sequence[tuple[datetime, datetime]], ABC):
+    """Base of lazy interval sequences whose intervals are computed from their step numbers on access."""
+
+    indices: range
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[datetime, datetime]: ...
+
+    @overload
+    def __getitem__(self: _Intervals, index: slice) -> _Intervals: ...
+
+    def __getitem__(self: _Intervals, index: int | slice) -> tuple[datetime, datetime] | _Intervals:
+        """Return the interval at the index (or a lazy sub sequence for slices)."""
+        if isinstance(index, slice):
+            return self._with_indices(self.indices[index])
+        return self._interval(self.indices[index])
+
+    def __iter__(self) -> Iterator[tuple[datetime, datetime]]:
+        """Yield the intervals one by one."""
+        for step in self.indices:
+            yield self._interval(step)
+
+    def _with_indices(self: _Intervals, indices: range) -> _Intervals:
+        """Returns a copy of the sequence with other step numbers."""
+        copy = object.__new__(type(self))
+        copy.__dict__.update(self.__dict__, indices=indices)
+        return copy
+
+    @abstractmethod
+    def _interval(self, step: int) -> tuple[datetime, datetime]:
+        """Computes the interval of the given step number."""
+
+
+class IntervalSequence(_LazyIntervals):
+    """Lazy sequence of the intervals `[start + k * interval, start + (k + 1) * interval)` clipped at the end.
+
+    The intervals are only computed on access, so the length, indexing and slicing are O(1).
+    """
+
+    def __init__(self, start: datetime, end: datetime, interval: timedelta, indices: range) -> None:
+        """Creates the sequence.
+
+        Args:
+            start: Start of the first step
+            end: End of the range (the last interval is clipped to it)
+            interval: Length of each interval
+            indices: Numbers of the steps that belong to the sequence
+        """
+        self.start = start
+        self.end = end
+        self.interval = interval
+        self.indices = indices
+
+    def __repr__(self) -> str:
+        """Return the range and number of intervals."""
+        return f"IntervalSequence({self.start.isoformat()}, {self.end.isoformat()}, {self.interval}, n={len(self)})"
+
+    def to_arrays(self, unit: str = "s", as_datetime64: bool = True) -> tuple[Any, Any]:
+        """Computes the starts and ends of all intervals as numpy arrays.
+
+        Aware intervals are returned as UTC, naive intervals keep their wall clock time.
+
+        Args:
+            unit: Unit of the epochs (s, ms, us or ns)
+            as_datetime64: If True return datetime64 arrays, otherwise int64 epochs
+
+        Returns:
+            Tuple of the start and end arrays
+        """
+        return _step_arrays(self.start, self.end, self.indices, self.interval, self.interval, unit, as_datetime64)
+
+    def _interval(self, step: int) -> tuple[datetime, datetime]:
+        """Computes the interval of the given step number."""
+        d_start = self.start + step * self.interval
+        return d_start, min(self.end, d_start + self.interval)
+
+
+def iter_windows(
+    start: Any,
+    end: Any = None,
+    width: str | timedelta = "1H",
+    stride: str | timedelta | None = None,
+    partial: bool = False,
+) -> WindowSequence:
+    """Lazy sliding (or hopping) windows of a fixed width that start every stride.
+
+    Args:
+        start: The time to start at
+        end: The time to end at (now if None)
+        width: Length of each window (e.g. "1H", "15min" or a timedelta)
+        stride: Distance between the window starts (defaults to the width, i.e. tumbling windows)
+        partial: If True, windows that reach beyond the end are included (clipped at the end)
+
+    Returns:
+        Sequence of (start, end) tuples with O(1) length, indexing and slicing
+    """
+    start_date, end_date = _range_args(start, end)
+    width_delta = timedelta(microseconds=parse_step(width))
+    stride_delta = timedelta(microseconds=parse_step(stride)) if stride is not None else width_delta
+    indices = _window_indices(start_date, end_date, stride_delta, width_delta, partial)
+    return WindowSequence(start_date, end_date, width_delta, stride_delta, indices)
+
+
+class WindowSequence(_LazyIntervals):
+    """Lazy sequence of the windows `[start + k * stride, start + k * stride + width)` clipped at the end."""
+
+    def __init__(self, start: datetime, end: datetime, width: timedelta, stride: timedelta, indices: range) -> None:
+        """Creates the sequence.
+
+        Args:
+            start: Start of the first window
+            end: End of the range
+            width: Length of each window
+            stride: Distance between the window starts
+            indices: Numbers of the windows that belong to the sequence
+        """
+        self.start = start
+        self.end = end
+        self.width = width
+        self.stride = stride
+        self.indices = indices
+
+    def __repr__(self) -> str:
+        """Return the range, width, stride and number of windows."""
+        return (
+            f"WindowSequence({self.start.isoformat()}, {self.end.isoformat()}, {self.width}, {self.stride}, "
+            f"n={len(self)})"
+        )
+
+    def to_arrays(self, unit: str = "s", as_datetime64: bool = True) -> tuple[Any, Any]:
+        """Computes the starts and ends of all windows as numpy arrays.
+
+        Aware windows are returned as UTC, naive windows keep their wall clock time.
+
+        Args:
+            unit: Unit of the epochs (s, ms, us or ns)
+            as_datetime64: If True return datetime64 arrays, otherwise int64 epochs
+
+        Returns:
+            Tuple of the start and end arrays
+        """
+        return _step_arrays(self.start, self.end, self.indices, self.stride, self.width, unit, as_datetime64)
+
+    def _interval(self, step: int) -> tuple[datetime, datetime]:
+        """Computes the window of the given step number."""
+        d_start = self.start + step * self.stride
+        return d_start, min(self.end, d_start + self.width)
+
+
+def create_window_arrays(
+    start: Any,
+    end: Any = None,
+    width: str | timedelta = "1H",
+    stride: str | timedelta | None = None,
+    partial: bool = False,
+    unit: str = "s",
+    as_datetime64: bool = True,
+) -> tuple[Any, Any]:
+    """Columnar version of `iter_windows` that returns the starts and ends as numpy arrays.
+
+    Args:
+        start: The time to start at
+        end: The time to end at (now if None)
+        width: Length of each window (e.g. "1H", "15min" or a timedelta)
+        stride: Distance between the window starts (defaults to the width)
+        partial: If True, windows that reach beyond the end are included (clipped at the end)
+        unit: Unit of the epochs (s, ms, us or ns)
+        as_datetime64: If True return datetime64 arrays, otherwise int64 epochs
+
+    Returns:
+        Tuple of the start and end arrays (UTC for aware datetimes)
+    """
+    return iter_windows(start, end, width, stride, partial).to_arrays(unit, as_datetime64)
+
+
+def calendar_intervals(
+    start: Any,
+    end: Any = None,
+    freq: str = "D",
+    timezone: str | tzinfo | None = None,
+    clip: bool = False,
+) -> CalendarIntervals:
+    """Generates the calendar periods (local days, ISO weeks, months, quarters or years) that overlap a range.
+
+    Period boundaries are local midnights of the timezone, so days across DST changes are 23 or 25 hours long.
+    Midnights that do not exist in the zone start at the end of the gap.
+
+    Args:
+        start: The time to start at (naive values are local times of the timezone)
+        end: The time to end at (now if None)
+        freq: Calendar period (D, W, m, Q or Y)
+        timezone: Timezone of the calendar (defaults to the timezone of start, naive periods if there is none)
+        clip: If True, the first and last period are clipped to start and end
+
+    Returns:
+        Lazy sequence of (start, end) tuples with O(1) length, indexing and slicing
+    """
+    if freq not in CALENDAR_FREQS:
+        raise ValueError(f"Invalid calendar frequency: {freq}")
+    start_date, end_date = _range_args(start, end)
+
+    tz = find_timezone(timezone) if timezone is not None else start_date.tzinfo
+    if timezone is not None and tz is None:
+        raise ValueError(f"Invalid timezone: {timezone}")
+    if tz is not None:
+        start_date, end_date = (
+            dt.replace(tzinfo=tz) if dt.tzinfo is None else dt.astimezone(tz) for dt in (start_date, end_date)
+        )
+
+    # periods from the one containing the start up to the last one starting before the end
+    first = _period_number((start_date.replace(tzinfo=None) - _EPOCH).days, freq)
+    last = _period_number((end_date.replace(tzinfo=None) - _EPOCH).days, freq)
+    if _period_boundary(last, freq, tz) < end_date:
+        last += 1
+    return CalendarIntervals(freq, tz, range(first, max(last, first)), (start_date, end_date) if clip else None)
+
+
+class CalendarIntervals(_LazyIntervals):
+    """Lazy sequence of calendar periods between local midnights (see `calendar_intervals`)."""
+
+    def __init__(
+        self, freq: str, tz: tzinfo | None, indices: range, bounds: tuple[datetime, datetime] | None = None
+    ) -> None:
+        """Creates the sequence.
+
+        Args:
+            freq: Calendar period (D, W, m, Q or Y)
+            tz: Timezone of the calendar (None for naive periods)
+            indices: Numbers of the periods (counted from the period containing 1970-01-01)
+            bounds: Start and end to clip the intervals to
+        """
+        self.freq = freq
+        self.tz = tz
+        self.indices = indices
+        self.bounds = bounds
+
+    def __repr__(self) -> str:
+        """Return the frequency, zone and number of intervals."""
+        return f"CalendarIntervals({self.freq}, {self.tz}, n={len(self)})"
+
+    def to_arrays(self, unit: str = "s", as_datetime64: bool = True) -> tuple[Any, Any]:
+        """Computes the starts and ends of all intervals as numpy arrays.
+
+        Aware intervals are returned as UTC, naive intervals keep their wall clock time.
+
+        Args:
+            unit: Unit of the epochs (s, ms, us or ns)
+            as_datetime64: If True return datetime64 arrays, otherwise int64 epochs
+
+        Returns:
+            Tuple of the start and end arrays
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        if unit not in EPOCH_UNITS:
+            raise ValueError(f"Invalid epoch unit: {unit}")
+        ticks = EPOCH_UNITS[unit]
+
+        numbers = np.arange(self.indices.start, self.indices.stop, self.indices.step, dtype=np.int64)
+        starts = _period_start(numbers, self.freq) * 86_400 * ticks
+        ends = _period_start(numbers + 1, self.freq) * 86_400 * ticks
+        if self.tz is not None:
+            starts = localize_many(starts, self.tz, ambiguous="earliest", nonexistent="shift_forward", unit=unit)
+            ends = localize_many(ends, self.tz, ambiguous="earliest", nonexistent="shift_forward", unit=unit)
+        if self.bounds is not None:
+            starts = np.maximum(starts, _epoch_ticks(self.bounds[0], ticks))
+            ends = np.minimum(ends, _epoch_ticks(self.bounds[1], ticks))
+
+        if as_datetime64:
+            return starts.view(f"datetime64[{unit}]"), ends.view(f"datetime64[{unit}]")
+        return starts, ends
+
+    def _interval(self, step: int) -> tuple[datetime, datetime]:
+        """Computes the period with the given number."""
+        d_start, d_end = _period_boundary(step, self.freq, self.tz), _period_boundary(step + 1, self.freq, self.tz)
+        if self.bounds is not None:
+            d_start, d_end = max(d_start, self.bounds[0]), min(d_end, self.bounds[1])
+        return d_start, d_end
+
+
+def _period_boundary(number: int, freq: str, tz: tzinfo | None) -> datetime:
+    """Returns the local midnight at which the calendar period with the given number starts."""
+    wall = _EPOCH + timedelta(days=int(_period_start(number, freq)))
+    if tz is None:
+        return wall
+    local = wall.replace(tzinfo=tz)
+    if local.astimezone(_UTC).astimezone(tz).replace(tzinfo=None) == wall:
+        return local
+    # the midnight falls into a gap of the zone
+    epoch = localize_many(np.array([_wall_ticks(wall, 1)]), tz, "earliest", "shift_forward")[0]
+    return datetime.fromtimestamp(int(epoch), tz)
+
+
+def _period_number(day: int, freq: str) -> int:
+    """Returns the number of the calendar period that contains the day (days since the unix epoch)."""
+    if freq == "D":
+        return day
+    if freq == "W":
+        # ISO weeks start on monday (1969-12-29 is the monday before the epoch)
+        return (day + 3) // 7
+    year, month, _ = civil_from_days(day)
+    months = (year - 1970) * 12 + month - 1
+    if freq == "m":
+        return int(months)
+    return int(months // 3 if freq == "Q" else year - 1970)
+
+
+def _period_start(number: Any, freq: str) -> Any:
+    """Returns the first day (days since the unix epoch) of calendar periods (ints or numpy arrays)."""
+    if freq == "D":
+        return number
+    if freq == "W":
+        return number * 7 - 3
+    months = number * 3 if freq == "Q" else number * 12 if freq == "Y" else number
+    return days_from_civil(1970 + months // 12, months % 12 + 1, 1)
+
+
+def create_interval_arrays(
+    start: Any,
+    end: Any = None,
+    interval: int | float | timedelta = 6,
+    round_days: bool = False,
+    skip: timedelta = timedelta(seconds=1),
+    unit: str = "s",
+    as_datetime64: bool = True,
+) -> tuple[Any, Any]:
+    """Columnar version of `create_intervals` that returns the starts and ends as numpy arrays.
+
+    Args:
+        start: The time to start at
+        end: The time to end at (now if None)
+        interval: Number of days for each interval (or timedelta)
+        round_days: If the time from the input should be preserved or rounded to whole days
+        skip: Intervals that are not longer than this are left out
+        unit: Unit of the epochs (s, ms, us or ns)
+        as_datetime64: If True return datetime64 arrays, otherwise int64 epochs
+
+    Returns:
+        Tuple of the start and end arrays (UTC for aware datetimes)
+    """
+    return iter_intervals(start, end, interval, round_days, skip).to_arrays(unit, as_datetime64)
+
+
+def _step_arrays(
+    start: datetime,
+    end: datetime,
+    indices: range,
+    stride: timedelta,
+    width: timedelta,
+    unit: str,
+    as_datetime64: bool,
+) -> tuple[Any, Any]:
+    """Computes the intervals `[start + k * stride, start + k * stride + width)` of the steps as arrays."""
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if unit not in EPOCH_UNITS:
+        raise ValueError(f"Invalid epoch unit: {unit}")
+    ticks = EPOCH_UNITS[unit]
+    for delta in (stride, width):
+        if delta // timedelta(microseconds=1) * ticks % 1_000_000 != 0:
+            raise ValueError(f"Interval {delta} is not a multiple of the unit {unit}")
+
+    # step along the wall clock (as the datetime arithmetic does) and clip at the end
+    steps = np.arange(indices.start, indices.stop, indices.step, dtype=np.int64)
+    starts = _wall_ticks(start, ticks) + steps * (stride // timedelta(microseconds=1) * ticks // 1_000_000)
+    ends = starts + width // timedelta(microseconds=1) * ticks // 1_000_000
+    if start.tzinfo is not None:
+        starts, ends = _local_to_utc(start, starts, unit), _local_to_utc(start, ends, unit)
+    ends = np.minimum(ends, _epoch_ticks(end, ticks))
+
+    if as_datetime64:
+        return starts.view(f"datetime64[{unit}]"), ends.view(f"datetime64[{unit}]")
+    return starts, ends
+
+
+def _wall_ticks(dt: datetime, ticks: int) -> int:
+    """Returns the wall clock time of a datetime as epoch in the given ticks per second."""
+    return (dt.replace(tzinfo=None) - _EPOCH) // timedelta(microseconds=1) * ticks // 1_000_000
+
+
+def _epoch_ticks(dt: datetime, ticks: int) -> int:
+    """Returns the epoch of a datetime (UTC for aware, wall clock for naive datetimes) in the given ticks."""
+    epoch = _wall_ticks(dt, ticks)
+    offset = dt.utcoffset()
+    if offset is not None:
+        epoch -= offset // timedelta(microseconds=1) * ticks // 1_000_000
+    return epoch
+
+
+def _local_to_utc(reference: datetime, wall: Any, unit: str) -> Any:
+    """Converts wall clock epochs in the timezone of the reference into UTC (as aware datetime arithmetic does)."""
+    tz = reference.tzinfo
+    ticks = EPOCH_UNITS[unit]
+    offset = reference.utcoffset()
+    if offset is None or tz is None or hasattr(tz, "normalize"):
+        # fixed offsets (pytz keeps the offset of the reference on arithmetic)
+        return wall - (offset or timedelta(0)) // timedelta(microseconds=1) * ticks // 1_000_000
+    return wall - _locate_local_times(tz, wall, unit)[0] * ticks
+
+
+def _range_args(start: Any, end: Any) -> tuple[datetime, datetime]:
+    """Parses the start and end of a range (end defaults to now)."""
     start_date = any_to_datetime(start)
     if start_date is None:
         raise ValueError("Failed to parse start date")
@@ -92,7 +638,14 @@ def create_intervals(
         if parsed_end is None:
             raise ValueError("Failed to parse end date")
         end_date = parsed_end
+    return start_date, end_date
+
 
+def _interval_args(
+    start: Any, end: Any, interval: int | float | timedelta, round_days: bool
+) -> tuple[datetime, datetime, timedelta]:
+    """Parses the arguments of `create_intervals`."""
+    start_date, end_date = _range_args(start, end)
     if round_days:
         start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
@@ -103,17 +656,350 @@ def create_intervals(
             interval = timedelta(days=interval)
         else:
             raise ValueError("Invalid interval passed")
+    if interval <= timedelta(0):
+        raise ValueError("Interval has to be positive")
+
+    return start_date, end_date, interval
+
+
+def _interval_indices(start: datetime, end: datetime, interval: timedelta, skip: timedelta) -> range:
+    """Computes the step numbers of the intervals that start before the end and are longer than skip."""
+    if not start < end:
+        return range(0)
+
+    # number of steps that start before the end (corrected for wall clock arithmetic of aware datetimes)
+    count = max(-(-(end - start) // interval), 1)
+    while count > 1 and not start + (count - 1) * interval < end:
+        count -= 1
+    while start + count * interval < end:
+        count += 1
+
+    # all full intervals have the same length, so only the clipped last one can be skipped
+    if interval <= skip:
+        return range(0)
+    last_start = start + (count - 1) * interval
+    if min(end, last_start + interval) - last_start <= skip:
+        count -= 1
+    return range(count)
+
+
+def _window_indices(start: datetime, end: datetime, stride: timedelta, width: timedelta, partial: bool) -> range:
+    """Computes the numbers of the windows that start before the end (and end before it unless partial)."""
+    if not start < end:
+        return range(0)
+    reach = timedelta(0) if partial else width
+
+    # corrected for wall clock arithmetic of aware datetimes (as in `_interval_indices`)
+    count = max((end - start - reach) // stride + 1, 0)
+    while count > 0 and not _window_fits(start + (count - 1) * stride, end, width, partial):
+        count -= 1
+    while _window_fits(start + count * stride, end, width, partial):
+        count += 1
+    return range(count)
+
+
+def _window_fits(window_start: datetime, end: datetime, width: timedelta, partial: bool) -> bool:
+    """Checks if a window belongs to the range."""
+    return window_start < end if partial else window_start + width <= end
+
+
+class BucketAggregator:
+    """One-pass aggregation of (timestamp, value) pairs into the buckets of a set of intervals.
+
+    Count, sum, min and max are accumulated in arrays that are preallocated per bucket, so the memory
+    stays O(buckets) independent of the number of events. Events do not need to be sorted.
+    """
+
+    def __init__(self, intervals: Any, unit: str = "s") -> None:
+        """Creates the aggregator.
+
+        Args:
+            intervals: Output of `create_intervals`, a lazy interval sequence (`iter_intervals`,
+                `calendar_intervals`) or a tuple of start and end arrays
+            unit: Unit of integer epochs (s, ms, us or ns)
+        """
+        if np is None:
+            raise ImportError("Numpy Library is not installed")
+        from .intervals import IntervalIndex
+
+        self.index = IntervalIndex.from_intervals(intervals, unit)
+        self.unit = unit
+        size = len(self.index)
+        self.count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros(size, dtype=np.float64)
+        self.min = np.full(size, np.inf)
+        self.max = np.full(size, -np.inf)
+        self.dropped = 0
+
+    @classmethod
+    def from_step(
+        cls, start: Any, end: Any, step: str | timedelta, skip: timedelta = timedelta(0), unit: str = "s"
+    ) -> BucketAggregator:
+        """Creates an aggregator over fixed steps between start and end.
+
+        Args:
+            start: The time to start at
+            end: The time to end at
+            step: Step size (e.g. "15min", "H" or a timedelta)
+            skip: Intervals that are not longer than this are left out
+            unit: Unit of integer epochs (s, ms, us or ns)
+
+        Returns:
+            Aggregator over the steps
+        """
+        interval = timedelta(microseconds=parse_step(step))
+        return cls(iter_intervals(start, end, interval, skip=skip), unit)
+
+    def add(self, timestamps: Any, values: Any = None) -> None:
+        """Adds a chunk of events.
+
+        Args:
+            timestamps: int64 epoch array, datetime64 array, pandas Series or sequence of datetimes
+            values: Values of the events (only counted if None)
+
+        Raises:
+            TypeError: If naive and aware datetimes are mixed between the events and the intervals
+        """
+        epochs = _event_epochs(timestamps, self.unit, self.index.aware)
+        idx = self.index.locate_many(epochs)
+        inside = idx >= 0
+        self.dropped += int(inside.size - inside.sum())
+        idx = idx[inside]
+        size = len(self.count)
+        self.count += np.bincount(idx, minlength=size)
+        if values is None:
+            return
+
+        weights = np.asarray(values, dtype=np.float64)[inside]
+        self.sum += np.bincount(idx, weights=weights, minlength=size)
+        np.minimum.at(self.min, idx, weights)
+        np.maximum.at(self.max, idx, weights)
+
+    def update(self, pairs: Iterable[tuple[Any, Any]], chunk_size: int = 65_536) -> BucketAggregator:
+        """Consumes an iterator of (timestamp, value) pairs in chunks.
+
+        Args:
+            pairs: Iterable of (timestamp, value) tuples (e.g. a generator over a large file)
+            chunk_size: Number of events that are converted at once
+
+        Returns:
+            The aggregator itself
+        """
+        iterator = iter(pairs)
+        while chunk := list(islice(iterator, chunk_size)):
+            timestamps, values = zip(*chunk, strict=True)
+            self.add(timestamps, values)
+        return self
+
+    def result(self) -> dict[str, Any]:
+        """Returns the aggregates per bucket.
+
+        Returns:
+            Dictionary of the bucket starts and ends (epochs) and the count, sum, min, max and mean arrays
+            (min, max and mean are NaN for empty buckets)
+        """
+        empty = self.count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(empty, np.nan, self.sum / self.count)
+        order = np.argsort(self.index._order)
+        return {
+            "start": self.index.starts[order],
+            "end": self.index.ends[order],
+            "count": self.count.copy(),
+            "sum": self.sum.copy(),
+            "min": np.where(empty, np.nan, self.min),
+            "max": np.where(empty, np.nan, self.max),
+            "mean": mean,
+        }
+
+
+def _event_epochs(timestamps: Any, unit: str, aware: bool | None = None) -> Any:
+    """Converts event timestamps (epoch/datetime64 arrays or sequences of datetimes) into epochs.
+
+    Datetimes have to match the awareness of the intervals (if known).
+    """
+    from .intervals import _awareness, _check_awareness, _to_epoch
+
+    if Series is not None and isinstance(timestamps, Series):
+        _check_awareness(aware, _awareness(timestamps))
+        return to_epoch_array(timestamps, unit)
+    arr = np.asarray(timestamps)
+    if arr.dtype.kind not in "OUS":
+        return to_epoch_array(arr, unit)
+
+    ticks = EPOCH_UNITS[unit]
+    return np.array([NAT if value is None else _to_epoch(value, unit, ticks, aware) for value in arr], dtype=np.int64)
+
+
+def bucket_aggregate(
+    pairs: Iterable[tuple[Any, Any]], intervals: Any, unit: str = "s", chunk_size: int = 65_536
+) -> dict[str, Any]:
+    """Aggregates a stream of (timestamp, value) pairs per interval in one pass (see `BucketAggregator`).
+
+    Args:
+        pairs: Iterable of (timestamp, value) tuples
+        intervals: Output of `create_intervals`, a lazy interval sequence or a tuple of start and end arrays
+        unit: Unit of integer epochs (s, ms, us or ns)
+        chunk_size: Number of events that are converted at once
+
+    Returns:
+        Dictionary of the bucket starts and ends and the count, sum, min, max and mean arrays
+    """
+    return BucketAggregator(intervals, unit).update(pairs, chunk_size).result()
+
+
+def partition_range(
+    start: Any,
+    end: Any,
+    parts: int,
+    density: Any = None,
+    align: str | timedelta | None = None,
+    unit: str = "s",
+) -> list[tuple[datetime, datetime]]:
+    """Splits `[start, end)` into contiguous sub ranges of roughly equal work (e.g. for parallel backfills).
+
+    The work is distributed by the cumulative density along the range, cut points are placed at its
+    quantiles and snapped to the alignment with `round_time` (nearest for fixed steps, floor for m and Y).
+    Cut points that collapse after snapping are merged, so fewer ranges may be returned.
+
+    Args:
+        start: The time to start at
+        end: The time to end at
+        parts: Number of sub ranges (e.g. workers)
+        density: Work estimate as sample of timestamps (array or sequence) or histogram tuple of
+            `(edges, weights)` with one more edge than weights (uniform if None)
+        align: Frequency to snap cut points to (e.g. "H", "D", "15min" or a timedelta)
+        unit: Unit of integer epochs in the density (s, ms, us or ns)
+
+    Returns:
+        List of (start, end) datetime tuples
+    """
+    if np is None:
+        raise ImportError("Numpy Library is not installed")
+    if parts < 1:
+        raise ValueError("Number of parts has to be positive")
+    start_date, end_date = _range_args(start, end)
+    low, high = _epoch_ticks(start_date, 1_000_000), _epoch_ticks(end_date, 1_000_000)
+    aware = start_date.tzinfo is not None
+    if high <= low:
+        raise ValueError("End has to be after start")
+
+    targets = np.arange(1, parts) / parts
+    cuts = low + (high - low) * targets
+    if isinstance(density, tuple) and len(density) == 2 and len(density[0]) == len(density[1]) + 1:
+        edges = _micros(_event_epochs(density[0], unit, aware), unit).astype(np.float64)
+        weights = np.asarray(density[1], dtype=np.float64)
+        if (weights < 0).any() or (np.diff(edges) < 0).any():
+            raise ValueError("Histogram needs sorted edges and non-negative weights")
+        cumulative = np.concatenate([[0.0], np.cumsum(weights)])
+        first, last = np.interp([low, high], edges, cumulative)
+        if last > first:
+            cuts = np.interp(first + (last - first) * targets, cumulative, edges)
+    elif density is not None:
+        sample = _micros(_event_epochs(density, unit, aware), unit)
+        sample = sample[(sample >= low) & (sample < high)]
+        if len(sample) > 0:
+            cuts = np.quantile(sample, targets)
+
+    # snap the cut points and drop the ones that collapse or leave the range
+    origin = _EPOCH.replace(tzinfo=_UTC) if start_date.tzinfo is not None else _EPOCH
+    bounds = [start_date]
+    for cut in np.clip(np.round(cuts), low, high).astype(np.int64).tolist():
+        boundary = origin + timedelta(microseconds=cut)
+        if start_date.tzinfo is not None:
+            boundary = boundary.astimezone(start_date.tzinfo)
+        if align is not None:
+            mode = "floor" if align in ("m", "Y") else "nearest"
+            boundary = round_time(boundary, align, mode=mode)  # type: ignore[arg-type,assignment]
+        if _epoch_ticks(bounds[-1], 1_000_000) < _epoch_ticks(boundary, 1_000_000) < high:
+            bounds.append(boundary)
+    bounds.append(end_date)
+    return list(pairwise(bounds))
+
+
+def _micros(epochs: Any, unit: str) -> Any:
+    """Converts epochs of a unit into microseconds."""
+    if unit == "ns":
+        return epochs // 1_000
+    return epochs * (1_000_000 // EPOCH_UNITS[unit])
+
+
+def iter_window_aggregates(
+    pairs: Iterable[tuple[Any, Any]], windows: Sequence[tuple[datetime, datetime]], unit: str = "s"
+) -> Iterator[tuple[datetime, datetime, int, float, float, float]]:
+    """Aggregates a time sorted stream of (timestamp, value) pairs over sliding windows in one pass.
+
+    The accumulators are updated incrementally: events are added when they enter the current window
+    and evicted when the window start moves past them (min and max through monotonic queues), so each
+    event is touched a constant number of times and only the events of one window are kept in memory.
+
+    Args:
+        pairs: Iterable of (timestamp, value) tuples sorted by time
+        windows: Windows with increasing starts and ends (e.g. output of `iter_windows`)
+        unit: Unit of integer epochs (s, ms, us or ns)
+
+    Returns:
+        Iterator of (window start, window end, count, sum, min, max) per window (min and max NaN if empty)
+
+    Raises:
+        TypeError: If naive and aware datetimes are mixed between the events and the windows
+    """
+    from .intervals import _to_epoch
+
+    ticks = EPOCH_UNITS[unit]
+    bounds = ((start, end, _epoch_ticks(start, ticks), _epoch_ticks(end, ticks)) for start, end in windows)
+    current = next(bounds, None)
+    events: deque[tuple[int, float]] = deque()
+    lows: deque[tuple[int, float]] = deque()
+    highs: deque[tuple[int, float]] = deque()
+    total = 0.0
+    previous = None
+
+    def emit(window: tuple[datetime, datetime, int, int]) -> tuple[datetime, datetime, int, float, float, float]:
+        """Returns the aggregates of the window."""
+        low = lows[0][1] if lows else float("nan")
+        high = highs[0][1] if highs else float("nan")
+        return window[0], window[1], len(events), total, low, high
+
+    def evict(window_start: int) -> None:
+        """Removes the events before the start of the window."""
+        nonlocal total
+        while events and events[0][0] < window_start:
+            total -= events.popleft()[1]
+        for queue in (lows, highs):
+            while queue and queue[0][0] < window_start:
+                queue.popleft()
+
+    aware = current[0].tzinfo is not None if current is not None else None
+    for timestamp, value in pairs:
+        epoch = _to_epoch(timestamp, unit, ticks, aware)
+        if previous is not None and epoch < previous:
+            raise ValueError("Events have to be sorted by time")
+        previous = epoch
 
-    # convert to range
-    date_range: list[tuple[datetime, datetime]] = []
-    d_start: datetime = start_date
-    while d_start < end_date:
-        # update new item
-        d_end = min(end_date, d_start + interval)
-        if d_end - d_start > skip:
-            date_range.append((d_start, d_end))
+        # close all windows that end before the event
+        while current is not None and epoch >= current[3]:
+            yield emit(current)
+            current = next(bounds, None)
+            if current is not None:
+                evict(current[2])
+        if current is None:
+            break
+        if epoch < current[2]:
+            continue
 
-        # update the time
-        d_start = d_start + interval
+        value = float(value)
+        events.append((epoch, value))
+        total += value
+        while lows and lows[-1][1] >= value:
+            lows.pop()
+        lows.append((epoch, value))
+        while highs and highs[-1][1] <= value:
+            highs.pop()
+        highs.append((epoch, value))
 
-    return date_range
+    while current is not None:
+        yield emit(current)
+        current = next(bounds, None)
+        if current is not None:
+            evict(current[2])
@@ -0,0 +1,205 @@
+"""Reader for compiled TZif zone files (RFC 8536).
+
+This exposes the raw transition instants of a zone (from the system tz database or the `tzdata` package)
+and the POSIX TZ rule from the file footer that describes all transitions after the end of the table.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+from datetime import date, tzinfo
+from functools import lru_cache
+from importlib import resources
+from pathlib import Path
+from typing import NamedTuple
+from zoneinfo import TZPATH
+
+# ordinal of the unix epoch (1970-01-01)
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# supported range of transition instants (years 1 to 9999)
+MIN_INSTANT = (date(1, 1, 2).toordinal() - EPOCH_ORDINAL) * 86400
+MAX_INSTANT = (date(9999, 12, 31).toordinal() - EPOCH_ORDINAL) * 86400
+
+_HEADER = struct.Struct(">4sc15x6l")
+
+
+class PosixRule(NamedTuple):
+    """Parsed POSIX TZ rule (e.g. `CET-1CEST,M3.5.0,M10.5.0/3`).
+
+    Offsets are in seconds east of UTC, rule times in seconds after local midnight.
+    """
+
+    std_offset: int
+    dst_offset: int | None = None
+    start: tuple[str, int, int, int] | None = None
+    start_time: int = 7200
+    end: tuple[str, int, int, int] | None = None
+    end_time: int = 7200
+
+    def transitions(self, year: int) -> list[int]:
+        """Computes the sorted UTC instants at which the rule switches in the given year."""
+        if self.dst_offset is None or self.start is None or self.end is None:
+            return []
+        start = _rule_day(self.start, year) + self.start_time - self.std_offset
+        end = _rule_day(self.end, year) + self.end_time - self.dst_offset
+        return sorted((start, end))
+
+
+class TZifData(NamedTuple):
+    """Transition data of a compiled zone file."""
+
+    transitions: tuple[int, ...]
+    rule: PosixRule | None
+
+
+def _rule_day(spec: tuple[str, int, int, int], year: int) -> int:
+    """Returns the local midnight (in seconds since the epoch) of the day described by a rule date."""
+    kind, a, b, c = spec
+    if kind == "M":
+        # month a, week b (5 = last), weekday c (0 = sunday)
+        first = date(year, a, 1)
+        day = 1 + (c - (first.weekday() + 1) % 7) % 7 + (b - 1) * 7
+        next_month = date(year + a // 12, a % 12 + 1, 1)
+        while day > (next_month - first).days:
+            day -= 7
+        ordinal = first.toordinal() + day - 1
+    elif kind == "J":
+        # julian day (1-365), february 29th is never counted
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        ordinal = date(year, 1, 1).toordinal() + a - 1 + (1 if leap and a >= 60 else 0)
+    else:
+        # zero-based day of the year (0-365)
+        ordinal = date(year, 1, 1).toordinal() + a
+    return (ordinal - EPOCH_ORDINAL) * 86400
+
+
+_NAME = r"(?:<[^>]*>|[A-Za-z]{3,})"
+_OFFSET = r"[+-]?\d{1,3}(?::\d{1,2}){0,2}"
+_POSIX_RE = re.compile(
+    rf"^(?P<std>{_NAME})(?P<stdoff>{_OFFSET})"
+    rf"(?:(?P<dst>{_NAME})(?P<dstoff>{_OFFSET})?"
+    rf"(?:,(?P<start>[^,/]+)(?:/(?P<starttime>{_OFFSET}))?,(?P<end>[^,/]+)(?:/(?P<endtime>{_OFFSET}))?)?)?$"
+)
+
+
+def _parse_seconds(value: str) -> int:
+    """Parses a `[+-]hh[:mm[:ss]]` string into seconds."""
+    sign = -1 if value.startswith("-") else 1
+    parts = [int(part) for part in value.lstrip("+-").split(":")]
+    parts += [0] * (3 - len(parts))
+    return sign * (parts[0] * 3600 + parts[1] * 60 + parts[2])
+
+
+def _parse_rule_date(value: str) -> tuple[str, int, int, int]:
+    """Parses a POSIX rule date (`Mm.w.d`, `Jn` or `n`)."""
+    if value.startswith("M"):
+        month, week, weekday = (int(part) for part in value[1:].split("."))
+        return ("M", month, week, weekday)
+    if value.startswith("J"):
+        return ("J", int(value[1:]), 0, 0)
+    return ("N", int(value), 0, 0)
+
+
+def parse_posix_rule(value: str) -> PosixRule | None:
+    """Parses a POSIX TZ string as found in the footer of TZif files.
+
+    Args:
+        value: TZ string (e.g. `EST5EDT,M3.2.0,M11.1.0`)
+
+    Returns:
+        Parsed rule or None if the string is empty or not supported
+    """
+    match = _POSIX_RE.match(value.strip())
+    if match is None:
+        return None
+
+    # POSIX offsets count west of UTC
+    std_offset = -_parse_seconds(match.group("stdoff"))
+    if match.group("dst") is None:
+        return PosixRule(std_offset)
+    dst_offset = -_parse_seconds(match.group("dstoff")) if match.group("dstoff") else std_offset + 3600
+    if match.group("start") is None:
+        return PosixRule(std_offset, dst_offset)
+
+    start_time = match.group("starttime")
+    end_time = match.group("endtime")
+    return PosixRule(
+        std_offset,
+        dst_offset,
+        _parse_rule_date(match.group("start")),
+        _parse_seconds(start_time) if start_time else 7200,
+        _parse_rule_date(match.group("end")),
+        _parse_seconds(end_time) if end_time else 7200,
+    )
+
+
+def read_tzif(data: bytes) -> TZifData:
+    """Parses the content of a TZif file.
+
+    Args:
+        data: Raw bytes of the file
+
+    Returns:
+        Transition instants (UTC seconds) and the footer rule
+    """
+    magic, version, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("Invalid TZif data")
+
+    # skip the legacy 32-bit block if a 64-bit block follows
+    time_size, offset = 4, _HEADER.size
+    if version >= b"2":
+        offset += timecnt * 5 + typecnt * 6 + charcnt + leapcnt * 8 + isstdcnt + isutcnt
+        _, _, isutcnt, isstdcnt, leapcnt, timecnt, typecnt, charcnt = _HEADER.unpack_from(data, offset)
+        time_size, offset = 8, offset + _HEADER.size
+
+    transitions = struct.unpack_from(f">{timecnt}{'q' if time_size == 8 else 'l'}", data, offset)
+    transitions = tuple(ts for ts in transitions if MIN_INSTANT <= ts <= MAX_INSTANT)
+
+    rule = None
+    if time_size == 8:
+        offset += timecnt * 9 + typecnt * 6 + charcnt + leapcnt * 12 + isstdcnt + isutcnt
+        footer = data[offset:].strip(b"\n").decode("ascii", errors="ignore")
+        rule = parse_posix_rule(footer) if footer else None
+
+    return TZifData(transitions, rule)
+
+
+def _read_zone_file(key: str) -> bytes | None:
+    """Looks up the zone file in the same locations as `zoneinfo` does."""
+    for root in TZPATH:
+        path = Path(root) / key
+        if path.is_file():
+            return path.read_bytes()
+
+    components = key.split("/")
+    try:
+        package = ".".join(["tzdata.zoneinfo", *components[:-1]])
+        return resources.files(package).joinpath(components[-1]).read_bytes()
+    except (ImportError, OSError, UnicodeEncodeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def load_tzif(tz: tzinfo) -> TZifData | None:
+    """Loads the transition data for the given timezone.
+
+    Args:
+        tz: Timezone object (ZoneInfo or pytz timezone)
+
+    Returns:
+        Parsed data or None if the zone is not backed by a zone file
+    """
+    key = getattr(tz, "key", None) or getattr(tz, "zone", None)
+    if not isinstance(key, str) or ".." in key or key.startswith("/"):
+        return None
+
+    data = _read_zone_file(key)
+    if data is None:
+        return None
+    try:
+        return read_tzif(data)
+    except (ValueError, struct.error):
+        return None
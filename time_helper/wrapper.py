@@ -5,14 +5,17 @@ This makes many of the functions first class citizens and can easily expose the
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any
 
-from .convert import any_to_datetime, localize_datetime, make_aware, make_unaware
+from .convert import EPOCH_UNITS, any_to_datetime, localize_datetime, make_aware, make_unaware
 from .ops import round_time, time_diff
+from .timezone import find_timezone
 
-if TYPE_CHECKING:
-    from datetime import tzinfo
+# start of the unix epoch (naive and UTC) for lazy wrappers
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 class DateTimeWrapper:
@@ -22,16 +25,73 @@ class DateTimeWrapper:
     allowing method chaining and easier manipulation of datetime objects.
     """
 
+    # no instance dict (wrappers are kept in large numbers), `_epoch` holds the epoch of a lazy datetime,
+    # `_tz` the timezone and `_key` the sort key (microseconds since the epoch, UTC for aware datetimes)
+    __slots__ = ("_dt", "_epoch", "_key", "_tz")
+    _dt: datetime | None
+    _epoch: int | None
+    _key: int | None
+    _tz: tzinfo | None
+
     def __init__(self, dt: Any) -> None:
         """Initialize wrapper with datetime-like object.
 
         Args:
             dt: Any datetime-like object (string, datetime, date, timestamp, or another wrapper)
         """
-        if isinstance(dt, DateTimeWrapper):
-            self.dt: datetime | None = dt.dt
-        else:
-            self.dt = any_to_datetime(dt)
+        self.dt = dt.dt if isinstance(dt, DateTimeWrapper) else any_to_datetime(dt)
+
+    @classmethod
+    def from_epoch(cls, epoch: int, tz: str | tzinfo | None = None, unit: str = "s") -> DateTimeWrapper:
+        """Create a wrapper from an epoch that only builds the datetime on first access.
+
+        Args:
+            epoch: Integer epoch (UTC)
+            tz: Timezone of the datetime (naive UTC if None)
+            unit: Unit of the epoch (s, ms, us or ns)
+
+        Returns:
+            New DateTimeWrapper
+        """
+        if unit not in EPOCH_UNITS:
+            raise ValueError(f"Invalid epoch unit: {unit}")
+        zone = find_timezone(tz) if isinstance(tz, str) else tz
+        if isinstance(tz, str) and zone is None:
+            raise ValueError(f"Invalid timezone: {tz}")
+
+        wrapper = cls.__new__(cls)
+        wrapper._dt = None
+        wrapper._epoch = wrapper._key = int(epoch) * 1_000_000 // EPOCH_UNITS[unit]
+        wrapper._tz = zone
+        return wrapper
+
+    @property
+    def dt(self) -> datetime | None:
+        """Get the wrapped datetime (built on first access for lazy wrappers)."""
+        if self._epoch is not None:
+            delta = timedelta(microseconds=self._epoch)
+            self._dt = _EPOCH + delta if self._tz is None else (_EPOCH_UTC + delta).astimezone(self._tz)
+            self._epoch = None
+        return self._dt
+
+    @dt.setter
+    def dt(self, value: datetime | None) -> None:
+        """Set the wrapped datetime."""
+        self._dt = value
+        self._epoch = None
+        self._tz = value.tzinfo if value is not None else None
+        self._key = None
+
+    @property
+    def sort_key(self) -> int | None:
+        """Get the normalized sort key (microseconds since the epoch, UTC for aware datetimes).
+
+        The key is computed once and cached. Sorting by it (e.g. `sorted(wrappers, key=attrgetter("sort_key"))`)
+        compares plain integers.
+        """
+        if self._key is None and self._dt is not None:
+            self._key = _sort_key(self._dt)
+        return self._key
 
     def __call__(self, *args: Any, **kwds: Any) -> datetime | None:
         """Return the wrapped datetime object."""
@@ -64,12 +124,37 @@ class DateTimeWrapper:
             raise ValueError("Cannot compute time diff with None datetime")
         return time_diff(self.dt, other.dt)
 
-    # Comparison operators
+    # Comparison operators (on the sort keys, datetimes are compared without creating a wrapper)
+    def _keys(self, other: Any) -> tuple[int | None, int | None]:
+        """Return the sort keys of both operands."""
+        if isinstance(other, datetime):
+            other_key: int | None = _sort_key(other)
+            other_aware = other.tzinfo is not None
+        else:
+            if not isinstance(other, DateTimeWrapper):
+                other = DateTimeWrapper(other)
+            other_key = other.sort_key
+            other_aware = other._tz is not None
+        key = self.sort_key
+        if key is not None and other_key is not None and (self._tz is not None) != other_aware:
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+        return key, other_key
+
+    def __hash__(self) -> int:
+        """Hash consistent with equality (and with the hash of an equal datetime)."""
+        key = self.sort_key
+        if key is None:
+            return hash(None)
+        epoch = _EPOCH if self._tz is None else _EPOCH_UTC
+        return hash(epoch + timedelta(microseconds=key))
+
     def __eq__(self, other: Any) -> bool:
-        """Check equality with another datetime-like object."""
-        if not isinstance(other, DateTimeWrapper):
-            other = DateTimeWrapper(other)
-        return bool(self.dt == other.dt)
+        """Check equality with another datetime-like object (aware values are compared as instants)."""
+        try:
+            key, other_key = self._keys(other)
+        except TypeError:
+            return False
+        return key == other_key
 
     def __ne__(self, other: Any) -> bool:
         """Check inequality with another datetime-like object."""
@@ -77,27 +162,33 @@ class DateTimeWrapper:
 
     def __lt__(self, other: Any) -> bool:
         """Check if less than another datetime-like object."""
-        if not isinstance(other, DateTimeWrapper):
-            other = DateTimeWrapper(other)
-        if self.dt is None or other.dt is None:
-            return False
-        return bool(self.dt < other.dt)
+        # fast path for sorting and heaps of wrappers
+        if type(other) is DateTimeWrapper and (self._tz is None) is (other._tz is None):
+            key = self._key if self._key is not None else self.sort_key
+            other_key = other._key if other._key is not None else other.sort_key
+            if key is not None and other_key is not None:
+                return key < other_key
+        key, other_key = self._keys(other)
+        return key is not None and other_key is not None and key < other_key
 
     def __le__(self, other: Any) -> bool:
         """Check if less than or equal to another datetime-like object."""
-        return self.__lt__(other) or self.__eq__(other)
+        key, other_key = self._keys(other)
+        if key is None or other_key is None:
+            return key is other_key
+        return key <= other_key
 
     def __gt__(self, other: Any) -> bool:
         """Check if greater than another datetime-like object."""
-        if not isinstance(other, DateTimeWrapper):
-            other = DateTimeWrapper(other)
-        if self.dt is None or other.dt is None:
-            return False
-        return bool(self.dt > other.dt)
+        key, other_key = self._keys(other)
+        return key is not None and other_key is not None and key > other_key
 
     def __ge__(self, other: Any) -> bool:
         """Check if greater than or equal to another datetime-like object."""
-        return self.__gt__(other) or self.__eq__(other)
+        key, other_key = self._keys(other)
+        if key is None or other_key is None:
+            return key is other_key
+        return key >= other_key
 
     # String representations
     def __str__(self) -> str:
@@ -156,19 +247,20 @@ class DateTimeWrapper:
         return DateTimeWrapper(localized_dt)
 
     # Time operations
-    def round(self, freq: str = "D", max_out: bool = False) -> DateTimeWrapper:
+    def round(self, freq: str = "D", max_out: bool = False, mode: str = "floor") -> DateTimeWrapper:
         """Round datetime to specified frequency.
 
         Args:
-            freq: Frequency to round to (S, M, H, D, W, m, Y)
+            freq: Frequency to round to (S, M, H, D, W, m, Y or a step like "15min")
             max_out: If True, round to end of period instead of start
+            mode: Rounding of fixed steps (floor, ceil or nearest)
 
         Returns:
             New DateTimeWrapper with rounded datetime
         """
         if self.dt is None:
             return DateTimeWrapper(None)
-        rounded_dt = round_time(self.dt, freq, max_out)
+        rounded_dt = round_time(self.dt, freq, max_out, mode)
         return DateTimeWrapper(rounded_dt)
 
     # Conversion methods
@@ -253,3 +345,10 @@ class DateTimeWrapper:
         if self.dt is None:
             raise AttributeError("Cannot access timezone of None datetime")
         return self.dt.tzinfo
+
+
+def _sort_key(dt: datetime) -> int:
+    """Returns the microseconds since the unix epoch (UTC for aware, wall clock for naive datetimes)."""
+    if dt.tzinfo is None:
+        return (dt - _EPOCH) // _MICROSECOND
+    return (dt - _EPOCH_UTC) // _MICROSECOND